@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+CSV Input Parity Tests
+
+STEP 2 (industry_filter) and STEP 3 (enrich_companies) read their input
+with pyarrow when it is installed and with csv.reader / pandas' C engine
+otherwise; both paths must accept the same files and give the same rows.
+
+Usage:
+    python -m pytest csv_input_test.py
+"""
+
+import pytest
+
+import enrich_companies
+import industry_filter
+
+# The second data row is short two fields; it must be kept and padded
+RAGGED_CSV = (
+    'company_name,domain,company_blurb,source_url\n'
+    'Acme Signs,acme.com,vinyl wraps,https://expo.example/exhibitors\n'
+    'Short Co,short.com\n'
+    'Widget Co,widget.com,sign widgets,https://expo.example/exhibitors\n'
+)
+
+
+@pytest.fixture(params=['pyarrow', 'csv'])
+def backend(request, monkeypatch):
+    """Run a test once with pyarrow and once with the fallback parser."""
+    if request.param == 'csv':
+        monkeypatch.setattr(industry_filter, 'pa_csv', None)
+        monkeypatch.setattr(enrich_companies, 'pyarrow', None)
+    elif industry_filter.pa_csv is None:
+        pytest.skip('pyarrow not installed')
+    return request.param
+
+
+@pytest.fixture
+def ragged_csv(tmp_path):
+    path = tmp_path / 'ragged.csv'
+    path.write_text(RAGGED_CSV, encoding='utf-8')
+    return str(path)
+
+
+def test_input_rows_pad_short_rows(backend, ragged_csv):
+    assert list(industry_filter._iter_input_rows(ragged_csv)) == [
+        ('Acme Signs', 'acme.com', 'vinyl wraps', 'https://expo.example/exhibitors'),
+        ('Short Co', 'short.com', '', ''),
+        ('Widget Co', 'widget.com', 'sign widgets', 'https://expo.example/exhibitors'),
+    ]
+
+
+def test_input_rows_resume_after_bad_batch(backend, tmp_path, monkeypatch):
+    # Small blocks, so pyarrow fails after several batches were already yielded
+    monkeypatch.setattr(industry_filter, 'CSV_BLOCK_SIZE', 4096)
+    path = tmp_path / 'long.csv'
+    lines = ['company_name,domain,company_blurb,source_url']
+    lines += [f'Co {i},co{i}.com' if i == 900 else f'Co {i},co{i}.com,blurb {i},src' for i in range(1000)]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    rows = list(industry_filter._iter_input_rows(str(path)))
+
+    assert [row[0] for row in rows] == [f'Co {i}' for i in range(1000)]
+    assert rows[900] == ('Co 900', 'co900.com', '', '')
+
+
+def test_classify_counts_short_rows(backend, ragged_csv, tmp_path):
+    stats = industry_filter.classify(ragged_csv, str(tmp_path / 'out.csv'))
+
+    assert stats['total'] == 3
+
+
+def test_enrich_input_pads_short_rows(backend, ragged_csv):
+    df = enrich_companies._read_input_csv(ragged_csv)
+
+    assert list(df['company_name']) == ['Acme Signs', 'Short Co', 'Widget Co']
+    assert df['company_blurb'].isna().tolist() == [False, True, False]
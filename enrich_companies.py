@@ -22,13 +22,33 @@ Requirements:
 
 import os
 import csv
+import hashlib
 import json
 import re
+import sqlite3
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List, Tuple
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding/decoding (pip install orjson)
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:  # Optional: multithreaded CSV parsing for pandas (pip install pyarrow)
+    pyarrow = None
+
+try:
+    import httpx
+except ImportError:  # Optional: HTTP/2 Serper client (pip install "httpx[http2]")
+    httpx = None
 
 # Configure logging
 logging.basicConfig(
@@ -40,6 +60,50 @@ logger = logging.getLogger(__name__)
 # Serper API endpoint
 SERPER_API_BASE = 'https://google.serper.dev/search'
 
+# Transport errors retried by the Serper helpers (requests, plus httpx when installed)
+HTTP_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# JSON codec for cached Serper responses (orjson when installed)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _read_input_csv(input_file: str) -> pd.DataFrame:
+    """
+    Read an input CSV with pandas, using the pyarrow engine when installed.
+    
+    pyarrow rejects rows with missing fields, which the C engine pads with
+    NaN, so such files are re-read with the C engine.
+    """
+    if pyarrow is not None:
+        try:
+            return pd.read_csv(input_file, engine='pyarrow')
+        except pd.errors.ParserError as e:
+            logger.warning(f"pyarrow could not parse {input_file} ({e}); using the C parser")
+    return pd.read_csv(input_file, engine='c')
+
+
+# Companies enriched concurrently (Serper calls still share one rate limit)
+ENRICH_CONCURRENCY = 10
+
+# Output CSV columns (order of the enriched row dicts) and rows per pandas write
+ENRICHED_COLUMNS = [
+    'company_name', 'domain', 'company_blurb', 'source_url', 'fit_bucket', 'industry_guess',
+    'score', 'evidence_snippet', 'employee_range', 'employee_source', 'employee_confidence',
+    'revenue_range', 'revenue_source', 'revenue_confidence', 'decision_makers',
+    'decision_makers_source', 'decision_makers_confidence', 'error_note'
+]
+OUTPUT_CHUNK_SIZE = 100
+
+# progress_callback fires every 8 companies (and on the last one)
+PROGRESS_MASK = 7
+
 # Employee range patterns
 EMPLOYEE_RANGES = [
     '5000+',
@@ -76,11 +140,15 @@ DECISION_MAKER_TITLES = [
 class CompanyEnricher:
     """Enriches company data using Serper API."""
     
-    def __init__(self, api_key: Optional[str] = None, cache_file: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_file: Optional[str] = None,
+                 max_workers: int = ENRICH_CONCURRENCY, verbose: bool = False):
         self.api_key = api_key
-        self.cache_file = cache_file or 'outputs/cache_serper.json'
+        self.verbose = verbose  # Log full tracebacks for per-company errors
+        self.cache_file = cache_file or 'outputs/cache_serper.db'
+        self._cache_lock = threading.Lock()
         self.cache = self._load_cache()
-        self.session = requests.Session()
+        self.max_workers = max(1, max_workers)
+        self.session = self._create_session()
         if api_key:
             self.session.headers.update({
                 'X-API-KEY': api_key,
@@ -91,50 +159,130 @@ class CompanyEnricher:
             'employee_ranges_found': 0,
             'revenue_ranges_found': 0,
             'decision_makers_found': 0,
-            'serper_calls': 0,
+            'serper_calls': 0,  # HTTP requests (a batch counts once)
+            'serper_queries': 0,  # Queries answered by the API
             'cache_hits': 0
         }
-        self.rate_limit_delay = 0.5  # Seconds between API calls
+        self.rate_limit_delay = 0.5  # Seconds between API calls (shared by all workers)
         self.max_retries = 3
+        self._stats_lock = threading.Lock()
+        self._rate_lock = threading.Lock()
+        self._next_call_at = 0.0
+        self._prefetched = threading.local()  # Per-worker first-pass batch results
     
-    def _load_cache(self) -> Dict:
-        """Load cache from file."""
-        if os.path.exists(self.cache_file):
+    def _create_session(self):
+        """
+        Create the HTTP client shared by all Serper calls.
+        
+        Prefers an HTTP/2 httpx client (concurrent workers multiplex over one
+        connection); falls back to a pooled requests.Session when httpx or its
+        h2 extra isn't installed. Both expose the post()/headers API used here.
+        """
+        if httpx is not None:
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+                return httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=self.max_workers,
+                                        max_keepalive_connections=self.max_workers)
+                )
+            except ImportError:
+                pass  # h2 not installed
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        session.mount('https://', adapter)
+        return session
     
-    def _save_cache(self):
-        """Save cache to file."""
+    def _bump_stat(self, key: str, amount: int = 1):
+        """Increment a stats counter (safe to call from worker threads)."""
+        with self._stats_lock:
+            self.stats[key] += amount
+    
+    def _throttle(self):
+        """Space Serper calls at least rate_limit_delay apart across all workers."""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait_time = self._next_call_at - now
+            self._next_call_at = max(now, self._next_call_at) + self.rate_limit_delay
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    def _load_cache(self) -> sqlite3.Connection:
+        """Open (or create) the SQLite cache database in WAL mode.
+        
+        Lookups hit the database directly, so nothing is loaded up front and
+        each result is persisted as soon as it is fetched. A legacy JSON cache
+        next to the database (same name, ``.json`` suffix) is imported once.
+        """
         os.makedirs(os.path.dirname(self.cache_file) if os.path.dirname(self.cache_file) else '.', exist_ok=True)
+        conn = sqlite3.connect(self.cache_file, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, ts INTEGER)')
+        self._import_legacy_cache(conn)
+        return conn
+    
+    def _import_legacy_cache(self, conn: sqlite3.Connection):
+        """Copy entries from an old cache_serper.json into an empty database."""
+        legacy_file = os.path.splitext(self.cache_file)[0] + '.json'
+        if legacy_file == self.cache_file or not os.path.exists(legacy_file):
+            return
+        if conn.execute('SELECT 1 FROM cache LIMIT 1').fetchone():
+            return
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2)
-        except Exception as e:
-            logger.warning(f"Failed to save cache: {e}")
+            with open(legacy_file, 'rb') as f:
+                legacy = _json_loads(f.read())
+        except Exception:
+            return
+        now = int(time.time())
+        with conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)',
+                ((self._get_cache_key(query), _json_dumps(result), now) for query, result in legacy.items())
+            )
+        logger.info(f"Imported {len(legacy)} cached queries from {legacy_file}")
+    
+    def _save_cache(self):
+        """Close the cache database (entries are written as they are cached)."""
+        with self._cache_lock:
+            try:
+                self.cache.close()
+            except Exception as e:
+                logger.warning(f"Failed to close cache: {e}")
     
     def _get_cache_key(self, query: str) -> str:
         """Generate cache key from query."""
-        return query.lower().strip()
+        return hashlib.sha256(query.lower().strip().encode('utf-8')).hexdigest()
     
     def _get_from_cache(self, query: str) -> Optional[Dict]:
         """Get result from cache."""
         key = self._get_cache_key(query)
-        if key in self.cache:
-            self.stats['cache_hits'] += 1
-            return self.cache[key]
+        with self._cache_lock:
+            row = self.cache.execute('SELECT value FROM cache WHERE key=?', (key,)).fetchone()
+        if row is not None:
+            self._bump_stat('cache_hits')
+            return _json_loads(row[0])
         return None
     
     def _save_to_cache(self, query: str, result: Dict):
         """Save result to cache."""
         key = self._get_cache_key(query)
-        self.cache[key] = result
+        value = _json_dumps(result)
+        try:
+            with self._cache_lock:
+                self.cache.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)',
+                    (key, value, int(time.time()))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to save cache entry: {e}")
     
     def search_serper(self, query: str, num_results: int = 10) -> Optional[Dict]:
         """Search using Serper API with caching and retries."""
+        # Results already fetched by this worker's batch prefetch
+        prefetched = getattr(self._prefetched, 'results', None)
+        if prefetched and query in prefetched:
+            return prefetched.pop(query)
+        
         # Check cache first
         cached = self._get_from_cache(query)
         if cached:
@@ -144,7 +292,7 @@ class CompanyEnricher:
             return None
         
         # Rate limiting
-        time.sleep(self.rate_limit_delay)
+        self._throttle()
         
         # Retry logic
         for attempt in range(self.max_retries):
@@ -159,9 +307,10 @@ class CompanyEnricher:
                 
                 # Save to cache
                 self._save_to_cache(query, result)
-                self.stats['serper_calls'] += 1
+                self._bump_stat('serper_calls')
+                self._bump_stat('serper_queries')
                 return result
-            except requests.exceptions.RequestException as e:
+            except HTTP_ERRORS as e:
                 if attempt < self.max_retries - 1:
                     wait_time = (attempt + 1) * 2  # Exponential backoff
                     logger.debug(f"Serper search failed (attempt {attempt + 1}/{self.max_retries}), retrying in {wait_time}s: {e}")
@@ -175,6 +324,72 @@ class CompanyEnricher:
         
         return None
     
+    def search_serper_batch(self, queries: List[str], num_results: int = 10) -> List[Optional[Dict]]:
+        """
+        Search several queries in one Serper request (the endpoint accepts a
+        JSON array of queries and answers with an array in the same order).
+        
+        Cached queries are served from the cache; only the rest are sent.
+        
+        Returns:
+            List of results aligned with queries (None where a query failed)
+        """
+        results = [self._get_from_cache(query) or None for query in queries]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing or not self.api_key:
+            return results
+        
+        payload = [{'q': queries[i], 'num': num_results} for i in missing]
+        
+        # Rate limiting (one slot per HTTP request)
+        self._throttle()
+        
+        for attempt in range(self.max_retries):
+            try:
+                response = self.session.post(SERPER_API_BASE, json=payload, timeout=30)
+                response.raise_for_status()
+                batch_results = response.json()
+                if not isinstance(batch_results, list) or len(batch_results) != len(payload):
+                    logger.debug(f"Unexpected Serper batch response for {len(payload)} queries")
+                    return results
+                
+                self._bump_stat('serper_calls')
+                self._bump_stat('serper_queries', len(payload))
+                for i, result in zip(missing, batch_results):
+                    if isinstance(result, dict):
+                        self._save_to_cache(queries[i], result)
+                        results[i] = result
+                return results
+            except HTTP_ERRORS as e:
+                if attempt < self.max_retries - 1:
+                    wait_time = (attempt + 1) * 2  # Exponential backoff
+                    logger.debug(f"Serper batch failed (attempt {attempt + 1}/{self.max_retries}), retrying in {wait_time}s: {e}")
+                    time.sleep(wait_time)
+                else:
+                    logger.debug(f"Serper batch failed for {len(payload)} queries: {e}")
+            except Exception as e:
+                logger.debug(f"Unexpected error in Serper batch search: {e}")
+                break
+        
+        return results
+    
+    def _prefetch_first_pass(self, company_name: str, company_domain: Optional[str] = None):
+        """
+        Fetch the first query of each lookup (employees, revenue, decision
+        makers) in a single batched request. The per-field lookups then take
+        these results without another round trip; later passes still search
+        one query at a time, only when the first pass wasn't conclusive.
+        """
+        queries = [
+            self._employee_queries(company_name, company_domain)[0],
+            self._revenue_queries(company_name, company_domain)[0],
+            self._decision_maker_queries(company_name, DECISION_MAKER_TITLES[0], company_domain)[0],
+        ]
+        results = self.search_serper_batch(queries, num_results=5)
+        self._prefetched.results = {
+            query: result for query, result in zip(queries, results) if result is not None
+        }
+    
     def normalize_employee_range(self, text: str) -> Optional[str]:
         """
         Normalize employee count text into standard ranges.
@@ -253,6 +468,16 @@ class CompanyEnricher:
         
         return None
     
+    def _employee_queries(self, company_name: str, company_domain: Optional[str] = None) -> List[str]:
+        """Employee-range queries, in the order they are tried."""
+        domain_part = f" {company_domain}" if company_domain else ""
+        return [
+            f'site:linkedin.com/company "{company_name}"{domain_part}',
+            f'"{company_name}"{domain_part} about team employees',
+            f'"{company_name}"{domain_part} revenue employees',
+            f'"{company_name}"{domain_part} company size'
+        ]
+    
     def get_employee_range_with_confidence(self, company_name: str, company_domain: Optional[str] = None) -> Tuple[Optional[str], Optional[str], float]:
         """
         Get employee range using multi-pass query strategy.
@@ -261,17 +486,8 @@ class CompanyEnricher:
         if not self.api_key:
             return (None, None, 0.0)
         
-        domain_part = f" {company_domain}" if company_domain else ""
-        
         # Multi-pass queries (stop when confident)
-        queries = [
-            f'site:linkedin.com/company "{company_name}"{domain_part}',
-            f'"{company_name}"{domain_part} about team employees',
-            f'"{company_name}"{domain_part} revenue employees',
-            f'"{company_name}"{domain_part} company size'
-        ]
-        
-        for query in queries:
+        for query in self._employee_queries(company_name, company_domain):
             results = self.search_serper(query, num_results=5)
             
             if not results or 'organic' not in results:
@@ -295,9 +511,6 @@ class CompanyEnricher:
                     employee_range = self.normalize_employee_range(f"{title} {snippet}")
                     if employee_range and confidence >= 0.6:
                         return (employee_range, link, confidence)
-            
-            # Small delay between queries
-            time.sleep(self.rate_limit_delay)
         
         return (None, None, 0.0)
     
@@ -336,28 +549,29 @@ class CompanyEnricher:
         
         return None
     
-    def get_revenue_range_with_confidence(self, company_name: str, company_domain: Optional[str] = None) -> Tuple[Optional[str], Optional[str], float]:
-        """
-        Get revenue range using multi-pass query strategy.
-        Returns: (revenue_range, source_url, confidence)
-        """
-        if not self.api_key:
-            return (None, None, 0.0)
-        
+    def _revenue_queries(self, company_name: str, company_domain: Optional[str] = None) -> List[str]:
+        """Revenue-range queries, in the order they are tried."""
         domain_part = f" {company_domain}" if company_domain else ""
-        
-        # Multi-pass queries (stop when confident)
         queries = [
             f'"{company_name}"{domain_part} annual revenue',
             f'"{company_name}"{domain_part} revenue',
             f'"{company_name}"{domain_part} company revenue',
             f'"{company_name}"{domain_part} revenue employees'
         ]
-        
         if company_domain:
             queries.insert(0, f'site:{company_domain} revenue')
+        return queries
+    
+    def get_revenue_range_with_confidence(self, company_name: str, company_domain: Optional[str] = None) -> Tuple[Optional[str], Optional[str], float]:
+        """
+        Get revenue range using multi-pass query strategy.
+        Returns: (revenue_range, source_url, confidence)
+        """
+        if not self.api_key:
+            return (None, None, 0.0)
         
-        for query in queries:
+        # Multi-pass queries (stop when confident)
+        for query in self._revenue_queries(company_name, company_domain):
             results = self.search_serper(query, num_results=5)
             
             if not results or 'organic' not in results:
@@ -379,9 +593,6 @@ class CompanyEnricher:
                     revenue_range = self.normalize_revenue_range(f"{title} {snippet}")
                     if revenue_range and confidence >= 0.6:
                         return (revenue_range, link, confidence)
-            
-            # Small delay between queries
-            time.sleep(self.rate_limit_delay)
         
         return (None, None, 0.0)
     
@@ -481,12 +692,18 @@ class CompanyEnricher:
                             logger.debug(f"Found decision maker for {company_name}: {name} - {job_title}")
                             if len(decision_makers) >= 3:  # Limit to 3 decision makers
                                 return decision_makers
-            
-            # Small delay between queries
-            time.sleep(self.rate_limit_delay)
         
         return decision_makers
     
+    def _decision_maker_queries(self, company_name: str, title_keyword: str,
+                                company_domain: Optional[str] = None) -> List[str]:
+        """Decision-maker queries for one title, in the order they are tried."""
+        domain_part = f" {company_domain}" if company_domain else ""
+        return [
+            f'"{company_name}" "{title_keyword}" LinkedIn{domain_part}',
+            f'"{company_name}" {title_keyword}{domain_part}',
+        ]
+    
     def get_decision_makers_with_confidence(self, company_name: str, company_domain: Optional[str] = None) -> Tuple[List[Dict], Optional[str], float]:
         """
         Get decision makers using multi-pass query strategy.
@@ -499,16 +716,9 @@ class CompanyEnricher:
         if not self.api_key:
             return ([], None, 0.0)
         
-        domain_part = f" {company_domain}" if company_domain else ""
-        
         # Search for decision makers with priority titles (up to 3)
         for title_keyword in DECISION_MAKER_TITLES[:3]:
-            queries = [
-                f'"{company_name}" "{title_keyword}" LinkedIn{domain_part}',
-                f'"{company_name}" {title_keyword}{domain_part}',
-            ]
-            
-            for query in queries:
+            for query in self._decision_maker_queries(company_name, title_keyword, company_domain):
                 results = self.search_serper(query, num_results=5)
                 
                 if not results or 'organic' not in results:
@@ -546,8 +756,6 @@ class CompanyEnricher:
                                 
                                 if len(decision_makers) >= 3:  # Limit to 3
                                     return (decision_makers, best_source, best_confidence)
-                
-                time.sleep(self.rate_limit_delay)
         
         return (decision_makers, best_source, best_confidence) if decision_makers else ([], None, 0.0)
     
@@ -573,6 +781,10 @@ class CompanyEnricher:
         if not self.api_key:
             error_note = 'API key missing'
         
+        # First pass of every lookup in one batched Serper request
+        if self.api_key:
+            self._prefetch_first_pass(company_name, company_domain)
+        
         # Get employee range with confidence
         employee_range, employee_source, employee_confidence = (None, None, 0.0)
         if self.api_key:
@@ -580,8 +792,7 @@ class CompanyEnricher:
                 company_name, company_domain
             )
             if employee_range:
-                self.stats['employee_ranges_found'] += 1
-            time.sleep(self.rate_limit_delay)
+                self._bump_stat('employee_ranges_found')
         
         # Get revenue range with confidence
         revenue_range, revenue_source, revenue_confidence = (None, None, 0.0)
@@ -590,8 +801,7 @@ class CompanyEnricher:
                 company_name, company_domain
             )
             if revenue_range:
-                self.stats['revenue_ranges_found'] += 1
-            time.sleep(self.rate_limit_delay)
+                self._bump_stat('revenue_ranges_found')
         
         # Get decision makers with confidence
         decision_makers, decision_makers_source, decision_makers_confidence = ([], None, 0.0)
@@ -600,10 +810,7 @@ class CompanyEnricher:
                 company_name, company_domain
             )
             if decision_makers:
-                self.stats['decision_makers_found'] += len(decision_makers)
-        
-        # Small delay between companies
-        time.sleep(self.rate_limit_delay)
+                self._bump_stat('decision_makers_found', len(decision_makers))
         
         # Build enriched row in pipeline format with detailed schema
         enriched_row = {
@@ -627,9 +834,113 @@ class CompanyEnricher:
             'error_note': error_note
         }
         
-        self.stats['companies_processed'] += 1
+        self._bump_stat('companies_processed')
         return enriched_row
     
+    def _enrich_company_failsoft(self, row: Dict) -> Dict:
+        """Enrich a company row, returning empty enrichment fields on error."""
+        try:
+            return self.enrich_company(row)
+        except Exception as e:
+            company_name = str(row.get('company_name', 'Unknown'))
+            logger.error(f"Error processing {company_name}: {type(e).__name__}: {e}", exc_info=self.verbose)
+            # Add row with empty enrichment fields (fail-soft)
+            domain_val = row.get('domain', '') or row.get('matched_domain', '') or row.get('company_domain', '')
+            company_domain = str(domain_val).strip() if pd.notna(domain_val) and domain_val else ''
+            return {
+                'company_name': company_name,
+                'domain': company_domain,
+                'company_blurb': row.get('company_blurb', ''),
+                'source_url': row.get('source_url', ''),
+                'fit_bucket': row.get('fit_bucket', 'YES'),
+                'industry_guess': row.get('industry_guess', ''),
+                'score': row.get('score', '0'),
+                'evidence_snippet': row.get('evidence_snippet', ''),
+                'employee_range': '',
+                'employee_source': '',
+                'employee_confidence': '',
+                'revenue_range': '',
+                'revenue_source': '',
+                'revenue_confidence': '',
+                'decision_makers': '[]',
+                'decision_makers_source': '',
+                'decision_makers_confidence': '',
+                'error_note': 'API key missing' if not self.api_key else ''
+            }
+    
+    def _iter_unenriched_rows(self, df):
+        """Yield output rows with empty enrichment fields (no API key)."""
+        for idx, row in df.iterrows():
+            company_name = str(row.get('company_name', ''))
+            domain_val = row.get('domain', '') or row.get('matched_domain', '') or row.get('company_domain', '')
+            company_domain = str(domain_val).strip() if pd.notna(domain_val) and domain_val else ''
+            
+            # Preserve fit_bucket if available, otherwise use fit_yes_no
+            fit_bucket = row.get('fit_bucket', '')
+            if not fit_bucket and 'fit_yes_no' in row:
+                fit_bucket = row.get('fit_yes_no', 'YES')
+            
+            yield {
+                'company_name': company_name,
+                'domain': company_domain,
+                'company_blurb': row.get('company_blurb', ''),
+                'source_url': row.get('source_url', ''),
+                'fit_bucket': fit_bucket,
+                'industry_guess': row.get('industry_guess', ''),
+                'score': row.get('score', '0'),
+                'evidence_snippet': row.get('evidence_snippet', ''),
+                'employee_range': '',
+                'employee_source': '',
+                'employee_confidence': '',
+                'revenue_range': '',
+                'revenue_source': '',
+                'revenue_confidence': '',
+                'decision_makers': '[]',
+                'decision_makers_source': '',
+                'decision_makers_confidence': '',
+                'error_note': 'API key missing'
+            }
+            # IMPORTANT: Count this as processed
+            self.stats['companies_processed'] += 1
+    
+    def _iter_enriched_rows(self, df, progress_callback=None):
+        """Enrich companies concurrently, yielding rows in input order."""
+        rows = [row.to_dict() for _, row in df.iterrows()]
+        total = len(rows)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for i, enriched_row in enumerate(executor.map(self._enrich_company_failsoft, rows), 1):
+                if progress_callback:
+                    if (i & PROGRESS_MASK) == 0 or i == total:
+                        progress_callback(i, total)
+                else:
+                    logger.info(f"[{i}/{total}] Processed: {enriched_row.get('company_name', 'Unknown')}")
+                yield enriched_row
+    
+    def _write_output(self, output_file: str, rows):
+        """
+        Write enriched rows to CSV in chunks as they arrive (pandas formatting).
+        
+        Rows go to <output_file>.tmp, which replaces output_file only once every
+        row is written, so an interrupted run leaves no partial output behind.
+        """
+        os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
+        tmp_file = f"{output_file}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8', newline='') as f:
+                pd.DataFrame(columns=ENRICHED_COLUMNS).to_csv(f, index=False)
+                chunk = []
+                for row in rows:
+                    chunk.append(row)
+                    if len(chunk) >= OUTPUT_CHUNK_SIZE:
+                        pd.DataFrame(chunk, columns=ENRICHED_COLUMNS).to_csv(f, index=False, header=False)
+                        chunk = []
+                if chunk:
+                    pd.DataFrame(chunk, columns=ENRICHED_COLUMNS).to_csv(f, index=False, header=False)
+            os.replace(tmp_file, output_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+    
     def enrich_csv(self, input_file: str, output_file: str, progress_callback=None, include_maybe: bool = True):
         """
         Enrich all companies in the input CSV file.
@@ -639,7 +950,7 @@ class CompanyEnricher:
         
         # Read input CSV
         try:
-            df = pd.read_csv(input_file)
+            df = _read_input_csv(input_file)
         except Exception as e:
             raise Exception(f"Failed to read input file: {e}")
         
@@ -689,93 +1000,22 @@ class CompanyEnricher:
             logger.warning("SERPER_API_KEY not set - enrichment will be skipped")
             logger.warning("Writing output with empty enrichment fields and error_note='API key missing'")
             # Still write output with empty enrichment fields
-            enriched_rows = []
-            for idx, row in df.iterrows():
-                company_name = str(row.get('company_name', ''))
-                domain_val = row.get('domain', '') or row.get('matched_domain', '') or row.get('company_domain', '')
-                company_domain = str(domain_val).strip() if pd.notna(domain_val) and domain_val else ''
-                
-                # Preserve fit_bucket if available, otherwise use fit_yes_no
-                fit_bucket = row.get('fit_bucket', '')
-                if not fit_bucket and 'fit_yes_no' in row:
-                    fit_bucket = row.get('fit_yes_no', 'YES')
-                
-                enriched_rows.append({
-                    'company_name': company_name,
-                    'domain': company_domain,
-                    'company_blurb': row.get('company_blurb', ''),
-                    'source_url': row.get('source_url', ''),
-                    'fit_bucket': fit_bucket,
-                    'industry_guess': row.get('industry_guess', ''),
-                    'score': row.get('score', '0'),
-                    'evidence_snippet': row.get('evidence_snippet', ''),
-                    'employee_range': '',
-                    'employee_source': '',
-                    'employee_confidence': '',
-                    'revenue_range': '',
-                    'revenue_source': '',
-                    'revenue_confidence': '',
-                    'decision_makers': '[]',
-                    'decision_makers_source': '',
-                    'decision_makers_confidence': '',
-                    'error_note': 'API key missing'
-                })
-                # IMPORTANT: Count this as processed
-                self.stats['companies_processed'] += 1
+            enriched_rows = self._iter_unenriched_rows(df)
         else:
-            # Process each company
-            enriched_rows = []
-            total = len(df)
-            for idx, row in df.iterrows():
-                company_name = str(row.get('company_name', 'Unknown'))
-                
-                if progress_callback:
-                    progress_callback(idx + 1, total)
-                else:
-                    logger.info(f"[{idx + 1}/{total}] Processing: {company_name}")
-                
-                try:
-                    enriched_row = self.enrich_company(row.to_dict())
-                    enriched_rows.append(enriched_row)
-                except Exception as e:
-                    logger.error(f"Error processing {company_name}: {e}")
-                    # Add row with empty enrichment fields (fail-soft)
-                    domain_val = row.get('domain', '') or row.get('matched_domain', '') or row.get('company_domain', '')
-                    company_domain = str(domain_val).strip() if pd.notna(domain_val) and domain_val else ''
-                    enriched_rows.append({
-                        'company_name': company_name,
-                        'domain': company_domain,
-                        'company_blurb': row.get('company_blurb', ''),
-                        'source_url': row.get('source_url', ''),
-                        'fit_bucket': row.get('fit_bucket', 'YES'),
-                        'industry_guess': row.get('industry_guess', ''),
-                        'score': row.get('score', '0'),
-                        'evidence_snippet': row.get('evidence_snippet', ''),
-                        'employee_range': '',
-                        'employee_source': '',
-                        'employee_confidence': '',
-                        'revenue_range': '',
-                        'revenue_source': '',
-                        'revenue_confidence': '',
-                        'decision_makers': '[]',
-                        'decision_makers_source': '',
-                        'decision_makers_confidence': '',
-                        'error_note': 'API key missing' if not self.api_key else ''
-                    })
-        
-        # Save cache
-        self._save_cache()
+            enriched_rows = self._iter_enriched_rows(df, progress_callback)
         
-        # Write output CSV
+        # Write output CSV as rows are produced
         logger.info(f"Writing output file: {output_file}")
-        os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
-        output_df = pd.DataFrame(enriched_rows)
-        output_df.to_csv(output_file, index=False)
+        self._write_output(output_file, enriched_rows)
+        
+        # Close cache
+        self._save_cache()
         
         # Ensure stats are complete
         final_stats = {
             'companies_processed': self.stats['companies_processed'],
             'serper_calls': self.stats.get('serper_calls', 0),
+            'serper_queries': self.stats.get('serper_queries', 0),
             'cache_hits': self.stats.get('cache_hits', 0),
             'employee_ranges_found': self.stats.get('employee_ranges_found', 0),
             'revenue_ranges_found': self.stats.get('revenue_ranges_found', 0),
@@ -791,7 +1031,7 @@ class CompanyEnricher:
         logger.info(f"Revenue ranges found: {final_stats['revenue_ranges_found']}")
         logger.info(f"Decision makers identified: {final_stats['decision_makers_found']}")
         if self.api_key:
-            logger.info(f"Serper API calls: {final_stats['serper_calls']}")
+            logger.info(f"Serper API calls: {final_stats['serper_calls']} ({final_stats['serper_queries']} queries)")
             logger.info(f"Cache hits: {final_stats['cache_hits']}")
         logger.info("="*50)
         
@@ -799,7 +1039,8 @@ class CompanyEnricher:
 
 
 def enrich(input_csv: str, output_csv: str, api_key: Optional[str] = None, 
-           cache_file: Optional[str] = None, progress_callback=None, include_maybe: bool = True) -> Dict:
+           cache_file: Optional[str] = None, progress_callback=None, include_maybe: bool = True,
+           max_workers: int = ENRICH_CONCURRENCY, verbose: bool = False) -> Dict:
     """
     Enrich companies from input CSV and write to output CSV.
     
@@ -807,9 +1048,12 @@ def enrich(input_csv: str, output_csv: str, api_key: Optional[str] = None,
         input_csv: Path to input CSV (should have fit_bucket or fit_yes_no column)
         output_csv: Path to output CSV
         api_key: Optional Serper API key (if None, reads from SERPER_API_KEY env var)
-        cache_file: Optional path to cache file (default: outputs/cache_serper.json)
-        progress_callback: Optional callback function(count, total) for progress updates
+        cache_file: Optional path to cache file (default: outputs/cache_serper.db)
+        progress_callback: Optional callback function(count, total), called every
+            PROGRESS_MASK + 1 companies and for the last one
         include_maybe: If True, enrich YES + MAYBE companies; otherwise YES only
+        max_workers: Number of companies enriched concurrently
+        verbose: If True, log full tracebacks for per-company errors
         
     Returns:
         Dictionary with enrichment statistics
@@ -817,8 +1061,11 @@ def enrich(input_csv: str, output_csv: str, api_key: Optional[str] = None,
     if api_key is None:
         api_key = os.getenv('SERPER_API_KEY')
     
-    enricher = CompanyEnricher(api_key=api_key, cache_file=cache_file)
-    stats = enricher.enrich_csv(input_csv, output_csv, progress_callback=progress_callback, include_maybe=include_maybe)
+    enricher = CompanyEnricher(api_key=api_key, cache_file=cache_file, max_workers=max_workers, verbose=verbose)
+    try:
+        stats = enricher.enrich_csv(input_csv, output_csv, progress_callback=progress_callback, include_maybe=include_maybe)
+    finally:
+        enricher.session.close()
     return stats
 
 
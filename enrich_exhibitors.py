@@ -10,7 +10,7 @@ This script enriches scraped exhibitor data with company information including:
 - Company website/domain
 
 USAGE:
-    python enrich_exhibitors.py <input_json_file> [--api-key <key>] [--output <output.csv>]
+    python enrich_exhibitors.py <input_json_file> [--api-key <key>] [--output <output.csv>] [--format csv|jsonl]
     
 EXAMPLES:
     # With Clearbit API key (recommended for best results)
@@ -30,7 +30,7 @@ API KEY SETUP:
     - If API key is invalid/missing, the script will still attempt domain extraction but with lower success rate
     
 OUTPUT:
-    - CSV file with all required fields (see schema below)
+    - CSV file with all required fields (see schema below), or JSONL with --format jsonl
     - Domains are extracted even without API key
     - Enrichment data (industry, employees, revenue) requires valid API key
     
@@ -54,6 +54,15 @@ from urllib.parse import urlparse, urljoin
 import requests
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from net_utils import host_resolves
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSONL serialization
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -68,6 +77,18 @@ CLEARBIT_API_BASE = 'https://company.clearbit.com/v2/companies/find'
 LINKEDIN_SEARCH_BASE = 'https://www.linkedin.com/search/results/companies/'
 RATE_LIMIT_DELAY = 0.5  # Seconds between API calls
 MAX_RETRIES = 3
+HTTP_POOL_SIZE = 32  # Pooled keep-alive connections per host
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Enrichment fields merged by confidence in merge_enrichment_data
+MERGE_KEYS = ('industry', 'employee_count', 'employee_range', 'revenue', 'revenue_range',
+              'hq_city', 'hq_state', 'hq_country', 'website')
+SOURCE_KEYS = ('source_industry', 'source_employee', 'source_revenue')
+
+# Name fragments marking non-company entries (navigation text, descriptions)
+SKIP_NAME_TOKENS = ('exhibitor search', 'all exhibitors', 'search', 'filter')
+DESCRIPTION_NAME_TOKENS = ('delivers', 'is a', 'are a', 'provides', 'specializes')
+JUNK_NAME_RE = re.compile('|'.join(map(re.escape, SKIP_NAME_TOKENS + DESCRIPTION_NAME_TOKENS)))
 
 
 class EnrichmentProvider:
@@ -96,62 +117,91 @@ class SerperProvider(EnrichmentProvider):
             'X-API-KEY': api_key,
             'Content-Type': 'application/json'
         })
+        # Reuse TLS connections across queries and back off on 429/5xx
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({'POST'}),
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=retry
+        ))
     
-    def search_company_domain(self, company_name: str) -> Optional[str]:
+    def _pick_domain(self, organic_results: List[Dict[str, Any]]) -> Optional[str]:
         """
-        Search for company website using Serper API.
+        Pick the most likely company domain from Serper organic results.
         
         Args:
-            company_name: Company name
+            organic_results: Serper 'organic' result list
             
         Returns:
             Domain string or None
         """
+        # Look for the most likely company website
+        for result in organic_results:
+            link = result.get('link', '')
+            
+            # Skip social media and directory sites
+            if any(skip in link.lower() for skip in ['facebook.com', 'linkedin.com', 'twitter.com', 
+                                                     'instagram.com', 'crunchbase', 'zoominfo', 
+                                                     'bloomberg', 'wikipedia.org']):
+                continue
+            
+            # Extract domain
+            domain = extract_domain_from_url(link)
+            if domain:
+                return domain
+        
+        # If nothing matched, return first valid non-social domain
+        for result in organic_results:
+            link = result.get('link', '')
+            domain = extract_domain_from_url(link)
+            if domain and not any(skip in domain for skip in ['facebook', 'linkedin', 'twitter', 'instagram']):
+                return domain
+        
+        return None
+    
+    def search_and_enrich(self, company_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Discover domain and basic enrichment data from a single Serper search.
+        Used instead of a domain search + enrich_by_domain when no domain is known.
+        
+        Args:
+            company_name: Company name
+            
+        Returns:
+            Dictionary with enrichment data (website set to the discovered domain) or None
+        """
         try:
-            query = f"{company_name} official website"
             payload = {
-                'q': query,
-                'num': 5
+                'q': f"{company_name} official website company employees industry",
+                'num': 10
             }
-            
             response = self.session.post(SERPER_API_BASE, json=payload, timeout=10)
+            if response.status_code != 200:
+                return None
             
-            if response.status_code == 200:
-                data = response.json()
-                organic_results = data.get('organic', [])
-                
-                # Look for the most likely company website
-                for result in organic_results:
-                    link = result.get('link', '')
-                    title = result.get('title', '').lower()
-                    snippet = result.get('snippet', '').lower()
-                    
-                    # Skip social media and directory sites
-                    if any(skip in link.lower() for skip in ['facebook.com', 'linkedin.com', 'twitter.com', 
-                                                             'instagram.com', 'crunchbase', 'zoominfo', 
-                                                             'bloomberg', 'wikipedia.org']):
-                        continue
-                    
-                    # Extract domain
-                    domain = extract_domain_from_url(link)
-                    if domain:
-                        # Prefer .com domains
-                        if '.com' in domain:
-                            return domain
-                        # Otherwise return first valid domain
-                        return domain
-                
-                # If no .com found, return first valid domain
-                for result in organic_results:
-                    link = result.get('link', '')
-                    domain = extract_domain_from_url(link)
-                    if domain and not any(skip in domain for skip in ['facebook', 'linkedin', 'twitter', 'instagram']):
-                        return domain
+            data = response.json()
+            organic_results = data.get('organic', [])
+            domain = self._pick_domain(organic_results)
+            if not domain:
+                return None
             
-            return None
+            all_text = " ".join(f"{r.get('title', '')} {r.get('snippet', '')}" for r in organic_results)
+            kg = data.get('knowledgeGraph', {})
+            if kg:
+                all_text += f" {kg.get('description', '')} {kg.get('type', '')}"
+            
+            enrichment = self._empty_enrichment(domain)
+            self._apply_extracted_fields(enrichment, all_text, company_name)
+            return enrichment
             
         except Exception as e:
-            logger.debug(f"Serper search failed for {company_name}: {e}")
+            logger.debug(f"Serper search-and-enrich failed for {company_name}: {e}")
             return None
     
     def enrich_by_domain(self, domain: str, company_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -166,21 +216,7 @@ class SerperProvider(EnrichmentProvider):
         Returns:
             Dictionary with enrichment data extracted from search results
         """
-        enrichment = {
-            'industry': None,
-            'employee_count': None,
-            'employee_range': None,
-            'revenue': None,
-            'revenue_range': None,
-            'hq_city': None,
-            'hq_state': None,
-            'hq_country': None,
-            'website': f"https://{domain}",
-            'source_industry': None,
-            'source_employee': None,
-            'source_revenue': None,
-            'confidence': 0.6
-        }
+        enrichment = self._empty_enrichment(domain)
         
         try:
             # Strategy 1: Search for company info on LinkedIn/Crunchbase
@@ -224,33 +260,7 @@ class SerperProvider(EnrichmentProvider):
             
             # Extract information from collected text
             if all_text:
-                # Extract industry
-                industry = self._extract_industry(all_text, company_name)
-                if industry:
-                    enrichment['industry'] = industry
-                    enrichment['source_industry'] = 'serper_search'
-                    enrichment['confidence'] = max(enrichment['confidence'], 0.65)
-                
-                # Extract employee range
-                employee_range = self._extract_employee_range(all_text)
-                if employee_range:
-                    enrichment['employee_range'] = employee_range
-                    enrichment['source_employee'] = 'serper_search'
-                    enrichment['confidence'] = max(enrichment['confidence'], 0.65)
-                
-                # Extract revenue range
-                revenue_range = self._extract_revenue_range(all_text)
-                if revenue_range:
-                    enrichment['revenue_range'] = revenue_range
-                    enrichment['source_revenue'] = 'serper_search'
-                    enrichment['confidence'] = max(enrichment['confidence'], 0.65)
-                
-                # Extract location
-                location = self._extract_location(all_text)
-                if location:
-                    enrichment['hq_city'] = location.get('city')
-                    enrichment['hq_state'] = location.get('state')
-                    enrichment['hq_country'] = location.get('country')
+                self._apply_extracted_fields(enrichment, all_text, company_name)
             
             return enrichment if any([enrichment.get('industry'), enrichment.get('employee_range'), 
                                      enrichment.get('revenue_range'), enrichment.get('hq_city')]) else None
@@ -259,6 +269,55 @@ class SerperProvider(EnrichmentProvider):
             logger.debug(f"Serper enrichment failed for {domain}: {e}")
             return None
     
+    def _empty_enrichment(self, domain: str) -> Dict[str, Any]:
+        """Build an empty Serper enrichment record for a domain."""
+        return {
+            'industry': None,
+            'employee_count': None,
+            'employee_range': None,
+            'revenue': None,
+            'revenue_range': None,
+            'hq_city': None,
+            'hq_state': None,
+            'hq_country': None,
+            'website': f"https://{domain}",
+            'source_industry': None,
+            'source_employee': None,
+            'source_revenue': None,
+            'confidence': 0.6
+        }
+    
+    def _apply_extracted_fields(self, enrichment: Dict[str, Any], all_text: str,
+                                company_name: Optional[str] = None):
+        """Extract industry, size, revenue and location from search text into enrichment."""
+        # Extract industry
+        industry = self._extract_industry(all_text, company_name)
+        if industry:
+            enrichment['industry'] = industry
+            enrichment['source_industry'] = 'serper_search'
+            enrichment['confidence'] = max(enrichment['confidence'], 0.65)
+        
+        # Extract employee range
+        employee_range = self._extract_employee_range(all_text)
+        if employee_range:
+            enrichment['employee_range'] = employee_range
+            enrichment['source_employee'] = 'serper_search'
+            enrichment['confidence'] = max(enrichment['confidence'], 0.65)
+        
+        # Extract revenue range
+        revenue_range = self._extract_revenue_range(all_text)
+        if revenue_range:
+            enrichment['revenue_range'] = revenue_range
+            enrichment['source_revenue'] = 'serper_search'
+            enrichment['confidence'] = max(enrichment['confidence'], 0.65)
+        
+        # Extract location
+        location = self._extract_location(all_text)
+        if location:
+            enrichment['hq_city'] = location.get('city')
+            enrichment['hq_state'] = location.get('state')
+            enrichment['hq_country'] = location.get('country')
+    
     def _extract_industry(self, text: str, company_name: Optional[str] = None) -> Optional[str]:
         """Extract industry from text."""
         text_lower = text.lower()
@@ -755,12 +814,13 @@ def extract_domain_from_exhibitor_page(source_url: str, company_name: str) -> Tu
         return None, 0.0
 
 
-def search_company_website(company_name: str) -> Tuple[Optional[str], float]:
+def search_company_website(company_name: str, name_lower: Optional[str] = None) -> Tuple[Optional[str], float]:
     """
     Fallback: Attempt to construct or search for company website using company name.
     
     Args:
         company_name: Company name
+        name_lower: Optional pre-lowercased company name (avoids recomputing it)
         
     Returns:
         Tuple of (domain, confidence_score)
@@ -770,17 +830,16 @@ def search_company_website(company_name: str) -> Tuple[Optional[str], float]:
     
     # Strategy 1: Try common domain patterns from company name
     # Clean company name for domain construction
-    clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', company_name.lower())
+    clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', name_lower or company_name.lower())
     clean_name = re.sub(r'\s+', '', clean_name)  # Remove spaces
     
-    # Try common TLDs
+    # Try common TLDs, keeping only candidates that actually resolve
     common_tlds = ['com', 'net', 'org', 'co', 'io']
-    for tld in common_tlds:
-        potential_domain = f"{clean_name}.{tld}"
-        # Quick check if domain might exist (very basic heuristic)
-        # In production, you'd do a DNS lookup or use a search API
-        if len(clean_name) > 3:  # Reasonable length
-            return potential_domain, 0.3
+    if len(clean_name) > 3:  # Reasonable length
+        for tld in common_tlds:
+            potential_domain = f"{clean_name}.{tld}"
+            if host_resolves(potential_domain):
+                return potential_domain, 0.3
     
     # Strategy 2: Try to extract from company name if it contains URL-like text
     url_pattern = r'(?:https?://)?(?:www\.)?([a-zA-Z0-9-]+\.[a-zA-Z]{2,})'
@@ -792,51 +851,46 @@ def search_company_website(company_name: str) -> Tuple[Optional[str], float]:
     return None, 0.0
 
 
-def merge_enrichment_data(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+def merge_enrichment_data(existing: Dict[str, Any], new: Dict[str, Any]) -> None:
     """
-    Merge enrichment data, keeping best values by confidence.
+    Merge enrichment data into existing record in place, keeping best values by confidence.
     Never overwrite existing data with empty values.
     
     Args:
-        existing: Existing enrichment data
+        existing: Existing enrichment data (updated in place)
         new: New enrichment data to merge
-        
-    Returns:
-        Merged enrichment data
     """
-    merged = existing.copy()
     new_confidence = new.get('confidence', 0.0)
     existing_confidence = existing.get('confidence', 0.0)
+    prefer_new = new_confidence > existing_confidence
     
     # Only update if new data has higher confidence or existing is empty
-    for key in ['industry', 'employee_count', 'employee_range', 'revenue', 'revenue_range',
-                'hq_city', 'hq_state', 'hq_country', 'website']:
+    # Never overwrite with empty/None
+    for key in MERGE_KEYS:
         new_value = new.get(key)
-        existing_value = existing.get(key)
-        
-        # Never overwrite with empty/None
-        if new_value and (not existing_value or new_confidence > existing_confidence):
-            merged[key] = new_value
+        if new_value and (prefer_new or not existing.get(key)):
+            existing[key] = new_value
     
     # Update source fields
-    for key in ['source_industry', 'source_employee', 'source_revenue']:
-        if new.get(key) and (not existing.get(key) or new_confidence > existing_confidence):
-            merged[key] = new.get(key)
+    for key in SOURCE_KEYS:
+        new_value = new.get(key)
+        if new_value and (prefer_new or not existing.get(key)):
+            existing[key] = new_value
     
     # Update confidence to max
-    merged['confidence'] = max(new_confidence, existing_confidence)
-    
-    return merged
+    existing['confidence'] = max(new_confidence, existing_confidence)
 
 
-def enrich_exhibitors(input_file: str, api_key: Optional[str] = None, output_file: Optional[str] = None) -> str:
+def enrich_exhibitors(input_file: str, api_key: Optional[str] = None, output_file: Optional[str] = None,
+                      output_format: str = 'csv') -> str:
     """
     Main enrichment function.
     
     Args:
         input_file: Path to input JSON file
         api_key: Optional API key for enrichment provider
-        output_file: Optional output CSV file path
+        output_file: Optional output file path
+        output_format: Output format, 'csv' or 'jsonl'
         
     Returns:
         Path to output file
@@ -868,15 +922,12 @@ def enrich_exhibitors(input_file: str, api_key: Optional[str] = None, output_fil
     for idx, exhibitor in enumerate(exhibitors):
         company_name = exhibitor.get('company_name', '')
         source_url = exhibitor.get('source_url')  # May not exist in current data
+        name_lower = company_name.lower()
         
-        # Skip obviously non-company entries
-        if any(skip in company_name.lower() for skip in ['exhibitor search', 'all exhibitors', 'search', 'filter']):
-            logger.debug(f"Skipping non-company entry: {company_name}")
-            continue
-        
-        # Skip entries that look like descriptions (too long, contain "is", "are", "delivers", etc.)
-        if len(company_name) > 60 or any(word in company_name.lower() for word in ['delivers', 'is a', 'are a', 'provides', 'specializes']):
-            logger.debug(f"Skipping description-like entry: {company_name[:50]}...")
+        # Skip obviously non-company entries and entries that look like descriptions
+        # (too long, contain "is a", "are a", "delivers", etc.)
+        if len(company_name) > 60 or JUNK_NAME_RE.search(name_lower):
+            logger.debug(f"Skipping non-company entry: {company_name[:50]}")
             continue
         
         logger.info(f"Processing {idx + 1}/{len(exhibitors)}: {company_name}")
@@ -904,14 +955,16 @@ def enrich_exhibitors(input_file: str, api_key: Optional[str] = None, output_fil
         # Step 1: Extract domain
         domain = None
         domain_confidence = 0.0
+        provider_data = None
         
         if source_url:
             domain, domain_confidence = extract_domain_from_exhibitor_page(source_url, company_name)
         
         if not domain and api_key and isinstance(provider, SerperProvider):
-            # Use Serper to search for company website
+            # Use one Serper search for both the company website and its enrichment data
             time.sleep(RATE_LIMIT_DELAY)
-            searched_domain = provider.search_company_domain(company_name)
+            provider_data = provider.search_and_enrich(company_name)
+            searched_domain = extract_domain_from_url(provider_data['website']) if provider_data else None
             if searched_domain:
                 domain = searched_domain
                 domain_confidence = 0.7  # Higher confidence for search-based discovery
@@ -919,7 +972,7 @@ def enrich_exhibitors(input_file: str, api_key: Optional[str] = None, output_fil
         
         if not domain:
             # Fallback: try to construct from company name (very low confidence)
-            domain, domain_confidence = search_company_website(company_name)
+            domain, domain_confidence = search_company_website(company_name, name_lower)
         
         if domain:
             enrichment['matched_domain'] = domain
@@ -935,16 +988,17 @@ def enrich_exhibitors(input_file: str, api_key: Optional[str] = None, output_fil
             match_failures.append(company_name)
             logger.warning(f"Could not extract domain for {company_name}")
         
-        # Step 2: Enrich using domain
+        # Step 2: Enrich using domain (skipped when the Serper search already returned data)
         if domain:
-            time.sleep(RATE_LIMIT_DELAY)  # Rate limiting
-            if isinstance(provider, SerperProvider):
-                provider_data = provider.enrich_by_domain(domain, company_name)
-            else:
-                provider_data = provider.enrich_by_domain(domain)
+            if provider_data is None:
+                time.sleep(RATE_LIMIT_DELAY)  # Rate limiting
+                if isinstance(provider, SerperProvider):
+                    provider_data = provider.enrich_by_domain(domain, company_name)
+                else:
+                    provider_data = provider.enrich_by_domain(domain)
             
             if provider_data:
-                enrichment = merge_enrichment_data(enrichment, provider_data)
+                merge_enrichment_data(enrichment, provider_data)
                 if enrichment.get('industry') or enrichment.get('employee_range'):
                     logger.info(f"  Enriched: {enrichment.get('industry')} | {enrichment.get('employee_range')}")
                 else:
@@ -960,7 +1014,7 @@ def enrich_exhibitors(input_file: str, api_key: Optional[str] = None, output_fil
                     enrichment['matched_domain'] = domain_from_provider
                     enrichment['website'] = provider_data['website']
                     enrichment['confidence'] = max(enrichment['confidence'], 0.6)
-                    enrichment = merge_enrichment_data(enrichment, provider_data)
+                    merge_enrichment_data(enrichment, provider_data)
                     logger.info(f"  Found domain via Serper search: {domain_from_provider}")
         
         enriched_data.append(enrichment)
@@ -994,21 +1048,31 @@ def enrich_exhibitors(input_file: str, api_key: Optional[str] = None, output_fil
         # Generate output filename
         import os
         base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_file = f"{base_name}_enriched.csv"
+        output_file = f"{base_name}_enriched.{output_format}"
     
     logger.info(f"Writing enriched data to {output_file}")
     
-    fieldnames = [
-        'company_name', 'matched_domain', 'website', 'industry',
-        'employee_count', 'employee_range', 'revenue', 'revenue_range',
-        'hq_city', 'hq_state', 'hq_country', 'source_url',
-        'source_industry', 'source_employee', 'source_revenue', 'confidence'
-    ]
-    
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(deduplicated)
+    if output_format == 'jsonl':
+        # One JSON object per line; keeps native types (e.g. confidence as float)
+        with open(output_file, 'wb') as f:
+            for row in deduplicated:
+                if orjson is not None:
+                    f.write(orjson.dumps(row))
+                else:
+                    f.write(json.dumps(row, ensure_ascii=False).encode('utf-8'))
+                f.write(b'\n')
+    else:
+        fieldnames = [
+            'company_name', 'matched_domain', 'website', 'industry',
+            'employee_count', 'employee_range', 'revenue', 'revenue_range',
+            'hq_city', 'hq_state', 'hq_country', 'source_url',
+            'source_industry', 'source_employee', 'source_revenue', 'confidence'
+        ]
+        
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(deduplicated)
     
     # Log summary
     logger.info(f"\n=== Enrichment Summary ===")
@@ -1035,17 +1099,20 @@ def main():
 Examples:
   python enrich_exhibitors.py outputs/exhibitors.json --api-key YOUR_API_KEY
   python enrich_exhibitors.py outputs/exhibitors.json --api-key YOUR_API_KEY --output enriched.csv
+  python enrich_exhibitors.py outputs/exhibitors.json --api-key YOUR_API_KEY --format jsonl
   python enrich_exhibitors.py outputs/exhibitors.json  # Uses LinkedIn fallback
         """
     )
     parser.add_argument('input_file', help='Input JSON file with exhibitor data')
     parser.add_argument('--api-key', default=None, help='API key for enrichment provider (Clearbit)')
-    parser.add_argument('--output', default=None, help='Output CSV file (default: <input>_enriched.csv)')
+    parser.add_argument('--output', default=None, help='Output file (default: <input>_enriched.<format>)')
+    parser.add_argument('--format', dest='output_format', choices=['csv', 'jsonl'], default='csv',
+                        help='Output format (default: csv)')
     
     args = parser.parse_args()
     
     try:
-        output_file = enrich_exhibitors(args.input_file, args.api_key, args.output)
+        output_file = enrich_exhibitors(args.input_file, args.api_key, args.output, args.output_format)
         print(f"\n✓ Enrichment complete! Results saved to: {output_file}", file=sys.stderr)
         
     except Exception as e:
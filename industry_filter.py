@@ -7,21 +7,61 @@ keyword matching of website content. Processes all rows in test_enriched.csv.
 """
 
 import csv
+import gzip
+import hashlib
+import heapq
+import json
 import os
+import re
+import threading
 import time
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-from typing import Optional, List, Tuple, Dict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from lxml import etree, html as lxml_html
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin, urlparse
+from urllib3.util.retry import Retry
+from net_utils import host_resolves
+from typing import Optional, List, Tuple, Dict, Iterable, Callable
 import sys
 
+try:
+    import hyperscan
+except ImportError:  # Optional: SIMD multi-pattern keyword scanning (pip install hyperscan)
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: single-pass keyword scanning (pip install pyahocorasick)
+    ahocorasick = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # Optional: multithreaded C++ CSV parsing for classify input (pip install pyarrow)
+    pa = pa_csv = None
+
 
 # Configuration
 TIMEOUT = 15
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # seconds
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-REQUEST_DELAY = 0.5  # Delay between companies to be respectful
+HOST_CONCURRENCY = 2  # Max simultaneous requests per host, to be respectful
+CACHE_DIR = os.getenv("INDUSTRY_FILTER_CACHE_DIR", ".cache/pages")  # Gzipped HTML of fetched pages
+CACHE_TTL = 7 * 24 * 3600  # seconds before a cached page is re-fetched
+CLASSIFY_WORKERS = os.cpu_count() or 1  # Processes used to score rows in classify()
+CLASSIFY_CHUNK_SIZE = 64  # Rows handed to a worker process at a time
+CLASSIFY_WINDOW_SIZE = 4096  # Rows read ahead of the writer when using worker processes
+DEBUG_TOP_N = 20  # MAYBE / NO companies listed by classify(debug=True)
+PROGRESS_MASK = 15  # progress_callback fires every 16 rows (and on the last row)
+CSV_BLOCK_SIZE = 1 << 20  # Bytes per pyarrow CSV record batch
+TEXT_CACHE_SIZE = 4096  # extract_text results kept in memory, keyed by HTML hash
+PAGE_CACHE_SIZE = 256  # Successfully fetched pages kept in memory, keyed by URL
 
 # Classification thresholds
 THRESHOLD_YES = 3  # Score >= 3 → YES
@@ -56,6 +96,74 @@ SOFT_NEGATIVE_KEYWORDS = {  # -1 point, but never block if any positive keyword
     "software", "consulting", "media", "association"
 }
 
+
+# Frozen, pre-lowered keyword tuples used by the scorer (no per-row .lower())
+STRONG_KW = tuple(k.lower() for k in STRONG_KEYWORDS)
+MEDIUM_KW = tuple(k.lower() for k in MEDIUM_KEYWORDS)
+WEAK_KW = tuple(k.lower() for k in WEAK_KEYWORDS)
+HARD_NEG_KW = tuple(k.lower() for k in HARD_NEGATIVE_KEYWORDS)
+SOFT_NEG_KW = tuple(k.lower() for k in SOFT_NEGATIVE_KEYWORDS)
+
+# Positive keywords with their points, in scoring order (strong, medium, weak)
+SCORED_KEYWORDS = [
+    (keyword, points)
+    for points, keywords in ((3, STRONG_KW), (2, MEDIUM_KW), (1, WEAK_KW))
+    for keyword in keywords
+]
+
+
+def _build_keyword_database():
+    """
+    Compile all positive keywords into one Hyperscan database (pattern id is
+    the index into SCORED_KEYWORDS). Returns None when hyperscan is not
+    installed or the database cannot be compiled on this platform.
+    """
+    if hyperscan is None:
+        return None
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(keyword).encode('utf-8') for keyword, _ in SCORED_KEYWORDS],
+            ids=list(range(len(SCORED_KEYWORDS))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(SCORED_KEYWORDS),
+            elements=len(SCORED_KEYWORDS)
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+KEYWORD_DATABASE = _build_keyword_database()
+_SCAN_STATE = threading.local()  # Hyperscan scratch space is per thread
+
+
+def _keyword_scratch():
+    """Return this thread's Hyperscan scratch space for KEYWORD_DATABASE."""
+    scratch = getattr(_SCAN_STATE, 'scratch', None)
+    if scratch is None:
+        scratch = _SCAN_STATE.scratch = hyperscan.Scratch(KEYWORD_DATABASE)
+    return scratch
+
+
+def _build_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over all positive keywords so text can be
+    scored in a single pass (value is the index into SCORED_KEYWORDS).
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for pattern_id, (keyword, _) in enumerate(SCORED_KEYWORDS):
+        automaton.add_word(keyword, pattern_id)
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
 # Legacy keywords (kept for backward compatibility with old code paths)
 TARGET_KEYWORDS = [
     "signage", "sign shop", "wayfinding", "sign systems",
@@ -78,44 +186,214 @@ NON_TARGET_KEYWORDS = [
     "logistics", "supply chain", "trucking", "freight"
 ]
 
+# Industry guess categories in priority order (first category with a term
+# contained in any matched keyword wins)
+INDUSTRY_GUESSES = [
+    ('Large-format printing', ['large format', 'wide format', 'grand format', 'printing', 'print']),
+    ('Architectural graphics', ['architectural graphics', 'window film', 'glass film', 'wall graphics']),
+    ('Vehicle wraps', ['vehicle wrap', 'car wrap', 'fleet graphics', 'wraps']),
+    ('Commercial signage', ['signage', 'sign shop', 'wayfinding', 'sign systems']),
+    ('Industrial graphics', ['industrial graphics', 'decals', 'labels', 'nameplates']),
+    ('Signage/Graphics', ['graphics', 'printing', 'display']),
+]
+
+
+def _build_industry_map() -> Dict[str, Tuple[int, str]]:
+    """
+    Map each scored keyword to its (priority, industry) so classify() can look
+    categories up per matched keyword instead of substring-scanning them.
+    """
+    industry_map = {}
+    for keyword, _ in SCORED_KEYWORDS:
+        for priority, (industry, terms) in enumerate(INDUSTRY_GUESSES):
+            if any(term in keyword for term in terms):
+                industry_map[keyword] = (priority, industry)
+                break
+    return industry_map
+
+
+INDUSTRY_MAP = _build_industry_map()
+
+# Input CSV columns read by classify() (in this order) and their defaults when absent
+INPUT_COLUMNS = ('company_name', 'domain', 'company_blurb', 'source_url')
+INPUT_DEFAULTS = ('Unknown', '', '', '')
+
+# Output CSV columns written by classify()
+OUTPUT_COLUMNS = (
+    'company_name', 'domain', 'company_blurb', 'source_url', 'industry_guess',
+    'fit_bucket', 'score', 'evidence_snippet', 'fit_yes_no'
+)
+
 # Additional pages to try (after homepage)
 ADDITIONAL_PAGES = ["/industries", "/solutions", "/applications", "/markets", "/products"]
 
+# Shared HTTP session: keep-alive connection pool plus retry/backoff
+HTTP_POOL_SIZE = 64
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+_adapter = HTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE,
+    pool_maxsize=HTTP_POOL_SIZE,
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_DELAY,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Per-host politeness: only the fetch path is throttled, local scoring is not
+_HOST_SEMAPHORES = defaultdict(lambda: threading.BoundedSemaphore(HOST_CONCURRENCY))
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
 
-def fetch_url(url: str, retries: int = MAX_RETRIES) -> Optional[requests.Response]:
+def _host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """Return the semaphore limiting concurrent requests to the URL's host."""
+    host = urlparse(url).netloc.lower()
+    with _HOST_SEMAPHORES_LOCK:
+        return _HOST_SEMAPHORES[host]
+
+
+def fetch_url(url: str, headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
     """
-    Fetch a URL with retries and backoff.
+    Fetch a URL using the shared session (retries and backoff are handled
+    by the session's adapter). At most HOST_CONCURRENCY requests run against
+    the same host at once. Hosts without a DNS record are skipped up front
+    instead of failing (with retries) on every request.
     
     Args:
         url: URL to fetch
-        retries: Number of retry attempts
+        headers: Optional extra request headers (e.g. conditional-GET validators)
         
     Returns:
-        Response object if successful, None otherwise
+        Response object if successful (200, or 304 for a conditional GET), None otherwise
     """
-    headers = {"User-Agent": USER_AGENT}
+    host = urlparse(url).hostname
+    if host and not host_resolves(host):
+        return None
     
-    for attempt in range(retries):
-        try:
-            response = requests.get(url, headers=headers, timeout=TIMEOUT, allow_redirects=True)
-            if response.status_code == 200:
-                return response
-            elif response.status_code in [301, 302, 303, 307, 308]:
-                # Follow redirects are handled by allow_redirects=True
-                continue
-        except requests.exceptions.RequestException as e:
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))  # Exponential backoff
-            else:
-                pass  # Final attempt failed
+    try:
+        with _host_semaphore(url):
+            response = SESSION.get(url, headers=headers, timeout=TIMEOUT, allow_redirects=True)
+    except requests.exceptions.RequestException:
+        return None
     
+    if response.status_code == 200 or (headers and response.status_code == 304):
+        return response
     return None
 
 
+def _cache_path(url: str) -> Path:
+    """Return the on-disk cache path for a URL (sha1-keyed, sharded by prefix)."""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return Path(CACHE_DIR) / key[:2] / f"{key}.html.gz"
+
+
+def _write_cache_file(path: Path, data: bytes) -> None:
+    """Atomically write a cache file (best-effort; errors are ignored)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+_PAGE_CACHE: Dict[str, str] = {}
+
+
+def fetch_url_cached(url: str) -> Optional[str]:
+    """
+    Fetch a URL's HTML, using the on-disk page cache when a fresh copy exists.
+    
+    Successful fetches are stored gzipped under CACHE_DIR so reruns skip the
+    network entirely; hot URLs are also kept in memory for the current run.
+    Failures are not remembered, so a transient error is retried next time.
+    Stale entries are revalidated with If-None-Match / If-Modified-Since, so
+    an unchanged page costs a 304 instead of a full download; if that request
+    fails, the stale copy is returned.
+    
+    Args:
+        url: URL to fetch
+        
+    Returns:
+        HTML content if successful, None otherwise
+    """
+    html = _PAGE_CACHE.get(url)
+    if html is None:
+        html = _fetch_url_disk_cached(url)
+        if html is not None and len(_PAGE_CACHE) < PAGE_CACHE_SIZE:
+            _PAGE_CACHE[url] = html
+    return html
+
+
+def _fetch_url_disk_cached(url: str) -> Optional[str]:
+    """Fetch a URL's HTML through the on-disk page cache (see fetch_url_cached)."""
+    path = _cache_path(url)
+    meta_path = path.with_name(path.name.replace('.html.gz', '.json'))
+    
+    cached_html = None
+    try:
+        age = time.time() - path.stat().st_mtime
+        cached_html = gzip.decompress(path.read_bytes()).decode('utf-8', 'ignore')
+        if age < CACHE_TTL:
+            return cached_html
+    except (OSError, EOFError):
+        pass  # Missing or unreadable cache entry: fetch again
+    
+    # Revalidate a stale entry using the validators saved with it
+    headers = {}
+    if cached_html is not None:
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+    
+    response = fetch_url(url, headers=headers or None)
+    if response is None:
+        # Network error or error status: a stale copy beats no page at all
+        return cached_html
+    
+    if response.status_code == 304:
+        try:
+            os.utime(path)  # Fresh again for another CACHE_TTL
+        except OSError:
+            pass
+        return cached_html
+    
+    html = response.text
+    _write_cache_file(path, gzip.compress(html.encode('utf-8')))
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        _write_cache_file(meta_path, json.dumps({'etag': etag, 'last_modified': last_modified}).encode('utf-8'))
+    elif cached_html is not None:
+        try:
+            meta_path.unlink()  # Drop validators that no longer describe the page
+        except OSError:
+            pass
+    
+    return html
+
+
+_TEXT_CACHE: Dict[str, str] = {}
+_WS_RE = re.compile(r'\s+')
+_SCHEME_RE = re.compile(r'^\s*https?://', re.IGNORECASE)
+NON_CONTENT_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'meta', 'link')
+
+
 def extract_text(html_content: str) -> str:
     """
-    Extract visible text from HTML using BeautifulSoup.
+    Extract visible text from HTML using lxml.
     Removes script, style, nav elements, and normalizes whitespace.
+    Results are memoized by content hash, so identical pages are parsed once.
     
     Args:
         html_content: HTML content as string
@@ -123,18 +401,31 @@ def extract_text(html_content: str) -> str:
     Returns:
         Normalized lowercase text
     """
-    soup = BeautifulSoup(html_content, 'lxml')
+    content_key = hashlib.sha1(html_content.encode('utf-8', 'ignore')).hexdigest()
+    cached_text = _TEXT_CACHE.get(content_key)
+    if cached_text is not None:
+        return cached_text
     
-    # Remove script, style, nav, and other non-content elements
-    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'meta', 'link']):
-        element.decompose()
+    try:
+        root = lxml_html.fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        # Empty document, or a str carrying an XML encoding declaration
+        try:
+            root = lxml_html.fromstring(html_content.encode('utf-8', 'ignore'))
+        except (etree.ParserError, ValueError):
+            return ""
     
-    # Get text and normalize
-    text = soup.get_text(separator=' ', strip=True)
+    # Remove script, style, nav, and other non-content elements, keeping their
+    # tail text as a separate word
+    for element in root.iter(etree.Comment, *NON_CONTENT_TAGS):
+        element.tail = f" {element.tail}" if element.tail else " "
+    etree.strip_elements(root, etree.Comment, *NON_CONTENT_TAGS, with_tail=False)
     
     # Normalize whitespace and convert to lowercase
-    text = ' '.join(text.split())
-    text = text.lower()
+    text = _WS_RE.sub(' ', ' '.join(root.itertext())).strip().lower()
+    
+    if len(_TEXT_CACHE) < TEXT_CACHE_SIZE:
+        _TEXT_CACHE[content_key] = text
     
     return text
 
@@ -144,17 +435,16 @@ def find_keywords(text: str, keywords: List[str]) -> List[str]:
     Find which keywords appear in the text (case-insensitive substring match).
     
     Args:
-        text: Text to search in
-        keywords: List of keywords to search for
+        text: Text to search in (already lowercase, e.g. from extract_text)
+        keywords: List of lowercase keywords to search for
         
     Returns:
         List of matched keywords
     """
     matched = []
-    text_lower = text.lower()
     
     for keyword in keywords:
-        if keyword.lower() in text_lower:
+        if keyword in text:
             matched.append(keyword)
     
     return matched
@@ -172,13 +462,12 @@ def determine_base_url(website: Optional[str], matched_domain: Optional[str]) ->
     Returns:
         Base URL string or None
     """
-    if website and website.strip().startswith(('http://', 'https://')):
+    if website and website.strip().lower().startswith(('http://', 'https://')):
         return website.strip()
     elif matched_domain and matched_domain.strip():
-        domain = matched_domain.strip()
         # Remove any leading http:// or https:// if present
-        domain = domain.lstrip('http://').lstrip('https://').lstrip('/')
-        return f"https://{domain}/"
+        domain = _SCHEME_RE.sub('', matched_domain.strip()).strip('/')
+        return f"https://{domain}/" if domain else None
     
     return None
 
@@ -189,31 +478,41 @@ def fetch_company_pages(base_url: str) -> List[Tuple[str, str]]:
     1. Homepage (base_url)
     2-3. First 2 successful pages from additional pages list
     
+    All candidate pages are requested concurrently; results keep the
+    ADDITIONAL_PAGES order.
+    
     Args:
         base_url: Base URL of the company
         
     Returns:
         List of tuples (url, text_content) for successfully fetched pages
     """
+    urls = [base_url] + [
+        urljoin(base_url.rstrip('/') + '/', page_path.lstrip('/'))
+        for page_path in ADDITIONAL_PAGES
+    ]
+    
+    # One lookup for the whole site: skip every page if the host has no DNS record
+    host = urlparse(base_url).hostname
+    if host and not host_resolves(host):
+        return []
+    
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        pages_html = list(executor.map(fetch_url_cached, urls))
+    
     pages_content = []
     
-    # Fetch homepage
-    response = fetch_url(base_url)
-    if response:
-        text = extract_text(response.text)
-        pages_content.append((base_url, text))
+    # Homepage
+    if pages_html[0]:
+        pages_content.append((base_url, extract_text(pages_html[0])))
     
-    # Try additional pages (stop after first 2 successful 200 responses)
+    # Additional pages (keep first 2 successful 200 responses)
     successful_count = 0
-    for page_path in ADDITIONAL_PAGES:
+    for full_url, html in zip(urls[1:], pages_html[1:]):
         if successful_count >= 2:
             break
-        
-        full_url = urljoin(base_url.rstrip('/') + '/', page_path.lstrip('/'))
-        response = fetch_url(full_url)
-        if response:
-            text = extract_text(response.text)
-            pages_content.append((full_url, text))
+        if html:
+            pages_content.append((full_url, extract_text(html)))
             successful_count += 1
     
     return pages_content
@@ -225,7 +524,7 @@ def score_company_text(text: str) -> Tuple[int, List[str]]:
     Uses local fields only (no API calls).
     
     Args:
-        text: Text to score (lowercase)
+        text: Text to score (must already be lowercase; callers lower it once)
         
     Returns:
         Tuple of (score, matched_keywords_list)
@@ -233,52 +532,64 @@ def score_company_text(text: str) -> Tuple[int, List[str]]:
     if not text:
         return (0, [])
     
-    text_lower = text.lower()
     positive_score = 0
     matched_keywords = []
     
-    # Check strong keywords (+3)
-    for keyword in STRONG_KEYWORDS:
-        if keyword.lower() in text_lower:
-            positive_score += 3
-            matched_keywords.append(keyword)
+    if KEYWORD_DATABASE is not None:
+        # Single SIMD scan; SINGLEMATCH reports each keyword once
+        found_ids = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            found_ids.add(pattern_id)
+        
+        KEYWORD_DATABASE.scan(text.encode('utf-8'), match_event_handler=on_match,
+                              scratch=_keyword_scratch())
+    elif KEYWORD_AUTOMATON is not None:
+        # Single pass over the text
+        found_ids = {pattern_id for _, pattern_id in KEYWORD_AUTOMATON.iter(text)}
+    else:
+        found_ids = None
     
-    # Check medium keywords (+2)
-    for keyword in MEDIUM_KEYWORDS:
-        if keyword.lower() in text_lower:
-            positive_score += 2
+    if found_ids is not None:
+        # Report in SCORED_KEYWORDS order (strong, medium, weak), same as the loops below
+        for pattern_id in sorted(found_ids):
+            keyword, points = SCORED_KEYWORDS[pattern_id]
+            positive_score += points
             matched_keywords.append(keyword)
+    else:
+        # Check strong (+3), then medium (+2), then weak (+1) keywords
+        for points, keywords in ((3, STRONG_KW), (2, MEDIUM_KW), (1, WEAK_KW)):
+            for keyword in keywords:
+                if keyword in text:
+                    positive_score += points
+                    matched_keywords.append(keyword)
     
-    # Check weak keywords (+1)
-    for keyword in WEAK_KEYWORDS:
-        if keyword.lower() in text_lower:
-            positive_score += 1
-            matched_keywords.append(keyword)
+    # Negative keywords never block a positive score, so skip them entirely
+    if positive_score > 0:
+        return (positive_score, matched_keywords)
     
     # Apply negative keywords
     negative_penalty = 0
-    has_positive = positive_score > 0
     
     # Hard negatives (-3) only if no positive score
-    if positive_score == 0:
-        for keyword in HARD_NEGATIVE_KEYWORDS:
-            if keyword.lower() in text_lower:
-                negative_penalty = -3
-                break  # Only apply once
+    for keyword in HARD_NEG_KW:
+        if keyword in text:
+            negative_penalty = -3
+            break  # Only apply once
     
     # Soft negatives (-1) never block if positive exists
-    if not has_positive:
-        for keyword in SOFT_NEGATIVE_KEYWORDS:
-            if keyword.lower() in text_lower:
-                negative_penalty += -1
-                break  # Only apply once
+    for keyword in SOFT_NEG_KW:
+        if keyword in text:
+            negative_penalty += -1
+            break  # Only apply once
     
     final_score = max(0, positive_score + negative_penalty)
     
     return (final_score, matched_keywords)
 
 
-def classify_company(company_name: str = "", domain: str = "", company_blurb: str = "") -> Tuple[str, int, List[str], str]:
+@lru_cache(maxsize=4096)
+def classify_company(company_name: str = "", domain: str = "", company_blurb: str = "") -> Tuple[str, int, Tuple[str, ...], str]:
     """
     Classify company using scoring system.
     Uses ONLY local fields (company_name + domain + company_blurb).
@@ -303,7 +614,7 @@ def classify_company(company_name: str = "", domain: str = "", company_blurb: st
         text_parts.append(company_blurb.strip())
     
     if not text_parts:
-        return ("NO", 0, [], "no_data")
+        return ("NO", 0, (), "no_data")
     
     combined_text = " ".join(text_parts).lower()
     
@@ -326,10 +637,11 @@ def classify_company(company_name: str = "", domain: str = "", company_blurb: st
     else:
         evidence = "no_keywords" if score == 0 else "low_score"
     
-    return (fit_bucket, score, matched_keywords, evidence)
+    # A tuple, since lru_cache hands the same result to every caller
+    return (fit_bucket, score, tuple(matched_keywords), evidence)
 
 
-def process_row(row: Dict[str, str]) -> Dict[str, str]:
+def process_row(row: Dict[str, str]) -> Tuple[str, str, str, str, int, str, str, str]:
     """
     Process a single row from the CSV.
     Uses ONLY local fields (no API calls, no web fetching).
@@ -338,12 +650,17 @@ def process_row(row: Dict[str, str]) -> Dict[str, str]:
         row: Dictionary representing a CSV row with company_name, domain, company_blurb
         
     Returns:
-        Dictionary with results including fit_bucket, score, etc.
+        Tuple of (company_name, domain, company_blurb, fit_bucket, score,
+        fit_yes_no, matched_keywords, evidence_snippet)
     """
     company_name = row.get('company_name', '')
     domain = row.get('matched_domain', '') or row.get('domain', '')
     company_blurb = row.get('company_blurb', '')
-    
+    return _process_fields(company_name, domain, company_blurb)
+
+
+def _process_fields(company_name: str, domain: str, company_blurb: str) -> Tuple[str, str, str, str, int, str, str, str]:
+    """Classify one company from its fields (process_row without the dict)."""
     # Classify using local fields only (no API, no web fetching)
     fit_bucket, score, matched_keywords, evidence_snippet = classify_company(
         company_name=company_name, domain=domain, company_blurb=company_blurb
@@ -352,167 +669,327 @@ def process_row(row: Dict[str, str]) -> Dict[str, str]:
     # Backward compatibility: fit_yes_no
     fit_yes_no = "YES" if fit_bucket == "YES" else "NO"
     
-    return {
-        'company_name': company_name,
-        'domain': domain,
-        'company_blurb': company_blurb,
-        'fit_bucket': fit_bucket,
-        'score': str(score),
-        'fit_yes_no': fit_yes_no,  # Backward compatibility
-        'matched_keywords': ', '.join(matched_keywords),
-        'evidence_snippet': evidence_snippet[:120]  # Ensure max 120 chars
-    }
+    return (
+        company_name,
+        domain,
+        company_blurb,
+        fit_bucket,
+        score,
+        fit_yes_no,  # Backward compatibility
+        ', '.join(matched_keywords),
+        evidence_snippet[:120]  # Ensure max 120 chars
+    )
+
+
+def _build_pipeline_result(result: Tuple, source_url: str) -> Tuple:
+    """
+    Convert a process_row result into a pipeline output row.
+    
+    Args:
+        result: Tuple returned by process_row
+        source_url: Source URL from the input row
+        
+    Returns:
+        Tuple of values in OUTPUT_COLUMNS order
+    """
+    (company_name, domain, company_blurb, fit_bucket, score,
+     fit_yes_no, matched_keywords, evidence_snippet) = result
+    
+    # Determine industry guess from keywords (highest-priority category wins)
+    industry_guess = ''
+    if matched_keywords:
+        guesses = [INDUSTRY_MAP[k] for k in matched_keywords.split(', ') if k in INDUSTRY_MAP]
+        if guesses:
+            industry_guess = min(guesses)[1]
+    
+    return (
+        company_name,
+        domain,
+        company_blurb,
+        source_url,
+        industry_guess,
+        fit_bucket,
+        score,
+        evidence_snippet[:120],  # Ensure max 120 chars
+        fit_yes_no  # Backward compatibility
+    )
+
+
+def _build_row_projector(header: List[str]) -> Callable[[List[str]], Tuple[str, str, str, str]]:
+    """
+    Generate a function that projects a csv.reader row onto INPUT_COLUMNS.
+    
+    The column positions are resolved from the header once and compiled into
+    a straight tuple expression (constants stand in for absent columns), so
+    rows never go through a per-row dict.
+    
+    Args:
+        header: Header row of the input CSV
+        
+    Returns:
+        Function mapping a row list to a (company_name, domain, company_blurb,
+        source_url) tuple
+    """
+    fields = []
+    for column, default in zip(INPUT_COLUMNS, INPUT_DEFAULTS):
+        fields.append(f"r[{header.index(column)}]" if column in header else repr(default))
+    source = f"def project(r):\n    return ({', '.join(fields)},)\n"
+    namespace = {}
+    exec(compile(source, '<row_projector>', 'exec'), namespace)
+    return namespace['project']
+
+
+def _iter_csv_reader_rows(input_csv: str) -> Iterable[Tuple[str, str, str, str]]:
+    """Stream input CSV rows with csv.reader (see _iter_input_rows); short rows are padded."""
+    with open(input_csv, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        project = _build_row_projector(header)
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue  # DictReader skipped blank lines too
+            if len(row) < width:
+                row = row + [''] * (width - len(row))
+            yield project(row)
+
+
+def _iter_input_rows(input_csv: str) -> Iterable[Tuple[str, str, str, str]]:
+    """
+    Stream input CSV rows as tuples in INPUT_COLUMNS order.
+    
+    Uses pyarrow's multithreaded parser (record batch at a time, only the
+    INPUT_COLUMNS present, all read as strings) when installed; otherwise
+    csv.reader plus a generated row projector. pyarrow rejects rows with
+    missing fields, which csv.reader pads, so on a parse error the rest of
+    the file is read with csv.reader instead.
+    
+    Args:
+        input_csv: Path to input CSV
+        
+    Yields:
+        (company_name, domain, company_blurb, source_url) tuples
+    """
+    with open(input_csv, 'r', encoding='utf-8-sig', newline='') as f:
+        header = next(csv.reader(f), [])
+    if pa_csv is None or not header:
+        yield from _iter_csv_reader_rows(input_csv)
+        return
+    
+    present = [column for column in INPUT_COLUMNS if column in header]
+    rows_read = 0
+    try:
+        batches = pa_csv.open_csv(
+            input_csv,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=present,
+                column_types={column: pa.string() for column in present},
+            ),
+        )
+        for batch in batches:
+            columns = [
+                batch.column(column).to_pylist() if column in present else [default] * batch.num_rows
+                for column, default in zip(INPUT_COLUMNS, INPUT_DEFAULTS)
+            ]
+            yield from zip(*columns)
+            rows_read += batch.num_rows
+    except pa.ArrowInvalid:
+        # Batches before the bad row were complete; resume after them
+        yield from islice(_iter_csv_reader_rows(input_csv), rows_read, None)
+
+
+def classify_values(values: Tuple[str, str, str, str]) -> Tuple:
+    """
+    Classify one input row given as a tuple in INPUT_COLUMNS order.
+    
+    Args:
+        values: (company_name, domain, company_blurb, source_url)
+        
+    Returns:
+        Output row (tuple in OUTPUT_COLUMNS order)
+    """
+    company_name, domain, company_blurb, source_url = values
+    return _build_pipeline_result(_process_fields(company_name, domain, company_blurb), source_url)
+
+
+def classify_one(row: Dict[str, str]) -> Tuple:
+    """
+    Classify a single input row (e.g. as rows stream in from the scraper).
+    
+    Args:
+        row: Input row with company_name, domain, company_blurb, source_url
+        
+    Returns:
+        Output row (tuple in OUTPUT_COLUMNS order)
+    """
+    return classify_values(tuple(row.get(column, default) for column, default in zip(INPUT_COLUMNS, INPUT_DEFAULTS)))
+
+
+def classify_rows(rows: List[Tuple[str, str, str, str]]) -> List[Tuple]:
+    """
+    Classify a chunk of input rows (module-level so worker processes can
+    run it).
+    
+    Args:
+        rows: Input rows as tuples in INPUT_COLUMNS order
+        
+    Returns:
+        List of output rows (tuples in OUTPUT_COLUMNS order), in input order
+    """
+    return [classify_values(values) for values in rows]
+
+
+def _classify_rows(rows: Iterable[Tuple[str, str, str, str]], executor: Optional[ProcessPoolExecutor] = None):
+    """
+    Classify input rows lazily, in input order.
+    
+    With an executor, rows are handed to worker processes in chunks of
+    CLASSIFY_CHUNK_SIZE, one bounded window at a time, so memory stays flat
+    regardless of input size.
+    
+    Args:
+        rows: Iterable of input rows (tuples in INPUT_COLUMNS order)
+        executor: Optional process pool to classify rows in
+        
+    Yields:
+        Output rows (tuples in OUTPUT_COLUMNS order)
+    """
+    if executor is None:
+        for values in rows:
+            yield classify_values(values)
+        return
+    
+    rows = iter(rows)
+    while True:
+        window = list(islice(rows, CLASSIFY_WINDOW_SIZE))
+        if not window:
+            break
+        chunks = [window[i:i + CLASSIFY_CHUNK_SIZE] for i in range(0, len(window), CLASSIFY_CHUNK_SIZE)]
+        for chunk_results in executor.map(classify_rows, chunks):
+            yield from chunk_results
 
 
-def classify(input_csv: str, output_csv: str, progress_callback=None, debug: bool = False) -> Dict[str, int]:
+def classify(input_csv: str, output_csv: str, progress_callback=None, debug: bool = False,
+             workers: Optional[int] = None) -> Dict[str, int]:
     """
     Classify companies from input CSV and write results to output CSV.
     
     Args:
         input_csv: Path to input CSV with columns: company_name, domain, source_url
         output_csv: Path to output CSV
-        progress_callback: Optional callback function(count, total) for progress updates
+        progress_callback: Optional callback function(count, total), called every
+            PROGRESS_MASK + 1 rows and for the last row
         debug: If True, print debug information about MAYBE and borderline NO companies
+        workers: Number of worker processes (default: CLASSIFY_WORKERS; 1 = sequential)
         
     Returns:
         Dictionary with counts: {'total': int, 'yes': int, 'maybe': int, 'no': int}
     """
     print(f"Loading {input_csv}...")
     
-    # Read input CSV
-    rows_to_process = []
+    # Count input rows (cheap tuple pass) so progress can report a total
     try:
-        with open(input_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                rows_to_process.append(row)
+        with open(input_csv, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Header
+            # Blank lines are skipped, as _iter_input_rows does
+            total_rows = sum(1 for row in reader if row)
     except FileNotFoundError:
         raise FileNotFoundError(f"Input file not found: {input_csv}")
     except Exception as e:
         raise Exception(f"Error reading {input_csv}: {e}")
     
-    total_rows = len(rows_to_process)
     print(f"Found {total_rows} rows to process.")
     
-    # Process each row
-    results = []
-    start_time = time.time()
-    
-    for i, row in enumerate(rows_to_process, 1):
-        company_name = row.get('company_name', 'Unknown')
-        domain = row.get('domain', '')
-        source_url = row.get('source_url', '')
-        
-        # Progress indicator
-        if progress_callback:
-            progress_callback(i, total_rows)
-        else:
-            elapsed = time.time() - start_time
-            if i > 1:
-                avg_time_per_row = elapsed / (i - 1)
-                estimated_remaining = avg_time_per_row * (total_rows - i)
-                print(f"[{i}/{total_rows} ({i*100//total_rows}%)] Processing: {company_name} | "
-                      f"ETA: {estimated_remaining/60:.1f} min")
-            else:
-                print(f"[{i}/{total_rows} ({i*100//total_rows}%)] Processing: {company_name}")
-        
-        # Get company_blurb from input
-        company_blurb = row.get('company_blurb', '')
-        
-        # Adapt row format for process_row
-        adapted_row = {
-            'company_name': company_name,
-            'domain': domain,
-            'company_blurb': company_blurb
-        }
-        
-        result = process_row(adapted_row)
-        
-        # Extract results
-        fit_bucket = result.get('fit_bucket', 'NO')
-        score = result.get('score', '0')
-        fit_yes_no = result.get('fit_yes_no', 'NO')
-        matched_keywords = result.get('matched_keywords', '')
-        evidence_snippet = result.get('evidence_snippet', '')
-        
-        # Determine industry guess from keywords
-        industry_guess = ''
-        if matched_keywords:
-            keyword_lower = matched_keywords.lower()
-            if any(k in keyword_lower for k in ['large format', 'wide format', 'grand format', 'printing', 'print']):
-                industry_guess = 'Large-format printing'
-            elif any(k in keyword_lower for k in ['architectural graphics', 'window film', 'glass film', 'wall graphics']):
-                industry_guess = 'Architectural graphics'
-            elif any(k in keyword_lower for k in ['vehicle wrap', 'car wrap', 'fleet graphics', 'wraps']):
-                industry_guess = 'Vehicle wraps'
-            elif any(k in keyword_lower for k in ['signage', 'sign shop', 'wayfinding', 'sign systems']):
-                industry_guess = 'Commercial signage'
-            elif any(k in keyword_lower for k in ['industrial graphics', 'decals', 'labels', 'nameplates']):
-                industry_guess = 'Industrial graphics'
-            elif any(k in keyword_lower for k in ['graphics', 'printing', 'display']):
-                industry_guess = 'Signage/Graphics'
-        
-        pipeline_result = {
-            'company_name': company_name,
-            'domain': domain,
-            'company_blurb': company_blurb,
-            'source_url': source_url,
-            'industry_guess': industry_guess,
-            'fit_bucket': fit_bucket,
-            'score': score,
-            'fit_yes_no': fit_yes_no,  # Backward compatibility
-            'evidence_snippet': evidence_snippet[:120]  # Ensure max 120 chars
-        }
-        
-        results.append(pipeline_result)
-        
-        # Small delay to be respectful
-        time.sleep(REQUEST_DELAY)
-    
-    # Write output CSV
-    print(f"Writing results to {output_csv}...")
-    
-    output_columns = [
-        'company_name', 'domain', 'company_blurb', 'source_url', 'industry_guess',
-        'fit_bucket', 'score', 'evidence_snippet', 'fit_yes_no'
-    ]
-    
+    # Results go to a temp file that replaces output_csv only once every row
+    # is classified, so a failed run never leaves a partial output behind
+    tmp_csv = f"{output_csv}.tmp"
     try:
         os.makedirs(os.path.dirname(output_csv) if os.path.dirname(output_csv) else '.', exist_ok=True)
-        with open(output_csv, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=output_columns)
-            writer.writeheader()
-            writer.writerows(results)
+        output_file = open(tmp_csv, 'w', encoding='utf-8', newline='')
     except Exception as e:
         raise Exception(f"Error writing {output_csv}: {e}")
     
+    # Stream rows from the input CSV through the scorer (fanned out across
+    # processes for large inputs) and straight to the output CSV
+    bucket_counts = {'YES': 0, 'MAYBE': 0, 'NO': 0}
+    # Top DEBUG_TOP_N (score, -row_index, company_name, evidence) per bucket, only when debug
+    debug_top = {'MAYBE': [], 'NO': []}
+    start_time = time.time()
+    
+    workers = workers or CLASSIFY_WORKERS
+    if total_rows >= 2 * CLASSIFY_CHUNK_SIZE and workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = None
+    
+    try:
+        with output_file:
+            writer = csv.writer(output_file)
+            writer.writerow(OUTPUT_COLUMNS)
+            
+            for i, pipeline_result in enumerate(_classify_rows(_iter_input_rows(input_csv), executor), 1):
+                company_name = pipeline_result[0]
+                
+                # Progress indicator
+                if progress_callback:
+                    if (i & PROGRESS_MASK) == 0 or i == total_rows:
+                        progress_callback(i, total_rows)
+                else:
+                    elapsed = time.time() - start_time
+                    if i > 1:
+                        avg_time_per_row = elapsed / (i - 1)
+                        estimated_remaining = avg_time_per_row * (total_rows - i)
+                        print(f"[{i}/{total_rows} ({i*100//total_rows}%)] Processing: {company_name} | "
+                              f"ETA: {estimated_remaining/60:.1f} min")
+                    else:
+                        print(f"[{i}/{total_rows} ({i*100//total_rows}%)] Processing: {company_name}")
+                
+                writer.writerow(pipeline_result)
+                
+                fit_bucket = pipeline_result[5]
+                bucket_counts[fit_bucket] += 1
+                if debug and fit_bucket != 'YES':
+                    top = debug_top[fit_bucket]
+                    entry = (pipeline_result[6], -i, company_name, pipeline_result[7])
+                    if len(top) < DEBUG_TOP_N:
+                        heapq.heappush(top, entry)
+                    else:
+                        heapq.heappushpop(top, entry)
+        os.replace(tmp_csv, output_csv)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if os.path.exists(tmp_csv):
+            os.remove(tmp_csv)
+    
+    print(f"Wrote results to {output_csv}")
+    
     # Calculate summary
-    yes_count = sum(1 for r in results if r['fit_bucket'] == 'YES')
-    maybe_count = sum(1 for r in results if r['fit_bucket'] == 'MAYBE')
-    no_count = sum(1 for r in results if r['fit_bucket'] == 'NO')
+    yes_count = bucket_counts['YES']
+    maybe_count = bucket_counts['MAYBE']
+    no_count = bucket_counts['NO']
     
     print(f"Classification complete: {yes_count} YES, {maybe_count} MAYBE, {no_count} NO")
     
     # Debug output
     if debug:
         print("\n" + "=" * 60)
-        print("DEBUG: Top 20 MAYBE companies (by score):")
+        print(f"DEBUG: Top {DEBUG_TOP_N} MAYBE companies (by score):")
         print("=" * 60)
-        maybe_results = sorted([r for r in results if r['fit_bucket'] == 'MAYBE'], 
-                              key=lambda x: x.get('score', 0), reverse=True)[:20]
-        for r in maybe_results:
-            print(f"  [{r.get('score', 0)}] {r.get('company_name', 'Unknown')}: {r.get('evidence_snippet', '')}")
+        for score, _, company_name, evidence_snippet in sorted(debug_top['MAYBE'], reverse=True):
+            print(f"  [{score}] {company_name}: {evidence_snippet}")
         
         print("\n" + "=" * 60)
-        print("DEBUG: Top 20 NO companies (highest scores - borderline):")
+        print(f"DEBUG: Top {DEBUG_TOP_N} NO companies (highest scores - borderline):")
         print("=" * 60)
-        no_results = sorted([r for r in results if r['fit_bucket'] == 'NO'], 
-                           key=lambda x: x.get('score', 0), reverse=True)[:20]
-        for r in no_results:
-            print(f"  [{r.get('score', 0)}] {r.get('company_name', 'Unknown')}: {r.get('evidence_snippet', '')}")
+        for score, _, company_name, evidence_snippet in sorted(debug_top['NO'], reverse=True):
+            print(f"  [{score}] {company_name}: {evidence_snippet}")
     
     return {
-        'total': len(results),
+        'total': total_rows,
         'yes': yes_count,
         'maybe': maybe_count,
         'no': no_count
@@ -7,183 +7,21 @@ keyword matching of website content.
 """
 
 import csv
-import time
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-from typing import Optional, List, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict, Optional
 import sys
 
+# Fetch helpers and keyword lists are shared with industry_filter
+from industry_filter import (
+    TARGET_KEYWORDS,
+    NON_TARGET_KEYWORDS,
+    find_keywords,
+    determine_base_url,
+    fetch_company_pages,
+)
 
-# Configuration
-TIMEOUT = 15
-MAX_RETRIES = 3
-RETRY_DELAY = 1  # seconds
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-
-# Target keywords (case-insensitive substring match)
-TARGET_KEYWORDS = [
-    "signage", "sign shop", "wayfinding", "sign systems",
-    "large format", "wide format", "grand format",
-    "printing", "digital printing", "inkjet printing", "print shop",
-    "vehicle wrap", "car wrap", "fleet graphics", "wrap film",
-    "architectural graphics", "window film", "glass film", "wall graphics", "interior graphics",
-    "decals", "labels", "nameplates", "industrial graphics",
-    "protective film", "laminate", "overlaminate",
-    "display graphics", "exhibition graphics", "trade show graphics"
-]
-
-# Non-target keywords
-NON_TARGET_KEYWORDS = [
-    "software", "saas", "platform", "cloud",
-    "marketing agency", "branding agency", "design studio", "creative agency",
-    "association", "nonprofit", "foundation",
-    "university", "college", "school",
-    "dental", "medical", "clinic", "hospital",
-    "restaurant", "food service",
-    "logistics", "supply chain", "trucking", "freight"
-]
-
-# Additional pages to try (after homepage)
-ADDITIONAL_PAGES = ["/industries", "/solutions", "/applications", "/markets", "/products"]
-
-
-def fetch_url(url: str, retries: int = MAX_RETRIES) -> Optional[requests.Response]:
-    """
-    Fetch a URL with retries and backoff.
-    
-    Args:
-        url: URL to fetch
-        retries: Number of retry attempts
-        
-    Returns:
-        Response object if successful, None otherwise
-    """
-    headers = {"User-Agent": USER_AGENT}
-    
-    for attempt in range(retries):
-        try:
-            response = requests.get(url, headers=headers, timeout=TIMEOUT, allow_redirects=True)
-            if response.status_code == 200:
-                return response
-            elif response.status_code in [301, 302, 303, 307, 308]:
-                # Follow redirects are handled by allow_redirects=True
-                # But if we get a redirect status, we might want to check the final URL
-                continue
-        except requests.exceptions.RequestException as e:
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))  # Exponential backoff
-            else:
-                pass  # Final attempt failed
-    
-    return None
-
-
-def extract_text(html_content: str) -> str:
-    """
-    Extract visible text from HTML using BeautifulSoup.
-    Removes script, style, nav elements, and normalizes whitespace.
-    
-    Args:
-        html_content: HTML content as string
-        
-    Returns:
-        Normalized lowercase text
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    
-    # Remove script, style, nav, and other non-content elements
-    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'meta', 'link']):
-        element.decompose()
-    
-    # Get text and normalize
-    text = soup.get_text(separator=' ', strip=True)
-    
-    # Normalize whitespace and convert to lowercase
-    text = ' '.join(text.split())
-    text = text.lower()
-    
-    return text
-
-
-def find_keywords(text: str, keywords: List[str]) -> List[str]:
-    """
-    Find which keywords appear in the text (case-insensitive substring match).
-    
-    Args:
-        text: Text to search in
-        keywords: List of keywords to search for
-        
-    Returns:
-        List of matched keywords
-    """
-    matched = []
-    text_lower = text.lower()
-    
-    for keyword in keywords:
-        if keyword.lower() in text_lower:
-            matched.append(keyword)
-    
-    return matched
-
-
-def determine_base_url(website: Optional[str], matched_domain: Optional[str]) -> Optional[str]:
-    """
-    Determine the base URL to fetch.
-    Prefer website if it starts with http, else use matched_domain.
-    
-    Args:
-        website: Website URL (may be None or empty)
-        matched_domain: Matched domain (may be None or empty)
-        
-    Returns:
-        Base URL string or None
-    """
-    if website and website.strip().startswith(('http://', 'https://')):
-        return website.strip()
-    elif matched_domain and matched_domain.strip():
-        domain = matched_domain.strip()
-        # Remove any leading http:// or https:// if present
-        domain = domain.lstrip('http://').lstrip('https://').lstrip('/')
-        return f"https://{domain}/"
-    
-    return None
-
-
-def fetch_company_pages(base_url: str) -> List[Tuple[str, str]]:
-    """
-    Fetch up to 3 pages per company:
-    1. Homepage (base_url)
-    2-3. First 2 successful pages from additional pages list
-    
-    Args:
-        base_url: Base URL of the company
-        
-    Returns:
-        List of tuples (url, text_content) for successfully fetched pages
-    """
-    pages_content = []
-    
-    # Fetch homepage
-    response = fetch_url(base_url)
-    if response:
-        text = extract_text(response.text)
-        pages_content.append((base_url, text))
-    
-    # Try additional pages (stop after first 2 successful 200 responses)
-    successful_count = 0
-    for page_path in ADDITIONAL_PAGES:
-        if successful_count >= 2:
-            break
-        
-        full_url = urljoin(base_url.rstrip('/') + '/', page_path.lstrip('/'))
-        response = fetch_url(full_url)
-        if response:
-            text = extract_text(response.text)
-            pages_content.append((full_url, text))
-            successful_count += 1
-    
-    return pages_content
+# Number of companies fetched concurrently
+MAX_CONCURRENT_COMPANIES = 8
 
 
 def classify_company(pages_content: List[Tuple[str, str]]) -> Tuple[str, List[str], str, str]:
@@ -231,12 +69,29 @@ def classify_company(pages_content: List[Tuple[str, str]]) -> Tuple[str, List[st
         return ("NO", [], "", "no_keywords_found")
 
 
-def process_row(row: Dict[str, str]) -> Dict[str, str]:
+def fetch_pages(base_url: str) -> Tuple[List[Tuple[str, str]], str]:
+    """
+    Fetch a company's pages, capturing any error instead of raising.
+    
+    Args:
+        base_url: Base URL of the company
+        
+    Returns:
+        Tuple of (pages_content, error_message); error_message is "" on success
+    """
+    try:
+        return (fetch_company_pages(base_url), "")
+    except Exception as e:
+        return ([], str(e))
+
+
+def process_row(row: Dict[str, str], pages_by_url: Optional[Dict[str, Tuple[List[Tuple[str, str]], str]]] = None) -> Dict[str, str]:
     """
     Process a single row from the CSV.
     
     Args:
         row: Dictionary representing a CSV row
+        pages_by_url: Optional pre-fetched fetch_pages results keyed by base URL
         
     Returns:
         Dictionary with results
@@ -259,10 +114,13 @@ def process_row(row: Dict[str, str]) -> Dict[str, str]:
             'notes': 'no_valid_url'
         }
     
-    # Fetch pages
-    try:
-        pages_content = fetch_company_pages(base_url)
-    except Exception as e:
+    # Fetch pages (reuse the shared fetch when another row has the same domain)
+    if pages_by_url is not None and base_url in pages_by_url:
+        pages_content, error = pages_by_url[base_url]
+    else:
+        pages_content, error = fetch_pages(base_url)
+    
+    if error:
         return {
             'company_name': company_name,
             'matched_domain': matched_domain,
@@ -270,7 +128,7 @@ def process_row(row: Dict[str, str]) -> Dict[str, str]:
             'is_target_industry': 'NO',
             'matched_keywords': '',
             'evidence_url': '',
-            'notes': f'error: {str(e)[:50]}'
+            'notes': f'error: {error[:50]}'
         }
     
     # Classify
@@ -314,17 +172,24 @@ def main():
     print(f"Processing {len(rows_to_process)} rows...")
     print()
     
-    # Process each row
+    # Fetch each unique domain once, concurrently (each company is a different host)
+    base_urls = list(dict.fromkeys(
+        base_url for base_url in (
+            determine_base_url(row.get('website', ''), row.get('matched_domain', ''))
+            for row in rows_to_process
+        ) if base_url
+    ))
+    print(f"Fetching {len(base_urls)} unique domains...")
+    
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_COMPANIES) as executor:
+        pages_by_url = dict(zip(base_urls, executor.map(fetch_pages, base_urls)))
+    
+    # Classify every row from the shared fetch results
     results = []
     for i, row in enumerate(rows_to_process, 1):
-        company_name = row.get('company_name', 'Unknown')
-        print(f"[{i}/{len(rows_to_process)}] Processing: {company_name}")
-        
-        result = process_row(row)
+        result = process_row(row, pages_by_url)
+        print(f"[{i}/{len(rows_to_process)}] Processed: {result['company_name']}")
         results.append(result)
-        
-        # Small delay to be respectful
-        time.sleep(0.5)
     
     # Write output CSV
     print()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Network helpers shared by industry_filter.py and enrich_exhibitors.py.
+
+Kept free of heavy imports so either script can use them without loading
+the other.
+"""
+
+import socket
+
+_RESOLVED_HOSTS = set()  # Hosts host_resolves() has seen resolve
+
+
+def host_resolves(host: str) -> bool:
+    """
+    Check whether a host has a DNS record.
+
+    Only hosts that resolved are remembered: a failed lookup may be a
+    transient resolver error, so it is retried on the next call.
+
+    Args:
+        host: Hostname to look up (e.g., 'example.com')
+
+    Returns:
+        True if the host resolves, False otherwise
+    """
+    if host in _RESOLVED_HOSTS:
+        return True
+    try:
+        socket.getaddrinfo(host, None)
+    except (socket.gaierror, UnicodeError):
+        return False
+    _RESOLVED_HOSTS.add(host)
+    return True
@@ -20,6 +20,9 @@ USAGE:
     Skip specific steps:
         python pipeline.py --source-url "https://signexpo.org/..." --skip-step scrape --skip-step classify
     
+    Limit STEP 2 to 4 worker processes:
+        python pipeline.py --source-url "https://signexpo.org/..." --workers 4
+    
     Windows PowerShell - Set environment variable:
         $env:SERPER_API_KEY="your-api-key-here"
 
@@ -27,12 +30,13 @@ OUTPUTS:
     - outputs/scraped_companies.csv (STEP 1)
     - outputs/industry_filtered.csv (STEP 2)
     - outputs/enriched_yes_companies.csv (STEP 3)
-    - outputs/run_manifest.json (run metadata)
-    - outputs/cache_serper.json (Serper API cache)
+    - outputs/run_manifest.jsonl (run metadata, one line per completed step)
+    - outputs/cache_serper.db (Serper API cache, SQLite)
 
 FEATURES:
     - Idempotent steps: Skip if output exists and --skip-step is passed
     - Resume mode: Automatically skip completed steps
+    - Overlapped steps: When both run, STEP 2 classifies rows as STEP 1 emits them
     - Run manifest: Tracks run metadata, counts, and timing
     - Serper caching: Reduces API calls and costs
     - Fail-soft enrichment: Continues on individual company errors
@@ -43,16 +47,26 @@ import argparse
 import csv
 import json
 import logging
+import mmap
 import os
+import queue
+import re
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding/decoding (pip install orjson)
+    orjson = None
 
-# Import step modules
-import scrape_exhibitors
-import industry_filter
-import enrich_companies
+# Step modules (scrape_exhibitors, industry_filter, enrich_companies) are
+# imported inside the step methods so skipped steps cost nothing at startup
 
 # Configure logging
 logging.basicConfig(
@@ -69,8 +83,142 @@ OUTPUT_DIR = 'outputs'
 STEP1_OUTPUT = os.path.join(OUTPUT_DIR, 'scraped_companies.csv')
 STEP2_OUTPUT = os.path.join(OUTPUT_DIR, 'industry_filtered.csv')
 STEP3_OUTPUT = os.path.join(OUTPUT_DIR, 'enriched_yes_companies.csv')
-MANIFEST_FILE = os.path.join(OUTPUT_DIR, 'run_manifest.json')
-CACHE_FILE = os.path.join(OUTPUT_DIR, 'cache_serper.json')
+MANIFEST_FILE = os.path.join(OUTPUT_DIR, 'run_manifest.jsonl')
+# Pre-JSONL manifest (one JSON document), imported into MANIFEST_FILE once
+LEGACY_MANIFEST_FILE = os.path.join(OUTPUT_DIR, 'run_manifest.json')
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+# Run-level fields repeated on every manifest line
+MANIFEST_RUN_FIELDS = ('run_id', 'timestamp', 'source_url', 'limit')
+CACHE_FILE = os.path.join(OUTPUT_DIR, 'cache_serper.db')
+
+# STEP 1 output schema (fixed column order, same as industry_filter.INPUT_COLUMNS)
+STEP1_COLUMNS = ('company_name', 'domain', 'company_blurb', 'source_url')
+CSV_WRITE_BUFFER = 1 << 20
+
+# Overlapped STEP 1 -> STEP 2: rows classified per batch, bounded hand-off queue
+STREAM_BATCH_SIZE = 32
+STREAM_QUEUE_SIZE = 1024
+
+
+# Bytes scanned per slice when counting rows of a memory-mapped CSV
+COUNT_WINDOW = 1 << 20
+
+# A quoted CSV field (a doubled "" inside one splits into adjacent matches)
+_QUOTED_FIELD_RE = re.compile(rb'"[^"]*"')
+
+
+def _csv_count(path: str) -> int:
+    """Count data rows in a CSV without parsing it.
+    
+    Memory-maps the file and counts newlines in one C-level scan. Newlines
+    inside quoted fields (multi-line blurbs) are subtracted so they still
+    count as one row; that pass only runs when the file contains quotes.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # mmap.count() is 3.13+; count per window instead
+            lines = sum(mm[i:i + COUNT_WINDOW].count(b'\n') for i in range(0, len(mm), COUNT_WINDOW))
+            if mm[-1:] != b'\n':
+                lines += 1  # Last row without a trailing newline
+            if mm.find(b'"') != -1:
+                # finditer walks the fields one at a time instead of building a list of them
+                lines -= sum(match.group().count(b'\n') for match in _QUOTED_FIELD_RE.finditer(mm))
+    return max(lines - 1, 0)
+
+
+@contextmanager
+def _atomic_csv_writer(path: str):
+    """Open <path>.tmp for CSV writing and move it onto path only if the block succeeds.
+    
+    A crashed or interrupted step never leaves a partial output behind for
+    --resume to mistake for a completed one.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='', buffering=CSV_WRITE_BUFFER) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _csv_bucket_counts(path: str) -> Dict[str, int]:
+    """Tally YES/MAYBE/NO rows of a STEP 2 CSV in one streaming pass."""
+    counts = {'total': 0, 'yes': 0, 'maybe': 0, 'no': 0}
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        bucket_idx = header.index('fit_bucket') if 'fit_bucket' in header else None
+        yes_no_idx = header.index('fit_yes_no') if 'fit_yes_no' in header else None
+        for row in reader:
+            counts['total'] += 1
+            bucket = row[bucket_idx] if bucket_idx is not None and bucket_idx < len(row) else ''
+            yes_no = row[yes_no_idx] if yes_no_idx is not None and yes_no_idx < len(row) else ''
+            if bucket == 'YES' or yes_no == 'YES':
+                counts['yes'] += 1
+            elif bucket == 'MAYBE':
+                counts['maybe'] += 1
+            elif bucket == 'NO':
+                counts['no'] += 1
+    return counts
+
+
+def _log_progress(count: int, total: int):
+    """Log step progress (the step modules throttle how often this is called)."""
+    logger.info("Progress: %d/%d (%d%%)", count, total, count * 100 // total)
+
+
+def _ignore_progress(count: int, total: int):
+    """Progress callback used when INFO logging is disabled."""
+
+
+def _progress_callback():
+    """Progress callback for the step modules, a no-op when INFO is disabled."""
+    return _log_progress if logger.isEnabledFor(logging.INFO) else _ignore_progress
+
+
+def _import_legacy_manifest():
+    """Fold a legacy run_manifest.json into the JSONL step log, once.
+    
+    Each step of each old run becomes one line, placed ahead of any lines
+    logged since; the old file is then renamed to run_manifest.json.imported.
+    """
+    if not os.path.exists(LEGACY_MANIFEST_FILE):
+        return
+    try:
+        with open(LEGACY_MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            legacy = json.load(f)
+        lines = []
+        for run in legacy.get('runs', []):
+            for step_name, step_data in (run.get('steps') or {}).items():
+                record = {field: run.get(field) for field in MANIFEST_RUN_FIELDS}
+                record['step'] = step_name
+                record.update(step_data)
+                lines.append(_json_dumps(record) + b'\n')
+        
+        existing = b''
+        if os.path.exists(MANIFEST_FILE):
+            with open(MANIFEST_FILE, 'rb') as f:
+                existing = f.read()
+        tmp_path = f"{MANIFEST_FILE}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(lines) + existing)
+        os.replace(tmp_path, MANIFEST_FILE)
+        os.replace(LEGACY_MANIFEST_FILE, f"{LEGACY_MANIFEST_FILE}.imported")
+        logger.info("Imported %d step record(s) from legacy manifest %s", len(lines), LEGACY_MANIFEST_FILE)
+    except Exception as e:
+        logger.warning("Failed to import legacy manifest %s: %s", LEGACY_MANIFEST_FILE, e)
 
 
 class PipelineOrchestrator:
@@ -78,78 +226,86 @@ class PipelineOrchestrator:
     
     def __init__(self, source_url: str, limit: Optional[int] = None, 
                  skip_steps: Optional[Set[str]] = None, resume: bool = False,
-                 include_maybe: bool = False):
+                 include_maybe: bool = False, workers: Optional[int] = None, verbose: bool = False):
         self.source_url = source_url
         self.limit = limit
         self.skip_steps = skip_steps or set()
         self.resume = resume
         self.include_maybe = include_maybe
-        self.manifest = self._load_manifest()
+        self.workers = workers
+        self.verbose = verbose  # Log full tracebacks on failures
         self.run_id = self._generate_run_id()
+        self.started_at = datetime.now().isoformat()
+        self._skip_probes: Dict[str, Future] = {}
         
         # Ensure output directory exists
         os.makedirs(OUTPUT_DIR, exist_ok=True)
+        _import_legacy_manifest()
     
     def _generate_run_id(self) -> str:
         """Generate a unique run ID."""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         return f"run_{timestamp}"
     
-    def _load_manifest(self) -> Dict:
-        """Load existing manifest if available."""
-        if os.path.exists(MANIFEST_FILE):
-            try:
-                with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
-    
     def _save_manifest(self, step_name: str, step_data: Dict):
-        """Save step data to manifest."""
-        if 'runs' not in self.manifest:
-            self.manifest['runs'] = []
-        
-        # Find or create current run
-        current_run = None
-        for run in self.manifest['runs']:
-            if run.get('run_id') == self.run_id:
-                current_run = run
-                break
-        
-        if not current_run:
-            current_run = {
-                'run_id': self.run_id,
-                'timestamp': datetime.now().isoformat(),
-                'source_url': self.source_url,
-                'limit': self.limit,
-                'steps': {}
-            }
-            self.manifest['runs'].append(current_run)
-        
-        # Update step data
-        current_run['steps'][step_name] = {
+        """Append one step record to the manifest log."""
+        record = {
+            'run_id': self.run_id,
+            'timestamp': self.started_at,
+            'source_url': self.source_url,
+            'limit': self.limit,
+            'step': step_name,
             **step_data,
             'completed_at': datetime.now().isoformat()
         }
-        
-        # Save manifest
         try:
-            with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.manifest, f, indent=2)
+            with open(MANIFEST_FILE, 'ab') as f:
+                f.write(_json_dumps(record) + b'\n')
         except Exception as e:
-            logger.warning(f"Failed to save manifest: {e}")
+            logger.warning("Failed to save manifest: %s", e)
+    
+    def _will_skip(self, step_name: str, output_file: str) -> bool:
+        """Whether a step will be skipped (same rules as _should_skip_step, no logging)."""
+        return step_name in self.skip_steps or (self.resume and os.path.exists(output_file))
+    
+    def _start_skip_probes(self):
+        """Count the outputs of all steps that will be skipped, concurrently.
+        
+        The counts are pure file I/O, so reading the skipped steps' CSVs on
+        a thread pool overlaps them; each step's skip branch then collects
+        its result via _skip_probe.
+        """
+        probes = [
+            (step_name, output_file, counter)
+            for step_name, output_file, counter in (
+                ('scrape', STEP1_OUTPUT, _csv_count),
+                ('classify', STEP2_OUTPUT, _csv_bucket_counts),
+                ('enrich', STEP3_OUTPUT, _csv_count),
+            )
+            if self._will_skip(step_name, output_file)
+        ]
+        if not probes:
+            return
+        executor = ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix='skip-probe')
+        for step_name, output_file, counter in probes:
+            self._skip_probes[step_name] = executor.submit(counter, output_file)
+        executor.shutdown(wait=False)
+    
+    def _skip_probe(self, step_name: str, output_file: str, counter: Callable):
+        """Result of a skipped step's output count (started by _start_skip_probes if possible)."""
+        future = self._skip_probes.pop(step_name, None)
+        return future.result() if future is not None else counter(output_file)
     
     def _should_skip_step(self, step_name: str, output_file: str) -> bool:
         """Determine if a step should be skipped."""
         # Explicit skip
         if step_name in self.skip_steps:
-            logger.info(f"Step '{step_name}' explicitly skipped via --skip-step")
+            logger.info("Step '%s' explicitly skipped via --skip-step", step_name)
             return True
         
         # Resume mode: skip if output exists
         if self.resume and os.path.exists(output_file):
-            logger.info(f"Step '{step_name}' skipped (resume mode, output exists: {output_file})")
+            logger.info("Step '%s' skipped (resume mode, output exists: %s)", step_name, output_file)
             return True
         
         return False
@@ -162,45 +318,44 @@ class PipelineOrchestrator:
         logger.info("=" * 60)
         
         if self._should_skip_step(step_name, STEP1_OUTPUT):
-            # Load existing data
-            logger.info(f"Loading existing scraped data from {STEP1_OUTPUT}")
-            with open(STEP1_OUTPUT, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                companies = list(reader)
-            logger.info(f"Loaded {len(companies)} companies from existing file")
+            # Count existing rows
+            count = self._skip_probe(step_name, STEP1_OUTPUT, _csv_count)
+            logger.info("Found %d companies in existing file %s", count, STEP1_OUTPUT)
             return {
                 'status': 'skipped',
-                'count': len(companies),
+                'count': count,
                 'duration_seconds': 0
             }
         
+        import scrape_exhibitors
+        
         start_time = time.time()
         
         try:
-            # Run scraper
-            companies = scrape_exhibitors.run(self.source_url, limit=self.limit or 200)
-            
-            # Save to CSV
-            logger.info(f"Saving {len(companies)} companies to {STEP1_OUTPUT}")
-            with open(STEP1_OUTPUT, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=['company_name', 'domain', 'company_blurb', 'source_url'])
-                writer.writeheader()
-                writer.writerows(companies)
+            # Run scraper, writing companies to CSV as they are produced
+            logger.info("Writing scraped companies to %s", STEP1_OUTPUT)
+            count = 0
+            with _atomic_csv_writer(STEP1_OUTPUT) as f:
+                writer = csv.writer(f)
+                writer.writerow(STEP1_COLUMNS)
+                for company in scrape_exhibitors.stream(self.source_url, limit=self.limit or 200):
+                    writer.writerow(tuple(company.get(col, '') for col in STEP1_COLUMNS))
+                    count += 1
             
             duration = time.time() - start_time
             
             step_data = {
                 'status': 'completed',
-                'count': len(companies),
+                'count': count,
                 'duration_seconds': round(duration, 2)
             }
             self._save_manifest(step_name, step_data)
             
-            logger.info(f"STEP 1 completed: {len(companies)} companies scraped in {duration:.1f}s")
+            logger.info("STEP 1 completed: %d companies scraped in %.1fs", count, duration)
             return step_data
             
         except Exception as e:
-            logger.error(f"STEP 1 failed: {e}", exc_info=True)
+            logger.error("STEP 1 failed: %s: %s", type(e).__name__, e, exc_info=self.verbose)
             raise
     
     def step2_classify(self) -> Dict:
@@ -211,21 +366,15 @@ class PipelineOrchestrator:
         logger.info("=" * 60)
         
         if self._should_skip_step(step_name, STEP2_OUTPUT):
-            # Load existing data
-            logger.info(f"Loading existing classification data from {STEP2_OUTPUT}")
-            with open(STEP2_OUTPUT, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                results = list(reader)
-            yes_count = sum(1 for r in results if r.get('fit_bucket') == 'YES' or r.get('fit_yes_no') == 'YES')
-            maybe_count = sum(1 for r in results if r.get('fit_bucket') == 'MAYBE')
-            no_count = sum(1 for r in results if r.get('fit_bucket') == 'NO')
-            logger.info(f"Loaded {len(results)} companies ({yes_count} YES, {maybe_count} MAYBE, {no_count} NO) from existing file")
+            # Tally existing rows
+            counts = self._skip_probe(step_name, STEP2_OUTPUT, _csv_bucket_counts)
+            logger.info("Found %d companies (%d YES, %d MAYBE, %d NO) in existing file %s", counts['total'], counts['yes'], counts['maybe'], counts['no'], STEP2_OUTPUT)
             return {
                 'status': 'skipped',
-                'total': len(results),
-                'yes': yes_count,
-                'maybe': maybe_count,
-                'no': no_count,
+                'total': counts['total'],
+                'yes': counts['yes'],
+                'maybe': counts['maybe'],
+                'no': counts['no'],
                 'duration_seconds': 0
             }
         
@@ -233,20 +382,21 @@ class PipelineOrchestrator:
         if not os.path.exists(STEP1_OUTPUT):
             raise FileNotFoundError(f"STEP 1 output not found: {STEP1_OUTPUT}. Run STEP 1 first.")
         
+        import industry_filter
+        
         start_time = time.time()
         
         try:
             # Progress callback
-            def progress_callback(count, total):
-                if count % 10 == 0 or count == total:
-                    logger.info(f"Progress: {count}/{total} ({count*100//total}%)")
+            progress_callback = _progress_callback()
             
             # Run classifier
             counts = industry_filter.classify(
                 STEP1_OUTPUT,
                 STEP2_OUTPUT,
                 progress_callback=progress_callback,
-                debug=False
+                debug=False,
+                workers=self.workers
             )
             
             duration = time.time() - start_time
@@ -262,13 +412,150 @@ class PipelineOrchestrator:
             self._save_manifest(step_name, step_data)
             
             maybe_count = counts.get('maybe', 0)
-            logger.info(f"STEP 2 completed: {counts.get('yes', 0)} YES, {maybe_count} MAYBE, {counts.get('no', 0)} NO in {duration:.1f}s")
+            logger.info("STEP 2 completed: %d YES, %d MAYBE, %d NO in %.1fs", counts.get('yes', 0), maybe_count, counts.get('no', 0), duration)
             return step_data
             
         except Exception as e:
-            logger.error(f"STEP 2 failed: {e}", exc_info=True)
+            logger.error("STEP 2 failed: %s: %s", type(e).__name__, e, exc_info=self.verbose)
             raise
     
+    def _can_overlap_scrape_classify(self) -> bool:
+        """True when both STEP 1 and STEP 2 will run (nothing skipped or resumed)."""
+        return not (self._will_skip('scrape', STEP1_OUTPUT) or self._will_skip('classify', STEP2_OUTPUT))
+    
+    def step1_2_scrape_and_classify(self) -> Tuple[Dict, Dict]:
+        """STEP 1 + STEP 2 overlapped: classify companies as the scraper emits them.
+        
+        The scraper runs in a producer thread and hands rows over a bounded
+        queue; this thread writes each batch to the STEP 1 CSV, classifies it
+        and writes the results to the STEP 2 CSV. Once enough rows have arrived
+        to be worth it, batches are classified in worker processes.
+        
+        Returns:
+            Tuple of (STEP 1 step data, STEP 2 step data)
+        """
+        logger.info("=" * 60)
+        logger.info("STEP 1 + 2: SCRAPE EXHIBITORS -> INDUSTRY FIT CLASSIFICATION (overlapped)")
+        logger.info("=" * 60)
+        
+        import industry_filter
+        import scrape_exhibitors
+        
+        start_time = time.time()
+        handoff = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        done = object()
+        scrape_state = {'error': None, 'duration': 0.0}
+        
+        def produce():
+            try:
+                for company in scrape_exhibitors.stream(self.source_url, limit=self.limit or 200):
+                    handoff.put(company)
+            except BaseException as e:
+                scrape_state['error'] = e
+            finally:
+                scrape_state['duration'] = time.time() - start_time
+                handoff.put(done)
+                # Playwright is bound to this thread, so its browser is closed here
+                scrape_exhibitors.close_browser()
+        
+        def batches():
+            while True:
+                item = handoff.get()
+                if item is done:
+                    return
+                batch = [item]
+                while len(batch) < STREAM_BATCH_SIZE:
+                    try:
+                        item = handoff.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is done:
+                        yield batch
+                        return
+                    batch.append(item)
+                yield batch
+        
+        producer = threading.Thread(target=produce, name='scrape-producer', daemon=True)
+        producer.start()
+        
+        counts = {'YES': 0, 'MAYBE': 0, 'NO': 0}
+        scraped = 0
+        workers = self.workers or industry_filter.CLASSIFY_WORKERS
+        executor = None
+        pending = deque()
+        log_progress = logger.isEnabledFor(logging.INFO)
+        
+        try:
+            # STEP 1 is moved into place before STEP 2, so an interruption in
+            # between leaves STEP 2 to be redone on --resume rather than stale
+            with _atomic_csv_writer(STEP2_OUTPUT) as step2_file, \
+                 _atomic_csv_writer(STEP1_OUTPUT) as step1_file:
+                step1_writer = csv.writer(step1_file)
+                step1_writer.writerow(STEP1_COLUMNS)
+                step2_writer = csv.writer(step2_file)
+                step2_writer.writerow(industry_filter.OUTPUT_COLUMNS)
+                
+                def write_results(results):
+                    step2_writer.writerows(results)
+                    for result in results:
+                        counts[result[5]] += 1
+                
+                def drain(block: bool):
+                    while pending and (block or pending[0].done()):
+                        write_results(pending.popleft().result())
+                
+                for companies in batches():
+                    batch = [tuple(c.get(col, '') for col in STEP1_COLUMNS) for c in companies]
+                    step1_writer.writerows(batch)
+                    previous = scraped
+                    scraped += len(batch)
+                    
+                    if executor is None and workers > 1 and scraped >= 2 * industry_filter.CLASSIFY_CHUNK_SIZE:
+                        executor = ProcessPoolExecutor(max_workers=workers)
+                    
+                    if executor is not None:
+                        pending.append(executor.submit(industry_filter.classify_rows, batch))
+                        drain(block=False)
+                    else:
+                        write_results(industry_filter.classify_rows(batch))
+                    if log_progress and (scraped >> 4) != (previous >> 4):
+                        logger.info("Progress: %d companies scraped, %d classified", scraped, sum(counts.values()))
+                
+                drain(block=True)
+                
+                producer.join()
+                if scrape_state['error'] is not None:
+                    raise scrape_state['error']
+        except Exception as e:
+            logger.error("STEP 1 + 2 failed: %s: %s", type(e).__name__, e, exc_info=self.verbose)
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        duration = time.time() - start_time
+        
+        step1_data = {
+            'status': 'completed',
+            'count': scraped,
+            'duration_seconds': round(scrape_state['duration'], 2)
+        }
+        self._save_manifest('scrape', step1_data)
+        logger.info("STEP 1 completed: %d companies scraped in %.1fs", scraped, scrape_state['duration'])
+        
+        step2_data = {
+            'status': 'completed',
+            'total': scraped,
+            'yes': counts['YES'],
+            'maybe': counts['MAYBE'],
+            'no': counts['NO'],
+            'duration_seconds': round(duration, 2)
+        }
+        self._save_manifest('classify', step2_data)
+        logger.info("STEP 2 completed: %d YES, %d MAYBE, %d NO in %.1fs", counts['YES'], counts['MAYBE'], counts['NO'], duration)
+        
+        return step1_data, step2_data
+    
     def step3_enrich(self) -> Dict:
         """STEP 3: Enrich YES companies (and MAYBE if include_maybe=True)."""
         step_name = 'enrich'
@@ -280,17 +567,15 @@ class PipelineOrchestrator:
         logger.info("=" * 60)
         
         if self._should_skip_step(step_name, STEP3_OUTPUT):
-            # Load existing data
-            logger.info(f"Loading existing enrichment data from {STEP3_OUTPUT}")
-            with open(STEP3_OUTPUT, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                results = list(reader)
-            logger.info(f"Loaded {len(results)} enriched companies from existing file")
+            # Count existing rows
+            count = self._skip_probe(step_name, STEP3_OUTPUT, _csv_count)
+            logger.info("Found %d enriched companies in existing file %s", count, STEP3_OUTPUT)
             return {
                 'status': 'skipped',
-                'count': len(results),
+                'count': count,
                 'duration_seconds': 0,
                 'serper_calls': 0,
+                'serper_queries': 0,
                 'cache_hits': 0
             }
         
@@ -304,13 +589,13 @@ class PipelineOrchestrator:
             logger.warning("SERPER_API_KEY not set - STEP 3 will complete but skip enrichment")
             logger.warning("Companies will be saved with empty enrichment fields")
         
+        import enrich_companies
+        
         start_time = time.time()
         
         try:
             # Progress callback
-            def progress_callback(count, total):
-                if count % 5 == 0 or count == total:
-                    logger.info(f"Progress: {count}/{total} ({count*100//total}%)")
+            progress_callback = _progress_callback()
             
             # Run enricher (always enriches YES + MAYBE)
             stats = enrich_companies.enrich(
@@ -319,7 +604,8 @@ class PipelineOrchestrator:
                 api_key=api_key,
                 cache_file=CACHE_FILE,
                 progress_callback=progress_callback,
-                include_maybe=True  # Always True - YES + MAYBE are always enriched
+                include_maybe=True,  # Always True - YES + MAYBE are always enriched
+                verbose=self.verbose
             )
             
             duration = time.time() - start_time
@@ -331,18 +617,19 @@ class PipelineOrchestrator:
                 'revenue_ranges_found': stats.get('revenue_ranges_found', 0),
                 'decision_makers_found': stats.get('decision_makers_found', 0),
                 'serper_calls': stats.get('serper_calls', 0),
+                'serper_queries': stats.get('serper_queries', 0),
                 'cache_hits': stats.get('cache_hits', 0),
                 'duration_seconds': round(duration, 2)
             }
             self._save_manifest(step_name, step_data)
             
-            logger.info(f"STEP 3 completed: {stats.get('companies_processed', 0)} companies enriched in {duration:.1f}s")
+            logger.info("STEP 3 completed: %d companies enriched in %.1fs", stats.get('companies_processed', 0), duration)
             if api_key:
-                logger.info(f"  - Serper calls: {stats.get('serper_calls', 0)}, Cache hits: {stats.get('cache_hits', 0)}")
+                logger.info("  - Serper calls: %d (%d queries), Cache hits: %d", stats.get('serper_calls', 0), stats.get('serper_queries', 0), stats.get('cache_hits', 0))
             return step_data
             
         except Exception as e:
-            logger.error(f"STEP 3 failed: {e}", exc_info=True)
+            logger.error("STEP 3 failed: %s: %s", type(e).__name__, e, exc_info=self.verbose)
             raise
     
     def run(self):
@@ -350,21 +637,28 @@ class PipelineOrchestrator:
         logger.info("=" * 60)
         logger.info("PIPELINE ORCHESTRATOR")
         logger.info("=" * 60)
-        logger.info(f"Run ID: {self.run_id}")
-        logger.info(f"Source URL: {self.source_url}")
-        logger.info(f"Limit: {self.limit or 'unlimited'}")
-        logger.info(f"Resume mode: {self.resume}")
-        logger.info(f"Skip steps: {self.skip_steps if self.skip_steps else 'none'}")
+        logger.info("Run ID: %s", self.run_id)
+        logger.info("Source URL: %s", self.source_url)
+        logger.info("Limit: %s", self.limit or 'unlimited')
+        logger.info("Resume mode: %s", self.resume)
+        logger.info("Skip steps: %s", self.skip_steps if self.skip_steps else 'none')
         logger.info("")
         
         pipeline_start = time.time()
         
         try:
-            # STEP 1: Scrape
-            step1_result = self.step1_scrape()
+            # Resume/skip counts for skipped steps, read concurrently up front
+            self._start_skip_probes()
             
-            # STEP 2: Classify
-            step2_result = self.step2_classify()
+            if self._can_overlap_scrape_classify():
+                # STEP 1 + 2: Scrape and classify as rows stream in
+                step1_result, step2_result = self.step1_2_scrape_and_classify()
+            else:
+                # STEP 1: Scrape
+                step1_result = self.step1_scrape()
+                
+                # STEP 2: Classify
+                step2_result = self.step2_classify()
             
             # STEP 3: Enrich
             step3_result = self.step3_enrich()
@@ -376,21 +670,21 @@ class PipelineOrchestrator:
             logger.info("=" * 60)
             logger.info("PIPELINE COMPLETE")
             logger.info("=" * 60)
-            logger.info(f"Total duration: {total_duration:.1f}s")
-            logger.info(f"STEP 1: {step1_result.get('count', 0)} companies scraped")
+            logger.info("Total duration: %.1fs", total_duration)
+            logger.info("STEP 1: %d companies scraped", step1_result.get('count', 0))
             maybe_count = step2_result.get('maybe', 0)
-            logger.info(f"STEP 2: {step2_result.get('yes', 0)} YES, {maybe_count} MAYBE, {step2_result.get('no', 0)} NO")
-            logger.info(f"STEP 3: {step3_result.get('count', 0)} companies enriched")
+            logger.info("STEP 2: %d YES, %d MAYBE, %d NO", step2_result.get('yes', 0), maybe_count, step2_result.get('no', 0))
+            logger.info("STEP 3: %d companies enriched", step3_result.get('count', 0))
             logger.info("")
-            logger.info(f"Outputs:")
-            logger.info(f"  - {STEP1_OUTPUT}")
-            logger.info(f"  - {STEP2_OUTPUT}")
-            logger.info(f"  - {STEP3_OUTPUT}")
-            logger.info(f"  - {MANIFEST_FILE}")
+            logger.info("Outputs:")
+            logger.info("  - %s", STEP1_OUTPUT)
+            logger.info("  - %s", STEP2_OUTPUT)
+            logger.info("  - %s", STEP3_OUTPUT)
+            logger.info("  - %s", MANIFEST_FILE)
             logger.info("")
             
         except Exception as e:
-            logger.error(f"Pipeline failed: {e}", exc_info=True)
+            logger.error("Pipeline failed: %s: %s", type(e).__name__, e, exc_info=self.verbose)
             sys.exit(1)
 
 
@@ -414,6 +708,10 @@ def main():
                        help='Resume mode: automatically skip steps with existing outputs')
     parser.add_argument('--include-maybe', action='store_true',
                        help='Include MAYBE companies in enrichment (default: YES only)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for STEP 2 classification (default: CPU count, 1 = sequential)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Log full tracebacks for step and per-company errors')
     
     args = parser.parse_args()
     
@@ -426,7 +724,9 @@ def main():
         limit=limit,
         skip_steps=set(args.skip_steps) if args.skip_steps else None,
         resume=args.resume,
-        include_maybe=args.include_maybe
+        include_maybe=args.include_maybe,
+        workers=args.workers,
+        verbose=args.verbose
     )
     
     # Run pipeline
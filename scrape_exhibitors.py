@@ -7,19 +7,53 @@ Supports static scraping, API detection, and dynamic DOM scraping with paginatio
 """
 
 import argparse
+import atexit
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from html import unescape
+from itertools import islice
+from typing import Dict, List, Optional, Tuple, Any, Iterator, Union
 from urllib.parse import urljoin, urlparse, parse_qs
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright, Request
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # Optional: C-backed HTML parsing (pip install lxml)
+    HTML_PARSER = 'html.parser'
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional: faster directory page parsing (pip install selectolax)
+    LexborHTMLParser = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding/decoding (pip install orjson)
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: incremental parsing of large API responses (pip install ijson)
+    ijson = None
+
+try:
+    import httpx
+except ImportError:  # Optional: HTTP/2 static directory fetches (pip install "httpx[http2]")
+    httpx = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,26 +65,403 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_EXHIBITORS = 200
 MIN_RESULTS_FOR_STATIC = 10
 MAX_PAGINATION_PAGES = 10
+PAGE_FETCH_CONCURRENCY = 8  # Result pages fetched in parallel by static_scrape / api_fetch
+DIRECTORY_SCRAPE_CONCURRENCY = 4  # Discovered directories scraped in parallel (each may run a browser)
 COMPANY_NAME_MIN_LEN = 2
 COMPANY_NAME_MAX_LEN = 80
+BLURB_MAX_LEN = 240  # stream() truncates longer blurbs, ending them with '...'
 DEFAULT_OUTPUT_DIR = './outputs'
+# Results of static directory scrapes, reused while every page's ETag/Last-Modified is unchanged
+SCRAPE_CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR", os.path.join(DEFAULT_OUTPUT_DIR, '.scrape_cache'))
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+PAGE_LOAD_TIMEOUT_MS = 30000
+NETWORK_IDLE_TIMEOUT_MS = 5000  # Cap on the networkidle wait after DOMContentLoaded
+LAZY_LOAD_WAIT_MS = 1500
+CONTENT_WAIT_TIMEOUT_MS = 5000
+# Rendered exhibitor listings; page loads wait for one of these to appear
+CONTENT_SELECTOR = 'a[href*="exhibitor"], .exhibitor, [data-exhibitor]'
+
+# Requests aborted in Playwright contexts: only the HTML and its XHR/fetch calls matter
+BLOCKED_RESOURCE_TYPES = frozenset(['image', 'font', 'media', 'stylesheet'])
+BLOCKED_HOSTS = ('google-analytics', 'googletagmanager', 'doubleclick', 'hotjar', 'segment.io')
+
+# JSON codec for API request/response bodies (orjson when installed)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+# API responses at least this large are streamed with ijson (when installed)
+API_STREAM_MIN_BYTES = 256 * 1024
+# Response keys that hold the exhibitor list, in priority order (api_fetch)
+API_ITEM_KEYS = ['data', 'results', 'exhibitors', 'companies', 'items', 'list']
+API_ITEM_KEY_RANK = {key: rank for rank, key in enumerate(API_ITEM_KEYS)}
+# Errors raised when an API response body isn't valid JSON
+JSON_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
+
+# Pagination links in static directory pages (?page=N style query parameters)
+PAGE_PARAM_RE = re.compile(r'([?&](?:page|pg|pagenum|pagenumber|page_no)=)(\d+)', re.IGNORECASE)
+
+# <title> / first <h1> in raw HTML (extract_event_name), and tags within them
+TITLE_PATTERN = r'<title(?:\s[^>]*)?>(.*?)</title\s*>'
+H1_PATTERN = r'<h1(?:\s[^>]*)?>(.*?)</h1\s*>'
+TITLE_RE = re.compile(TITLE_PATTERN, re.IGNORECASE | re.DOTALL)
+H1_RE = re.compile(H1_PATTERN, re.IGNORECASE | re.DOTALL)
+# Same patterns for undecoded response bodies
+TITLE_BYTES_RE = re.compile(TITLE_PATTERN.encode(), re.IGNORECASE | re.DOTALL)
+H1_BYTES_RE = re.compile(H1_PATTERN.encode(), re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r'<[^>]*>')
+
+# Sentence boundaries used to split a name from its blurb
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]\s+')
+
+# Link href / text patterns that suggest an exhibitor directory (discover_directory_links)
+DIRECTORY_URL_PATTERNS = [re.compile(pattern) for pattern in [
+    'exhibitor',
+    'directory',
+    'gallery',
+    'who.*exhibit',
+    'exhibiting',
+    'vendor',
+    'booth.*list'
+]]
+DIRECTORY_TEXT_PATTERNS = [re.compile(pattern) for pattern in [
+    'exhibitor',
+    'directory',
+    'who.*exhibit',
+    'exhibiting',
+    'vendor',
+    'booth'
+]]
+
+# In-page extraction for playwright_dom_scrape: returns only the per-element
+# fields the name/blurb strategies need instead of serializing the whole DOM.
+# "text" mirrors BeautifulSoup's get_text(strip=True) (stripped text nodes
+# joined without a separator).
+DOM_EXTRACT_JS = """
+({selectors, linkKeywords, nameAttrs, nameSelector, descSelector}) => {
+    const strippedText = (node) => {
+        const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        while (walker.nextNode()) {
+            const value = walker.currentNode.nodeValue.trim();
+            if (value) parts.push(value);
+        }
+        return parts.join('');
+    };
+    const describe = (node) => {
+        const nameElem = node.querySelector(nameSelector);
+        const descElem = node.querySelector(descSelector);
+        return {
+            text: strippedText(node),
+            attrs: Object.fromEntries(nameAttrs.map((attr) => [attr, node.getAttribute(attr)])),
+            name: nameElem ? strippedText(nameElem) : null,
+            desc: descElem ? strippedText(descElem) : null,
+        };
+    };
+    // One walk with the combined selector list first: most pages match none
+    // of the selectors, and then the per-selector walks can be skipped
+    if (document.querySelector(selectors.join(', '))) {
+        for (const selector of selectors) {
+            const nodes = document.querySelectorAll(selector);
+            if (nodes.length) {
+                return {selector, items: Array.from(nodes, describe)};
+            }
+        }
+    }
+    // No specific selector: links with exhibitor-related href/text
+    const links = Array.from(document.querySelectorAll('a[href]')).filter((node) => {
+        const haystack = (node.getAttribute('href') + ' ' + node.textContent).toLowerCase();
+        return linkKeywords.some((keyword) => haystack.includes(keyword));
+    });
+    return {selector: null, items: links.map(describe)};
+}
+"""
+
+# Exhibitor element selectors, in priority order: the first one that matches is used
+STATIC_EXHIBITOR_SELECTORS = [
+    'a[href*="exhibitor"]',
+    'a[href*="company"]',
+    '.exhibitor',
+    '.exhibitor-item',
+    '.company',
+    '.company-name',
+    '[data-exhibitor]',
+    '[data-company]',
+]
+# All of them as one selector list, to check a page for any match in one walk
+STATIC_EXHIBITOR_SELECTOR = ', '.join(STATIC_EXHIBITOR_SELECTORS)
+# Fallback when no exhibitor selector matches: links whose href mentions one of these
+LINK_FALLBACK_KEYWORDS = ['exhibitor', 'company', 'vendor', 'booth']
+LINK_FALLBACK_SELECTOR = ', '.join(f'a[href*="{keyword}" i]' for keyword in LINK_FALLBACK_KEYWORDS)
+DOM_EXHIBITOR_SELECTORS = [
+    'a[href*="exhibitor"]',
+    '.exhibitor',
+    '.exhibitor-item',
+    '.company',
+    '[data-exhibitor]',
+    'article',
+    '.card',
+    '.listing-item'
+]
+# Links the DOM scrape falls back to when their href or text mentions one of these
+DOM_LINK_KEYWORDS = ['exhibitor', 'company', 'vendor']
+# "Next page" controls tried in order by playwright_dom_scrape
+NEXT_PAGE_SELECTORS = [
+    'button:has-text("Next")',
+    'a:has-text("Next")',
+    '[aria-label*="next" i]',
+    '.next',
+    '.pagination-next',
+    'button[class*="next"]',
+    'a[class*="next"]'
+]
+
+# Element attributes that may carry the company name
+STATIC_NAME_ATTRS = ['aria-label', 'title', 'data-name', 'data-company']
+DOM_NAME_ATTRS = ['aria-label', 'title', 'data-name']
+# Child elements holding the company name / description (first match in document order)
+STATIC_NAME_SELECTOR = 'h1, h2, h3, h4, .name, .company-name, [class*="name"]'
+STATIC_DESC_SELECTOR = 'p, .description, .blurb, [class*="desc"]'
+DOM_NAME_SELECTOR = 'h1, h2, h3, h4, .name, [class*="name"]'
+DOM_DESC_SELECTOR = 'p, .description, [class*="desc"]'
+
+# API item fields holding the company name / description, in priority order
+API_NAME_FIELDS = ['name', 'companyName', 'company_name', 'exhibitorName', 'title', 'company']
+API_DESC_FIELDS = ['description', 'blurb', 'summary', 'tagline', 'about', 'bio']
+# Query parameter names api_fetch paginates with (matched case-insensitively)
+API_PAGE_PARAMS = ['page', 'pagenum', 'pagenumber', 'offset', 'start']
+
+# Network requests playwright_detect_api treats as a candidate exhibitor API
+API_URL_RE = re.compile(r'api|exhibitor|company|gallery|list|search', re.IGNORECASE)
+JSON_URL_RE = re.compile(r'json', re.IGNORECASE)
+API_RESOURCE_TYPES = frozenset(['fetch', 'xhr'])
+
+# Pipeline-format filters (stream): navigation entries, and names that read like descriptions
+NON_COMPANY_RE = re.compile(r'exhibitor search|all exhibitors|search|filter')
+# Words (and adjacent word pairs) that mark a name as really being a description
+DESCRIPTION_TOKENS = frozenset({'delivers', 'provides', 'specializes'})
+DESCRIPTION_BIGRAMS = frozenset({('is', 'a'), ('are', 'a')})
+
+# URLs of discovery pages (e.g. the ASI trade show guide) that link out to directories
+DISCOVERY_URL_RE = re.compile(r'asicentral\.com|trade.*show.*planning')
+
+# Runs of anything but lowercase ASCII letters/digits, replaced by '-' in filename slugs
+SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+# Words around a link that confirm it points at an exhibitor directory
+DIRECTORY_CONTEXT_KEYWORDS = ['exhibitor', 'directory', 'vendor', 'booth']
 
 # Metadata keywords that indicate non-company-name content
 METADATA_KEYWORDS = ['booth', 'stand', 'hall', 'location', 'category']
+# Single-pass, case-insensitive substring match for any metadata keyword
+METADATA_RE = re.compile('|'.join(map(re.escape, METADATA_KEYWORDS)), re.IGNORECASE)
 
 
-def extract_event_name(url: str, html: Optional[str] = None) -> str:
+def _create_session() -> requests.Session:
     """
-    Extract event name from URL or HTML content.
+    Create the HTTP session shared by every directory/API fetch in this module.
     
-    Args:
-        url: The exhibitor directory URL
-        html: Optional HTML content to parse
-        
-    Returns:
-        Event name as string
+    Keep-alive pooling means paginated fetches against the same host reuse
+    connections instead of paying a TCP+TLS handshake per page.
     """
-    # Try to extract from URL first
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+SESSION = _create_session()
+
+
+def _create_page_client() -> Any:
+    """
+    Create the client used for static page GETs: discovery pages, directory
+    pages and the scrape cache's conditional GETs.
+    
+    Prefers an HTTP/2 httpx client, so the pages of a directory and discovered
+    directories on the same host multiplex over one connection; falls back to
+    SESSION when httpx or its h2 extra isn't installed. Both expose the
+    get(url, headers=..., timeout=...), raise_for_status(), status_code,
+    headers and content API used here.
+    """
+    if httpx is not None:
+        try:
+            return httpx.Client(
+                http2=True,
+                headers={'User-Agent': USER_AGENT},
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+        except ImportError:
+            pass  # h2 not installed
+    return SESSION
+
+
+PAGE_CLIENT = _create_page_client()
+
+# Per-thread Playwright driver + browser (sync Playwright objects are thread-bound)
+_playwright_state = threading.local()
+
+
+def close_browser():
+    """
+    Close this thread's browser and stop its Playwright driver, if started.
+    
+    Sync Playwright only works on the thread that started it, so this must
+    run there: the main thread's browser is closed at interpreter exit, and
+    any other thread that scrapes must call this when it is done.
+    """
+    browser = getattr(_playwright_state, 'browser', None)
+    playwright = getattr(_playwright_state, 'playwright', None)
+    _playwright_state.browser = None
+    _playwright_state.playwright = None
+    if browser is not None:
+        try:
+            browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+    if playwright is not None:
+        try:
+            playwright.stop()
+        except Exception as e:
+            logger.warning(f"Error stopping Playwright: {e}")
+
+
+def get_browser() -> Any:
+    """
+    Return this thread's shared headless Chromium, launching it on first use.
+    
+    Scrapes open (and close) their own context on it, so the ~1-2s browser
+    cold start is paid once per thread instead of once per scrape. Threads
+    other than the main thread must call close_browser() when done.
+    """
+    browser = getattr(_playwright_state, 'browser', None)
+    if browser is not None and browser.is_connected():
+        return browser
+    
+    playwright = getattr(_playwright_state, 'playwright', None)
+    if playwright is None:
+        playwright = sync_playwright().start()
+        _playwright_state.playwright = playwright
+        if threading.current_thread() is threading.main_thread():
+            # atexit handlers run on the main thread, which owns this driver
+            atexit.register(close_browser)
+    
+    browser = playwright.chromium.launch(headless=True)
+    _playwright_state.browser = browser
+    return browser
+
+
+def _route_request(route: Any):
+    """Abort images/fonts/media/stylesheets and analytics calls; continue the rest."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+        return
+    url = request.url
+    if any(host in url for host in BLOCKED_HOSTS):
+        route.abort()
+        return
+    route.continue_()
+
+
+def _new_context() -> Any:
+    """Open a browser context on the shared browser with heavy resources blocked."""
+    context = get_browser().new_context()
+    context.route('**/*', _route_request)
+    return context
+
+
+def _load_directory_page(page: Any, url: str):
+    """
+    Navigate to a directory page and wait until its listing has rendered.
+    
+    Waits for DOMContentLoaded, then at most NETWORK_IDLE_TIMEOUT_MS for the
+    network to settle (ad/analytics-heavy sites may never go idle), scrolls to
+    trigger lazy loading, and finally gates on CONTENT_SELECTOR appearing.
+    """
+    page.goto(url, wait_until='domcontentloaded', timeout=PAGE_LOAD_TIMEOUT_MS)
+    try:
+        page.wait_for_load_state('networkidle', timeout=NETWORK_IDLE_TIMEOUT_MS)
+    except Exception:
+        logger.debug(f"Network not idle after {NETWORK_IDLE_TIMEOUT_MS}ms, continuing: {url}")
+    page.evaluate("window.scrollBy(0, window.innerHeight * 3)")
+    page.wait_for_timeout(LAZY_LOAD_WAIT_MS)
+    try:
+        page.wait_for_selector(CONTENT_SELECTOR, timeout=CONTENT_WAIT_TIMEOUT_MS)
+    except Exception:
+        logger.debug(f"No exhibitor content selector matched on {url}")
+
+
+def _parse_html(html: Union[str, bytes]) -> Any:
+    """
+    Parse a directory page with selectolax when installed, else BeautifulSoup.
+    
+    Raw response bytes are handed to the parser as-is (BeautifulSoup sniffs
+    the encoding), skipping a separate decode to str.
+    """
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def _select(node: Any, selector: str) -> List[Any]:
+    """All elements under node matching a CSS selector, in document order."""
+    if LexborHTMLParser is not None:
+        nodes = node.css(selector)
+        # Lexbor also matches node itself (BeautifulSoup only searches
+        # descendants); parsed documents have no mem_id and can't self-match
+        self_id = getattr(node, 'mem_id', None)
+        if ',' not in selector and self_id is None:
+            return nodes
+        # Lexbor returns an element once per selector in the list that it matches
+        unique = []
+        seen = {self_id}
+        for found in nodes:
+            if found.mem_id not in seen:
+                seen.add(found.mem_id)
+                unique.append(found)
+        return unique
+    return node.select(selector)
+
+
+def _select_first(node: Any, selector: str) -> Any:
+    """First element under node matching a CSS selector, or None."""
+    if LexborHTMLParser is not None:
+        found = node.css_first(selector)
+        self_id = getattr(node, 'mem_id', None)
+        if found is not None and self_id is not None and found.mem_id == self_id:
+            # Lexbor matched node itself; BeautifulSoup only searches descendants
+            found = next((n for n in node.css(selector) if n.mem_id != self_id), None)
+        return found
+    return node.select_one(selector)
+
+
+def _node_text(node: Any, strip: bool = True) -> str:
+    """Text content of an element (BeautifulSoup get_text semantics)."""
+    if LexborHTMLParser is not None:
+        return node.text(strip=strip)
+    return node.get_text(strip=strip)
+
+
+def _node_attr(node: Any, name: str) -> Optional[str]:
+    """Attribute value of an element, or None when absent or valueless."""
+    if LexborHTMLParser is not None:
+        return node.attributes.get(name)
+    return node.get(name)
+
+
+@lru_cache(maxsize=256)
+def _event_name_from_url(url: str) -> Optional[str]:
+    """Event name derived from the URL alone (subdomain or first path part), or None."""
     parsed = urlparse(url)
     hostname = parsed.netloc.lower()
     
@@ -69,14 +480,43 @@ def extract_event_name(url: str, html: Optional[str] = None) -> str:
         if event_part and len(event_part) > 2:
             return event_part
     
+    return None
+
+
+def _tag_text(fragment: Union[str, bytes]) -> str:
+    """Text of an HTML fragment: tags dropped, each text run stripped, entities decoded."""
+    if isinstance(fragment, bytes):
+        fragment = fragment.decode('utf-8', errors='replace')
+    return ''.join(unescape(part).strip() for part in TAG_RE.split(fragment))
+
+
+def extract_event_name(url: str, html: Optional[Union[str, bytes]] = None) -> str:
+    """
+    Extract event name from URL or HTML content.
+    
+    The URL-derived name is memoized per URL; the HTML fallback reads <title>
+    or the first <h1> with a regex rather than parsing the whole page.
+    
+    Args:
+        url: The exhibitor directory URL
+        html: Optional HTML content to parse (str, or raw UTF-8 bytes)
+        
+    Returns:
+        Event name as string
+    """
+    # Try to extract from URL first
+    event_name = _event_name_from_url(url)
+    if event_name:
+        return event_name
+    
     # Try to extract from HTML if provided
     if html:
         try:
-            soup = BeautifulSoup(html, 'html.parser')
             # Look for common event name patterns
-            title_tag = soup.find('title')
-            if title_tag:
-                title_text = title_tag.get_text(strip=True)
+            is_bytes = isinstance(html, bytes)
+            title_match = (TITLE_BYTES_RE if is_bytes else TITLE_RE).search(html)
+            if title_match:
+                title_text = _tag_text(title_match.group(1))
                 # Extract meaningful part
                 if 'exhibitor' in title_text.lower():
                     parts = title_text.split('-')
@@ -85,13 +525,14 @@ def extract_event_name(url: str, html: Optional[str] = None) -> str:
                 return title_text.split('|')[0].strip()
             
             # Look for h1 or event name in meta tags
-            h1 = soup.find('h1')
-            if h1:
-                return h1.get_text(strip=True)[:100]
+            h1_match = (H1_BYTES_RE if is_bytes else H1_RE).search(html)
+            if h1_match:
+                return _tag_text(h1_match.group(1))[:100]
         except Exception as e:
             logger.debug(f"Error extracting event name from HTML: {e}")
     
     # Fallback: use hostname or path
+    hostname = urlparse(url).netloc.lower()
     if hostname and hostname != 'www':
         return hostname.split('.')[0].upper()
     
@@ -122,13 +563,11 @@ def normalize_company_name(raw: str) -> Optional[str]:
         return None
     
     # Check for metadata keywords (case-insensitive)
-    cleaned_lower = cleaned.lower()
-    for keyword in METADATA_KEYWORDS:
-        if keyword in cleaned_lower:
-            return None
+    if METADATA_RE.search(cleaned):
+        return None
     
     # Check if it looks like a sentence (ends with punctuation and is long)
-    if len(cleaned) > 30 and cleaned.rstrip().endswith(('.', '!', '?')):
+    if len(cleaned) > 30 and cleaned[-1] in '.!?':
         return None
     
     # Check if it's all caps and too long (might be metadata)
@@ -164,15 +603,16 @@ def split_name_and_blurb(raw_text: str) -> Tuple[Optional[str], Optional[str]]:
             blurb = blurb if blurb and len(blurb) > 10 else None
             return name, blurb
     
-    # Try splitting by sentence boundaries
-    sentences = re.split(r'[.!?]\s+', cleaned)
-    if len(sentences) > 1:
-        # First sentence might be the name
-        name = normalize_company_name(sentences[0])
-        if name and len(name) < 60:  # Names are usually shorter
-            blurb = '. '.join(sentences[1:]).strip()
-            blurb = blurb if blurb and len(blurb) > 10 else None
-            return name, blurb
+    # Try splitting by sentence boundaries (bare names have no terminator: skip the regex)
+    if '.' in cleaned or '!' in cleaned or '?' in cleaned:
+        sentences = SENTENCE_SPLIT_RE.split(cleaned)
+        if len(sentences) > 1:
+            # First sentence might be the name
+            name = normalize_company_name(sentences[0])
+            if name and len(name) < 60:  # Names are usually shorter
+                blurb = '. '.join(sentences[1:]).strip()
+                blurb = blurb if blurb and len(blurb) > 10 else None
+                return name, blurb
     
     # Try splitting by length - if text is very long, first part is likely name
     if len(cleaned) > 80:
@@ -194,9 +634,189 @@ def split_name_and_blurb(raw_text: str) -> Tuple[Optional[str], Optional[str]]:
     return name, None
 
 
+def _add_if_new(seen: set, name: str) -> Optional[str]:
+    """
+    Record a company name in a case-insensitive seen set.
+    
+    The key is interned: names recur across pages and directories, so the seen
+    sets and exhibitors' '_name_lower' keys share one string per name.
+    
+    Returns:
+        The lowercased name if it was new (and is now recorded), None for a duplicate
+    """
+    key = sys.intern(name.lower())
+    if key in seen:
+        return None
+    seen.add(key)
+    return key
+
+
+def _extend_unique(out: List[Dict[str, Any]], seen: set, items: List[Dict[str, Any]],
+                   max_results: int) -> bool:
+    """
+    Append exhibitors whose names are not yet in seen, stopping at max_results.
+    
+    Returns:
+        True once out holds max_results exhibitors
+    """
+    for item in items:
+        if len(out) >= max_results:
+            break
+        name_lower = item['_name_lower']
+        if name_lower not in seen:
+            seen.add(name_lower)
+            out.append(item)
+    return len(out) >= max_results
+
+
+def _public_fields(exhibitor: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop internal bookkeeping keys (leading underscore) before output."""
+    return {k: v for k, v in exhibitor.items() if not k.startswith('_')}
+
+
+def _extract_static_exhibitors(soup: Any, event_name: str, exhibitors: List[Dict[str, Any]],
+                               seen_names: set, max_results: int):
+    """
+    Extract exhibitors from one parsed directory page, appending new ones.
+    
+    Args:
+        soup: Parsed directory page (from _parse_html)
+        event_name: Event name recorded on each exhibitor
+        exhibitors: List to append exhibitors to
+        seen_names: Lowercased names already collected (updated in place)
+        max_results: Stop once exhibitors reaches this many entries
+    """
+    # Common patterns for exhibitor listings: the first selector that matches
+    # wins. One walk with the combined list skips them all when none match.
+    elements = []
+    has_candidates = _select_first(soup, STATIC_EXHIBITOR_SELECTOR) is not None
+    for selector in STATIC_EXHIBITOR_SELECTORS if has_candidates else ():
+        found = _select(soup, selector)
+        if found:
+            elements = found
+            logger.info(f"Found {len(elements)} elements with selector: {selector}")
+            break
+    
+    # If no specific selector worked, try broader patterns
+    if not elements:
+        # Look for any links that might be exhibitor links (href match done by the parser)
+        elements = _select(soup, LINK_FALLBACK_SELECTOR)
+    
+    for element in elements:
+        if len(exhibitors) >= max_results:
+            break
+            
+        # Try multiple extraction strategies
+        company_name = None
+        company_blurb = None
+        
+        # Strategy 1: Get text from anchor or element
+        text = _node_text(element)
+        if text:
+            company_name, company_blurb = split_name_and_blurb(text)
+        
+        # Strategy 2: Check for dedicated name attributes/elements
+        if not company_name:
+            # Check aria-label, title, data attributes
+            for attr in STATIC_NAME_ATTRS:
+                attr_value = _node_attr(element, attr)
+                if attr_value:
+                    company_name = normalize_company_name(attr_value)
+                    if company_name:
+                        break
+        
+        # Strategy 3: Look for child elements with name
+        if not company_name:
+            name_elem = _select_first(element, STATIC_NAME_SELECTOR)
+            if name_elem:
+                name_text = _node_text(name_elem)
+                company_name = normalize_company_name(name_text)
+                
+                # Look for description in sibling or parent
+                desc_elem = _select_first(element, STATIC_DESC_SELECTOR)
+                if desc_elem:
+                    company_blurb = _node_text(desc_elem)
+                    if len(company_blurb) < 10:
+                        company_blurb = None
+        
+        # Validate and add
+        if company_name:
+            name_lower = _add_if_new(seen_names, company_name)
+            if name_lower:
+                exhibitors.append({
+                    'event_name': event_name,
+                    'company_name': company_name,
+                    'company_blurb': company_blurb if company_blurb and len(company_blurb) > 10 else None,
+                    '_name_lower': name_lower
+                })
+
+
+def _find_page_urls(soup: Any, url: str) -> List[str]:
+    """
+    Find the further result pages of a paginated directory (?page=N links).
+    
+    The highest-numbered pagination link on the same host is used as a
+    template, so "1 2 3 ... 12" style pagers yield every page, capped at
+    MAX_PAGINATION_PAGES.
+    
+    Args:
+        soup: Parsed first directory page
+        url: URL of the first page
+        
+    Returns:
+        URLs of pages 2..N, in page order
+    """
+    host = urlparse(url).netloc
+    template = None
+    last_page = 1
+    for link in _select(soup, 'a[href]'):
+        href = urljoin(url, _node_attr(link, 'href') or '')
+        match = PAGE_PARAM_RE.search(href)
+        if not match or urlparse(href).netloc != host:
+            continue
+        page = int(match.group(2))
+        if page > last_page:
+            last_page = page
+            template = (href, match)
+    
+    if template is None:
+        return []
+    href, match = template
+    last_page = min(last_page, MAX_PAGINATION_PAGES)
+    return [
+        href[:match.start(2)] + str(page) + href[match.end(2):]
+        for page in range(2, last_page + 1)
+    ]
+
+
+def _fetch_page(page_url: str) -> Any:
+    """Fetch one directory result page, returning None on failure."""
+    try:
+        response = PAGE_CLIENT.get(page_url, timeout=30)
+        response.raise_for_status()
+        return response
+    except Exception as e:
+        logger.warning(f"Failed to fetch directory page {page_url}: {e}")
+        return None
+
+
+def _conditional_headers(response: Any) -> Optional[Dict[str, str]]:
+    """Return the request headers that revalidate a response (None if it has no ETag/Last-Modified)."""
+    etag = response.headers.get('ETag')
+    if etag:
+        return {'If-None-Match': etag}
+    last_modified = response.headers.get('Last-Modified')
+    if last_modified:
+        return {'If-Modified-Since': last_modified}
+    return None
+
+
 def static_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -> List[Dict[str, Any]]:
     """
-    Attempt static scraping using requests + BeautifulSoup.
+    Attempt static scraping using PAGE_CLIENT + selectolax/BeautifulSoup.
+    
+    When the directory paginates with ?page=N links, the remaining result
+    pages are fetched in parallel and merged in page order.
     
     Args:
         url: Exhibitor directory URL
@@ -205,106 +825,64 @@ def static_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -> List[D
     Returns:
         List of exhibitor dictionaries
     """
+    return list(_iter_static_exhibitors(url, max_results))
+
+
+def _iter_static_exhibitors(url: str, max_results: int,
+                            page_validators: Optional[Dict[str, Any]] = None,
+                            response: Any = None) -> Iterator[Dict[str, Any]]:
+    """
+    Statically scrape a directory (see static_scrape), yielding exhibitors page by page.
+    
+    Args:
+        url: Exhibitor directory URL
+        max_results: Maximum number of exhibitors to yield
+        page_validators: If given, filled with {page URL: conditional-GET headers}
+            for every page the results came from (None for a page that failed or
+            has no ETag/Last-Modified)
+        response: Already fetched response for url, if any
+    """
     logger.info(f"Attempting static scrape of {url}")
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=30)
+        if response is None:
+            response = PAGE_CLIENT.get(url, timeout=30)
         response.raise_for_status()
+        if page_validators is not None:
+            page_validators[url] = _conditional_headers(response)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        event_name = extract_event_name(url, response.text)
+        soup = _parse_html(response.content)
+        event_name = extract_event_name(url, response.content)
         
         exhibitors = []
         seen_names = set()
+        _extract_static_exhibitors(soup, event_name, exhibitors, seen_names, max_results)
+        yield from exhibitors
         
-        # Common patterns for exhibitor listings
-        # Look for links, divs, or list items that might contain exhibitor info
-        selectors = [
-            'a[href*="exhibitor"]',
-            'a[href*="company"]',
-            '.exhibitor',
-            '.exhibitor-item',
-            '.company',
-            '.company-name',
-            '[data-exhibitor]',
-            '[data-company]',
-        ]
-        
-        elements = []
-        for selector in selectors:
-            found = soup.select(selector)
-            if found:
-                elements = found
-                logger.info(f"Found {len(elements)} elements with selector: {selector}")
-                break
-        
-        # If no specific selector worked, try broader patterns
-        if not elements:
-            # Look for any links that might be exhibitor links
-            all_links = soup.find_all('a', href=True)
-            # Filter to likely exhibitor links
-            elements = [e for e in all_links if any(
-                keyword in e.get('href', '').lower() 
-                for keyword in ['exhibitor', 'company', 'vendor', 'booth']
-            )]
-        
-        for element in elements:
-            if len(exhibitors) >= max_results:
-                break
-                
-            # Try multiple extraction strategies
-            company_name = None
-            company_blurb = None
-            
-            # Strategy 1: Get text from anchor or element
-            text = element.get_text(strip=True)
-            if text:
-                company_name, company_blurb = split_name_and_blurb(text)
-            
-            # Strategy 2: Check for dedicated name attributes/elements
-            if not company_name:
-                # Check aria-label, title, data attributes
-                for attr in ['aria-label', 'title', 'data-name', 'data-company']:
-                    attr_value = element.get(attr)
-                    if attr_value:
-                        company_name = normalize_company_name(attr_value)
-                        if company_name:
-                            break
-            
-            # Strategy 3: Look for child elements with name
-            if not company_name:
-                name_elem = element.find(['h1', 'h2', 'h3', 'h4', '.name', '.company-name', '[class*="name"]'])
-                if name_elem:
-                    name_text = name_elem.get_text(strip=True)
-                    company_name = normalize_company_name(name_text)
-                    
-                    # Look for description in sibling or parent
-                    desc_elem = element.find(['p', '.description', '.blurb', '[class*="desc"]'])
-                    if desc_elem:
-                        company_blurb = desc_elem.get_text(strip=True)
-                        if len(company_blurb) < 10:
-                            company_blurb = None
-            
-            # Validate and add
-            if company_name:
-                name_lower = company_name.lower()
-                if name_lower not in seen_names:
-                    seen_names.add(name_lower)
-                    exhibitors.append({
-                        'event_name': event_name,
-                        'company_name': company_name,
-                        'company_blurb': company_blurb if company_blurb and len(company_blurb) > 10 else None
-                    })
+        # Remaining result pages: fetch concurrently, extract in page order
+        page_urls = _find_page_urls(soup, url) if exhibitors and len(exhibitors) < max_results else []
+        if page_urls:
+            # Don't fetch pages beyond what max_results needs at the first page's yield
+            per_page = len(exhibitors)
+            page_urls = page_urls[:-(-(max_results - per_page) // per_page)]
+            logger.info(f"Fetching {len(page_urls)} more directory pages in parallel")
+            with ThreadPoolExecutor(max_workers=PAGE_FETCH_CONCURRENCY) as executor:
+                pages = executor.map(_fetch_page, page_urls)
+                for page_url, page_response in zip(page_urls, pages):
+                    if len(exhibitors) >= max_results:
+                        break
+                    if page_validators is not None:
+                        page_validators[page_url] = page_response and _conditional_headers(page_response)
+                    if page_response:
+                        page_soup = _parse_html(page_response.content)
+                        page_start = len(exhibitors)
+                        _extract_static_exhibitors(page_soup, event_name, exhibitors, seen_names, max_results)
+                        yield from exhibitors[page_start:]
         
         logger.info(f"Static scrape found {len(exhibitors)} exhibitors")
-        return exhibitors
         
     except Exception as e:
         logger.warning(f"Static scrape failed: {e}")
-        return []
 
 
 def playwright_detect_api(url: str) -> Optional[Dict[str, Any]]:
@@ -326,53 +904,244 @@ def playwright_detect_api(url: str) -> Optional[Dict[str, Any]]:
         if api_request_info:
             return
         
-        url_pattern = request.url.lower()
+        url = request.url
+        # Cheapest filter first: only XHR/fetch calls, or URLs that mention JSON
+        if request.resource_type not in API_RESOURCE_TYPES and not JSON_URL_RE.search(url):
+            return
         # Look for API-like URLs
-        if any(keyword in url_pattern for keyword in ['api', 'exhibitor', 'company', 'gallery', 'list', 'search']):
-            # Check if it's JSON
-            if 'json' in url_pattern or request.resource_type in ['fetch', 'xhr']:
-                method = request.method
-                headers = request.headers
-                post_data = request.post_data
-                
-                # Extract query params
-                parsed = urlparse(request.url)
-                params = parse_qs(parsed.query)
-                
-                api_request_info = {
-                    'url': request.url,
-                    'method': method,
-                    'headers': dict(headers),
-                    'params': params,
-                    'post_data': post_data
-                }
-                logger.info(f"Detected potential API: {request.url}")
+        if not API_URL_RE.search(url):
+            return
+        
+        method = request.method
+        headers = request.headers
+        post_data = request.post_data
+        
+        # Extract query params
+        parsed = urlparse(url)
+        params = parse_qs(parsed.query)
+        
+        api_request_info = {
+            'url': url,
+            'method': method,
+            'headers': dict(headers),
+            'params': params,
+            'post_data': post_data
+        }
+        logger.info(f"Detected potential API: {url}")
     
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context()
+        context = _new_context()
+        try:
             page = context.new_page()
             
             page.on('request', handle_request)
             
-            # Navigate and wait a bit for API calls
-            page.goto(url, wait_until='networkidle', timeout=30000)
-            page.wait_for_timeout(2000)  # Wait for additional API calls
-            
-            browser.close()
+            # Navigate and wait for the listing (and its API calls) to load
+            _load_directory_page(page, url)
             
             return api_request_info
+        finally:
+            context.close()
             
     except Exception as e:
         logger.warning(f"API detection failed: {e}")
         return None
 
 
+def _api_base_params(params: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    """
+    Flatten captured query params and pick the pagination key (once per api_fetch).
+    
+    Args:
+        params: Query params from playwright_detect_api (lists, as from parse_qs)
+        
+    Returns:
+        Tuple of (flat params for requests, key the page number goes under)
+    """
+    flat_params = {}
+    lower_keys = {}
+    for k, v in params.items():
+        flat_params[k] = v[0] if isinstance(v, list) and v else v
+        lower_keys.setdefault(k.lower(), k)
+    
+    # Common pagination parameter names - reuse an existing one (case-insensitive) or add 'page'
+    page_key = next(
+        (lower_keys[name] for name in API_PAGE_PARAMS if name in lower_keys),
+        'page'
+    )
+    return flat_params, page_key
+
+
+def _fetch_api_page(api_request_info: Dict[str, Any], base_url: str, base_params: Dict[str, Any],
+                    page_key: str, page_num: int) -> bytes:
+    """
+    Fetch one page of a detected exhibitor API, returning the raw body.
+    
+    Decoding is left to _iter_api_items so large bodies can be streamed.
+    
+    Raises:
+        requests.RequestException: On HTTP/network errors
+    """
+    flat_params = dict(base_params)
+    flat_params[page_key] = str(page_num)
+    
+    headers = dict(api_request_info.get('headers', {}))
+    # Remove browser-specific headers that might cause issues
+    headers.pop('content-length', None)
+    headers['User-Agent'] = USER_AGENT
+    
+    if api_request_info['method'].upper() == 'POST':
+        body = None
+        if api_request_info.get('post_data'):
+            body = _json_dumps(_json_loads(api_request_info['post_data']))
+            if not any(k.lower() == 'content-type' for k in headers):
+                headers['Content-Type'] = 'application/json'
+        response = SESSION.post(
+            base_url,
+            headers=headers,
+            params=flat_params,
+            data=body,
+            timeout=30
+        )
+    else:
+        response = SESSION.get(
+            base_url,
+            headers=headers,
+            params=flat_params,
+            timeout=30
+        )
+    
+    response.raise_for_status()
+    return response.content
+
+
+def _api_items_prefix(body: bytes) -> Optional[str]:
+    """
+    Locate the exhibitor array in a JSON body without building it.
+    
+    Scans parse events for the top-level key api_fetch would pick (first
+    present of API_ITEM_KEYS), stopping early once 'data' is seen.
+    
+    Returns:
+        ijson prefix of the array items, or None when the response isn't a
+        non-empty array under such a key (callers then decode it fully)
+    """
+    events = ijson.parse(body)
+    _, event, _ = next(events)
+    if event == 'start_array':
+        return 'item'
+    if event != 'start_map':
+        return None
+    
+    best_rank = len(API_ITEM_KEYS)
+    best_prefix = None
+    for prefix, event, value in events:
+        if prefix or event != 'map_key':
+            continue
+        rank = API_ITEM_KEY_RANK.get(value)
+        if rank is None or rank >= best_rank:
+            continue
+        # Only a non-empty array is streamed; anything else takes the full-decode path
+        non_empty_array = next(events)[1] == 'start_array' and next(events)[1] != 'end_array'
+        best_rank = rank
+        best_prefix = f"{value}.item" if non_empty_array else None
+        if rank == 0:
+            break
+    return best_prefix
+
+
+def _iter_api_items(body: bytes) -> Optional[Any]:
+    """
+    Decode an API response body into its exhibitor items.
+    
+    Large bodies are streamed with ijson so only the items actually consumed
+    become Python dicts; everything else is decoded in one go.
+    
+    Returns:
+        Iterable of items, or None if the response holds no items
+    
+    Raises:
+        One of JSON_ERRORS if the body is not JSON
+    """
+    if ijson is not None and len(body) >= API_STREAM_MIN_BYTES:
+        prefix = _api_items_prefix(body)
+        if prefix is not None:
+            return ijson.items(body, prefix, use_float=True)
+    
+    data = _json_loads(body)
+    
+    # Try common response structures
+    items = None
+    if isinstance(data, list):
+        items = data
+    elif isinstance(data, dict):
+        # Common keys
+        for key in API_ITEM_KEYS:
+            if key in data:
+                items = data[key]
+                break
+        if not items:
+            items = [data]  # Single item response
+    
+    return items or None
+
+
+def _extract_api_exhibitors(items: Any, event_name: str, exhibitors: List[Dict[str, Any]],
+                            seen_names: set, max_results: int) -> int:
+    """
+    Extract exhibitors from one page of API items, appending new ones.
+    
+    Returns:
+        Number of new exhibitors added
+    """
+    page_count = 0
+    for item in items:
+        if len(exhibitors) >= max_results:
+            break
+        
+        # Extract company name from various possible fields
+        company_name = None
+        company_blurb = None
+        
+        if isinstance(item, dict):
+            # Try common field names
+            for name_field in API_NAME_FIELDS:
+                if name_field in item and item[name_field]:
+                    raw_name = str(item[name_field])
+                    company_name = normalize_company_name(raw_name)
+                    if company_name:
+                        break
+            
+            # Try description fields
+            for desc_field in API_DESC_FIELDS:
+                if desc_field in item and item[desc_field]:
+                    company_blurb = str(item[desc_field]).strip()
+                    if len(company_blurb) < 10:
+                        company_blurb = None
+                    break
+        
+        if company_name:
+            name_lower = _add_if_new(seen_names, company_name)
+            if name_lower:
+                exhibitors.append({
+                    'event_name': event_name,
+                    'company_name': company_name,
+                    'company_blurb': company_blurb,
+                    '_name_lower': name_lower
+                })
+                page_count += 1
+    
+    return page_count
+
+
 def api_fetch(api_request_info: Dict[str, Any], max_results: int = DEFAULT_MAX_EXHIBITORS) -> List[Dict[str, Any]]:
     """
     Fetch exhibitor data from detected API with pagination support.
     
+    Page 1 is fetched first; its yield decides how many further pages
+    max_results needs, and those are fetched in parallel while pages are
+    processed in order (stopping at the first empty or failed page).
+    
     Args:
         api_request_info: API request information from playwright_detect_api
         max_results: Maximum number of exhibitors to return
@@ -380,6 +1149,11 @@ def api_fetch(api_request_info: Dict[str, Any], max_results: int = DEFAULT_MAX_E
     Returns:
         List of exhibitor dictionaries
     """
+    return list(_iter_api_exhibitors(api_request_info, max_results))
+
+
+def _iter_api_exhibitors(api_request_info: Dict[str, Any], max_results: int) -> Iterator[Dict[str, Any]]:
+    """Fetch exhibitors from a detected API (see api_fetch), yielding them page by page."""
     logger.info(f"Fetching from API: {api_request_info['url']}")
     
     exhibitors = []
@@ -389,143 +1163,54 @@ def api_fetch(api_request_info: Dict[str, Any], max_results: int = DEFAULT_MAX_E
     # Extract base URL and params
     parsed = urlparse(api_request_info['url'])
     base_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-    params = api_request_info.get('params', {})
-    
-    # Try pagination
-    page_num = 1
-    max_pages = MAX_PAGINATION_PAGES
-    
-    while page_num <= max_pages and len(exhibitors) < max_results:
-        # Update pagination params
-        pagination_params = {}
-        # Copy existing params (they come as lists from parse_qs)
-        for k, v in params.items():
-            pagination_params[k] = v if isinstance(v, list) else [v]
-        
-        # Common pagination parameter names - find existing or add new
-        pagination_set = False
-        for param_name in ['page', 'pagenum', 'pageNumber', 'offset', 'start']:
-            # Check if this param exists (case-insensitive)
-            existing_key = None
-            for k in pagination_params.keys():
-                if k.lower() == param_name.lower():
-                    existing_key = k
-                    break
-            
-            if existing_key:
-                pagination_params[existing_key] = [str(page_num)]
-                pagination_set = True
+    base_params, page_key = _api_base_params(api_request_info.get('params', {}))
+    
+    executor = ThreadPoolExecutor(max_workers=PAGE_FETCH_CONCURRENCY)
+    pending = {}
+    try:
+        for page_num in range(1, MAX_PAGINATION_PAGES + 1):
+            if len(exhibitors) >= max_results:
                 break
-        
-        if not pagination_set:
-            # Try adding common pagination params
-            pagination_params['page'] = [str(page_num)]
-        
-        # Flatten params for requests
-        flat_params = {}
-        for k, v in pagination_params.items():
-            flat_params[k] = v[0] if isinstance(v, list) and v else v
-        
-        try:
-            headers = api_request_info.get('headers', {})
-            # Remove browser-specific headers that might cause issues
-            headers.pop('content-length', None)
-            headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            
-            if api_request_info['method'].upper() == 'POST':
-                response = requests.post(
-                    base_url,
-                    headers=headers,
-                    params=flat_params,
-                    json=json.loads(api_request_info['post_data']) if api_request_info.get('post_data') else None,
-                    timeout=30
-                )
-            else:
-                response = requests.get(
-                    base_url,
-                    headers=headers,
-                    params=flat_params,
-                    timeout=30
-                )
-            
-            response.raise_for_status()
             
-            # Try to parse as JSON
+            future = pending.pop(page_num, None)
+            if future is None:
+                future = executor.submit(_fetch_api_page, api_request_info, base_url, base_params, page_key, page_num)
             try:
-                data = response.json()
-            except ValueError:
-                logger.warning(f"API response is not JSON on page {page_num}")
-                break
-            
-            # Extract exhibitors from JSON response
-            # Try common response structures
-            items = None
-            if isinstance(data, list):
-                items = data
-            elif isinstance(data, dict):
-                # Common keys
-                for key in ['data', 'results', 'exhibitors', 'companies', 'items', 'list']:
-                    if key in data:
-                        items = data[key]
-                        break
-                if not items:
-                    items = [data]  # Single item response
-            
-            if not items:
-                logger.warning(f"No items found in API response on page {page_num}")
+                body = future.result()
+            except Exception as e:
+                logger.warning(f"Error fetching page {page_num}: {e}")
                 break
             
-            page_count = 0
-            for item in items:
-                if len(exhibitors) >= max_results:
+            try:
+                items = _iter_api_items(body)
+                if items is None:
+                    logger.warning(f"No items found in API response on page {page_num}")
                     break
-                
-                # Extract company name from various possible fields
-                company_name = None
-                company_blurb = None
-                
-                if isinstance(item, dict):
-                    # Try common field names
-                    for name_field in ['name', 'companyName', 'company_name', 'exhibitorName', 'title', 'company']:
-                        if name_field in item and item[name_field]:
-                            raw_name = str(item[name_field])
-                            company_name = normalize_company_name(raw_name)
-                            if company_name:
-                                break
-                    
-                    # Try description fields
-                    for desc_field in ['description', 'blurb', 'summary', 'tagline', 'about', 'bio']:
-                        if desc_field in item and item[desc_field]:
-                            company_blurb = str(item[desc_field]).strip()
-                            if len(company_blurb) < 10:
-                                company_blurb = None
-                            break
-                
-                if company_name:
-                    name_lower = company_name.lower()
-                    if name_lower not in seen_names:
-                        seen_names.add(name_lower)
-                        exhibitors.append({
-                            'event_name': event_name,
-                            'company_name': company_name,
-                            'company_blurb': company_blurb
-                        })
-                        page_count += 1
+                page_count = _extract_api_exhibitors(items, event_name, exhibitors, seen_names, max_results)
+            except JSON_ERRORS:
+                logger.warning(f"API response is not JSON on page {page_num}")
+                break
             
+            yield from exhibitors[len(exhibitors) - page_count:]
             logger.info(f"Page {page_num}: Found {page_count} new exhibitors (total: {len(exhibitors)})")
             
             # Stop if no new items or reached max
             if page_count == 0 or len(exhibitors) >= max_results:
                 break
             
-            page_num += 1
-            
-        except Exception as e:
-            logger.warning(f"Error fetching page {page_num}: {e}")
-            break
+            if page_num == 1:
+                # Prefetch the pages max_results still needs at page 1's yield
+                last_page = min(MAX_PAGINATION_PAGES, 1 - (-(max_results - len(exhibitors)) // page_count))
+                for next_page in range(2, last_page + 1):
+                    pending[next_page] = executor.submit(
+                        _fetch_api_page, api_request_info, base_url, base_params, page_key, next_page
+                    )
+                if last_page > 1:
+                    logger.info(f"Fetching API pages 2-{last_page} in parallel")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     
     logger.info(f"API fetch completed: {len(exhibitors)} exhibitors")
-    return exhibitors
 
 
 def playwright_dom_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -> List[Dict[str, Any]]:
@@ -539,6 +1224,11 @@ def playwright_dom_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -
     Returns:
         List of exhibitor dictionaries
     """
+    return list(_iter_dom_exhibitors(url, max_results))
+
+
+def _iter_dom_exhibitors(url: str, max_results: int) -> Iterator[Dict[str, Any]]:
+    """Scrape the rendered DOM (see playwright_dom_scrape), yielding exhibitors page by page."""
     logger.info(f"Attempting Playwright DOM scrape of {url}")
     
     exhibitors = []
@@ -546,13 +1236,11 @@ def playwright_dom_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -
     event_name = None
     
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context()
+        context = _new_context()
+        try:
             page = context.new_page()
             
-            page.goto(url, wait_until='networkidle', timeout=30000)
-            page.wait_for_timeout(2000)  # Wait for dynamic content
+            _load_directory_page(page, url)
             
             # Extract event name
             event_name = extract_event_name(url, page.content())
@@ -562,38 +1250,17 @@ def playwright_dom_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -
             last_count = 0
             
             while page_num <= max_pages and len(exhibitors) < max_results:
-                # Extract exhibitors from current page
-                html = page.content()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Try various selectors
-                elements = []
-                selectors = [
-                    'a[href*="exhibitor"]',
-                    '.exhibitor',
-                    '.exhibitor-item',
-                    '.company',
-                    '[data-exhibitor]',
-                    'article',
-                    '.card',
-                    '.listing-item'
-                ]
-                
-                for selector in selectors:
-                    found = soup.select(selector)
-                    if found:
-                        elements = found
-                        logger.info(f"Found {len(elements)} elements with selector: {selector}")
-                        break
-                
-                # If no specific selector, try broader approach
-                if not elements:
-                    # Look for links with exhibitor-related text/attributes
-                    all_links = soup.find_all('a', href=True)
-                    elements = [e for e in all_links if any(
-                        keyword in (e.get('href', '') + ' ' + e.get_text()).lower()
-                        for keyword in ['exhibitor', 'company', 'vendor']
-                    )]
+                # Extract exhibitors from current page (inside the browser)
+                found = page.evaluate(DOM_EXTRACT_JS, {
+                    'selectors': DOM_EXHIBITOR_SELECTORS,
+                    'linkKeywords': DOM_LINK_KEYWORDS,
+                    'nameAttrs': DOM_NAME_ATTRS,
+                    'nameSelector': DOM_NAME_SELECTOR,
+                    'descSelector': DOM_DESC_SELECTOR,
+                })
+                elements = found['items']
+                if found['selector']:
+                    logger.info(f"Found {len(elements)} elements with selector: {found['selector']}")
                 
                 current_page_count = 0
                 for element in elements:
@@ -604,14 +1271,14 @@ def playwright_dom_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -
                     company_blurb = None
                     
                     # Extract name
-                    text = element.get_text(strip=True)
+                    text = element['text']
                     if text:
                         company_name, company_blurb = split_name_and_blurb(text)
                     
                     # Try attributes
                     if not company_name:
-                        for attr in ['aria-label', 'title', 'data-name']:
-                            attr_value = element.get(attr)
+                        for attr in DOM_NAME_ATTRS:
+                            attr_value = element['attrs'][attr]
                             if attr_value:
                                 company_name = normalize_company_name(attr_value)
                                 if company_name:
@@ -619,29 +1286,27 @@ def playwright_dom_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -
                     
                     # Try child elements
                     if not company_name:
-                        name_elem = element.find(['h1', 'h2', 'h3', 'h4', '.name', '[class*="name"]'])
-                        if name_elem:
-                            name_text = name_elem.get_text(strip=True)
+                        name_text = element['name']
+                        if name_text is not None:
                             company_name = normalize_company_name(name_text)
                             
-                            desc_elem = element.find(['p', '.description', '[class*="desc"]'])
-                            if desc_elem:
-                                company_blurb = desc_elem.get_text(strip=True)
-                                if len(company_blurb) < 10:
-                                    company_blurb = None
+                            company_blurb = element['desc']
+                            if company_blurb is not None and len(company_blurb) < 10:
+                                company_blurb = None
                     
                     if company_name:
-                        name_lower = company_name.lower()
-                        if name_lower not in seen_names:
-                            seen_names.add(name_lower)
+                        name_lower = _add_if_new(seen_names, company_name)
+                        if name_lower:
                             exhibitors.append({
                                 'event_name': event_name,
                                 'company_name': company_name,
-                                'company_blurb': company_blurb if company_blurb and len(company_blurb) > 10 else None
+                                'company_blurb': company_blurb if company_blurb and len(company_blurb) > 10 else None,
+                                '_name_lower': name_lower
                             })
                             current_page_count += 1
                 
                 logger.info(f"Page {page_num}: Found {current_page_count} new exhibitors (total: {len(exhibitors)})")
+                yield from exhibitors[len(exhibitors) - current_page_count:]
                 
                 # Try to find and click pagination
                 if len(exhibitors) >= max_results:
@@ -651,17 +1316,7 @@ def playwright_dom_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -
                 next_button = None
                 try:
                     # Common next button selectors
-                    next_selectors = [
-                        'button:has-text("Next")',
-                        'a:has-text("Next")',
-                        '[aria-label*="next" i]',
-                        '.next',
-                        '.pagination-next',
-                        'button[class*="next"]',
-                        'a[class*="next"]'
-                    ]
-                    
-                    for selector in next_selectors:
+                    for selector in NEXT_PAGE_SELECTORS:
                         try:
                             next_button = page.query_selector(selector)
                             if next_button:
@@ -700,14 +1355,13 @@ def playwright_dom_scrape(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -
                 except Exception as e:
                     logger.debug(f"Pagination attempt failed: {e}")
                     break
-            
-            browser.close()
+        finally:
+            context.close()
             
     except Exception as e:
         logger.warning(f"Playwright DOM scrape failed: {e}")
     
     logger.info(f"Playwright DOM scrape completed: {len(exhibitors)} exhibitors")
-    return exhibitors
 
 
 def discover_directory_links(url: str) -> List[str]:
@@ -725,13 +1379,11 @@ def discover_directory_links(url: str) -> List[str]:
     directory_links = []
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=30)
+        # Same client as the directory pages, which usually share this host
+        response = PAGE_CLIENT.get(url, timeout=30)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER)
         
         # Look for links that might be exhibitor directories
         # Common patterns: URLs containing "exhibitor", "directory", "gallery", "who"
@@ -748,36 +1400,15 @@ def discover_directory_links(url: str) -> List[str]:
             href_lower = href.lower()
             text_lower = text.lower()
             
-            # URL patterns
-            url_patterns = [
-                'exhibitor',
-                'directory',
-                'gallery',
-                'who.*exhibit',
-                'exhibiting',
-                'vendor',
-                'booth.*list'
-            ]
-            
-            # Text patterns
-            text_patterns = [
-                'exhibitor',
-                'directory',
-                'who.*exhibit',
-                'exhibiting',
-                'vendor',
-                'booth'
-            ]
-            
-            matches_url = any(re.search(pattern, href_lower) for pattern in url_patterns)
-            matches_text = any(re.search(pattern, text_lower) for pattern in text_patterns)
+            matches_url = any(pattern.search(href_lower) for pattern in DIRECTORY_URL_PATTERNS)
+            matches_text = any(pattern.search(text_lower) for pattern in DIRECTORY_TEXT_PATTERNS)
             
             if matches_url or matches_text:
                 # Additional validation: check surrounding context
                 parent = link.parent
                 if parent:
                     parent_text = parent.get_text(strip=True).lower()
-                    if any(keyword in parent_text for keyword in ['exhibitor', 'directory', 'vendor', 'booth']):
+                    if any(keyword in parent_text for keyword in DIRECTORY_CONTEXT_KEYWORDS):
                         if absolute_url not in directory_links:
                             directory_links.append(absolute_url)
                             logger.info(f"Discovered directory link: {absolute_url}")
@@ -794,6 +1425,9 @@ def scrape_exhibitors(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -> Li
     """
     Main orchestration function to scrape exhibitors from a URL.
     
+    Directories found on a discovery page are scraped in parallel (up to
+    DIRECTORY_SCRAPE_CONCURRENCY at a time) and merged in discovery order.
+    
     Args:
         url: Exhibitor directory URL or discovery page URL
         max_results: Maximum number of exhibitors to return
@@ -804,33 +1438,98 @@ def scrape_exhibitors(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -> Li
     logger.info(f"Starting scrape for: {url}")
     
     # Check if this is a discovery page (ASI guide)
-    if 'asicentral.com' in url.lower() or re.search(r'trade.*show.*planning', url.lower()):
+    if DISCOVERY_URL_RE.search(url.lower()):
         directory_links = discover_directory_links(url)
         if directory_links:
             logger.info(f"Processing {len(directory_links)} discovered directory links")
             all_exhibitors = []
             seen_names = set()
             
-            for dir_url in directory_links:
-                if len(all_exhibitors) >= max_results:
-                    break
-                
-                dir_exhibitors = scrape_single_directory(dir_url, max_results - len(all_exhibitors))
-                for exhibitor in dir_exhibitors:
-                    name_lower = exhibitor['company_name'].lower()
-                    if name_lower not in seen_names:
-                        seen_names.add(name_lower)
-                        all_exhibitors.append(exhibitor)
-                        if len(all_exhibitors) >= max_results:
-                            break
+            # Each directory may fill max_results on its own, so each gets the full budget;
+            # directories not yet started are cancelled once enough have been merged
+            executor = ThreadPoolExecutor(max_workers=DIRECTORY_SCRAPE_CONCURRENCY)
+            try:
+                futures = [
+                    executor.submit(_scrape_directory_worker, dir_url, max_results)
+                    for dir_url in directory_links
+                ]
+                for future in futures:
+                    if _extend_unique(all_exhibitors, seen_names, future.result(), max_results):
+                        break
+            finally:
+                executor.shutdown(cancel_futures=True)
             
             logger.info(f"Total exhibitors from discovery: {len(all_exhibitors)}")
-            return all_exhibitors[:max_results]
+            return all_exhibitors
     
     # Regular directory scraping
     return scrape_single_directory(url, max_results)
 
 
+def _scrape_cache_path(url: str) -> str:
+    """Return the on-disk scrape cache path for a directory URL (sha1-keyed)."""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(SCRAPE_CACHE_DIR, f"{key}.json")
+
+
+def _revalidate_page(page_url: str, headers: Dict[str, str]) -> Tuple[bool, Any]:
+    """
+    Conditionally GET a page held in the scrape cache.
+    
+    Returns:
+        Tuple of (unchanged, response): unchanged is True on a 304; otherwise
+        response is the fresh response (None if the request failed)
+    """
+    try:
+        response = PAGE_CLIENT.get(page_url, headers=headers, timeout=30)
+    except Exception as e:
+        logger.debug(f"Revalidation failed for {page_url}: {e}")
+        return False, None
+    if response.status_code == 304:
+        return True, None
+    return False, response
+
+
+def _load_cached_scrape(url: str, max_results: int) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Dict[str, str]]]]:
+    """
+    Return a directory's cached exhibitors and the validators of the pages they came from.
+    
+    The entry is only used if it was scraped with at least max_results as the
+    limit (or already holds that many exhibitors), so it is never a truncated answer.
+    
+    Returns:
+        Tuple of (rows, {page URL: conditional-GET headers}), first page first, or None
+    """
+    try:
+        with open(_scrape_cache_path(url), 'rb') as f:
+            entry = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    
+    rows = entry.get('rows') or []
+    pages = entry.get('pages')
+    if not pages or next(iter(pages)) != url:
+        return None
+    if entry.get('max_results', 0) < max_results and len(rows) < max_results:
+        return None
+    return rows[:max_results], pages
+
+
+def _save_cached_scrape(url: str, pages: Dict[str, Dict[str, str]], max_results: int,
+                        rows: List[Dict[str, Any]]):
+    """Atomically write a directory's exhibitors and page validators to the scrape cache (best-effort)."""
+    path = _scrape_cache_path(url)
+    entry = {'url': url, 'pages': pages, 'max_results': max_results, 'rows': rows}
+    try:
+        os.makedirs(SCRAPE_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write scrape cache for {url}: {e}")
+
+
 def scrape_single_directory(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -> List[Dict[str, Any]]:
     """
     Scrape a single exhibitor directory URL.
@@ -842,52 +1541,104 @@ def scrape_single_directory(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS)
     Returns:
         List of exhibitor dictionaries
     """
-    strategy_used = None
-    exhibitors = []
+    return list(iter_single_directory(url, max_results))
+
+
+def _scrape_directory_worker(url: str, max_results: int) -> List[Dict[str, Any]]:
+    """
+    Scrape one discovered directory on a pool thread.
+    
+    Any browser the DOM fallback starts belongs to this thread, so it is
+    closed here before the thread is reused or exits.
+    """
+    try:
+        return scrape_single_directory(url, max_results)
+    finally:
+        close_browser()
+
+
+def iter_single_directory(url: str, max_results: int = DEFAULT_MAX_EXHIBITORS) -> Iterator[Dict[str, Any]]:
+    """
+    Scrape a single exhibitor directory URL, yielding exhibitors as they are found.
+    
+    A strategy's results are streamed (page by page) as soon as it is certain
+    to be the one kept: static and API results once MIN_RESULTS_FOR_STATIC have
+    arrived (fewer means the next strategy is tried), DOM results once they
+    outnumber the best earlier attempt.
+    
+    Statically scraped results are cached under SCRAPE_CACHE_DIR together with
+    the ETag/Last-Modified of every page they came from. A rerun sends each of
+    those pages as a conditional GET and reuses the cache only if all of them
+    answer 304; if the first page changed, its fresh response is scraped
+    instead of fetching it again.
+    
+    Args:
+        url: Exhibitor directory URL
+        max_results: Maximum number of exhibitors to yield
+        
+    Yields:
+        Exhibitor dictionaries
+    """
+    # Reuse the last scrape if none of the directory's pages have changed
+    first_response = None
+    cached = _load_cached_scrape(url, max_results)
+    if cached is not None:
+        rows, pages = cached
+        unchanged, first_response = _revalidate_page(url, pages[url])
+        if unchanged:
+            other_pages = [page_url for page_url in pages if page_url != url]
+            with ThreadPoolExecutor(max_workers=PAGE_FETCH_CONCURRENCY) as executor:
+                checks = executor.map(lambda page_url: _revalidate_page(page_url, pages[page_url])[0], other_pages)
+                unchanged = all(checks)
+        if unchanged:
+            logger.info(f"Directory unchanged since last scrape, using cache: {len(rows)} exhibitors")
+            yield from rows
+            return
     
     # Strategy 1: Try static scraping
-    exhibitors = static_scrape(url, max_results)
-    if len(exhibitors) >= MIN_RESULTS_FOR_STATIC:
-        strategy_used = "static"
-        logger.info(f"Static scraping successful: {len(exhibitors)} exhibitors")
-    else:
+    strategy_used = "static"
+    page_validators = {}
+    results = _iter_static_exhibitors(url, max_results, page_validators, first_response)
+    exhibitors = list(islice(results, MIN_RESULTS_FOR_STATIC))
+    if len(exhibitors) < MIN_RESULTS_FOR_STATIC:
+        # islice stopped short, so this strategy is exhausted
         logger.info(f"Static scraping found only {len(exhibitors)} exhibitors, trying Playwright")
         
         # Strategy 2: Try API detection
         api_info = playwright_detect_api(url)
         if api_info:
             strategy_used = "api"
-            api_exhibitors = api_fetch(api_info, max_results)
+            api_results = _iter_api_exhibitors(api_info, max_results)
+            api_exhibitors = list(islice(api_results, MIN_RESULTS_FOR_STATIC))
             if len(api_exhibitors) > len(exhibitors):
-                exhibitors = api_exhibitors
-                logger.info(f"API fetch successful: {len(exhibitors)} exhibitors")
+                exhibitors, results = api_exhibitors, api_results
         
         # Strategy 3: Fallback to DOM scraping
-        if not exhibitors or len(exhibitors) < MIN_RESULTS_FOR_STATIC:
+        if len(exhibitors) < MIN_RESULTS_FOR_STATIC:
             strategy_used = "dom"
-            dom_exhibitors = playwright_dom_scrape(url, max_results)
+            dom_results = _iter_dom_exhibitors(url, max_results)
+            dom_exhibitors = list(islice(dom_results, len(exhibitors) + 1))
             if len(dom_exhibitors) > len(exhibitors):
-                exhibitors = dom_exhibitors
-                logger.info(f"DOM scraping successful: {len(exhibitors)} exhibitors")
+                exhibitors, results = dom_exhibitors, dom_results
     
-    # Deduplicate and limit
-    seen_names = set()
-    deduplicated = []
-    for exhibitor in exhibitors:
-        name_lower = exhibitor['company_name'].lower()
-        if name_lower not in seen_names:
-            seen_names.add(name_lower)
-            deduplicated.append(exhibitor)
-            if len(deduplicated) >= max_results:
-                break
+    # Each strategy already skips case-insensitive duplicates and stops at
+    # max_results, so its results are passed through as they come
+    yield from exhibitors
+    for exhibitor in results:
+        exhibitors.append(exhibitor)
+        yield exhibitor
+    
+    # Only static results are cached: for API/DOM scrapes the listing isn't
+    # in the pages the validators describe. Every page needs a validator, or
+    # a change to it could never be detected
+    if strategy_used == "static" and page_validators and all(page_validators.values()):
+        _save_cached_scrape(url, page_validators, max_results, exhibitors)
     
     # Logging summary
-    logger.info(f"Strategy used: {strategy_used or 'static'}")
-    logger.info(f"Total valid exhibitors: {len(deduplicated)}")
-    blurb_count = sum(1 for e in deduplicated if e.get('company_blurb'))
+    logger.info(f"Strategy used: {strategy_used}")
+    logger.info(f"Total valid exhibitors: {len(exhibitors)}")
+    blurb_count = sum(1 for e in exhibitors if e.get('company_blurb'))
     logger.info(f"Exhibitors with blurb: {blurb_count}")
-    
-    return deduplicated[:max_results]
 
 
 def extract_domain_from_url(url_str: str) -> Optional[str]:
@@ -913,55 +1664,76 @@ def extract_domain_from_url(url_str: str) -> Optional[str]:
     return None
 
 
-def run(source_url: str, limit: int = DEFAULT_MAX_EXHIBITORS) -> List[Dict[str, str]]:
+def _truncate_blurb(blurb: str) -> str:
+    """Cut a blurb to BLURB_MAX_LEN characters, ending a cut one with '...'."""
+    if len(blurb) <= BLURB_MAX_LEN:
+        return blurb
+    return blurb[:BLURB_MAX_LEN - 3] + '...'
+
+
+def stream(source_url: str, limit: int = DEFAULT_MAX_EXHIBITORS) -> Iterator[Dict[str, str]]:
     """
-    Run the scraper and return results in pipeline format.
+    Run the scraper and yield results in pipeline format, one company at a time.
     
     Args:
         source_url: Source URL to scrape
         limit: Maximum number of companies to scrape
         
-    Returns:
-        List of dicts with keys: company_name, domain, company_blurb, source_url
+    Yields:
+        Dicts with keys: company_name, domain, company_blurb, source_url
     """
     logger.info(f"Scraping exhibitors from: {source_url} (limit: {limit})")
     
-    # Scrape exhibitors (call the main function)
-    exhibitors = scrape_single_directory(source_url, max_results=limit)
-    
-    # Convert to pipeline format
-    results = []
-    for exhibitor in exhibitors:
+    # Convert to pipeline format as the scraper finds exhibitors
+    count = 0
+    for exhibitor in iter_single_directory(source_url, max_results=limit):
         company_name = exhibitor.get('company_name', '').strip()
         if not company_name:
             continue
         
-        # Skip obviously non-company entries
-        if any(skip in company_name.lower() for skip in ['exhibitor search', 'all exhibitors', 'search', 'filter']):
+        # Skip obviously non-company entries (names are already stripped, so
+        # the key lowercased at scrape time matches)
+        name_lower = exhibitor.get('_name_lower') or company_name.lower()
+        if NON_COMPANY_RE.search(name_lower):
             continue
         
-        # Skip entries that look like descriptions (too long, contain "is", "are", "delivers", etc.)
-        if len(company_name) > 60 or any(word in company_name.lower() for word in ['delivers', 'is a', 'are a', 'provides', 'specializes']):
+        # Skip entries that look like descriptions (too long, contain "is a", "are a", "delivers", etc.)
+        if len(company_name) > 60:
+            continue
+        tokens = name_lower.split()
+        if not DESCRIPTION_TOKENS.isdisjoint(tokens) or any(
+                pair in DESCRIPTION_BIGRAMS for pair in zip(tokens, tokens[1:])):
             continue
         
-        # Extract company_blurb (from HTML scraping only, no API)
-        company_blurb = exhibitor.get('company_blurb', '').strip() if exhibitor.get('company_blurb') else ''
-        # Limit to 240 chars
-        if company_blurb and len(company_blurb) > 240:
-            company_blurb = company_blurb[:237] + '...'
+        # Extract company_blurb (from HTML scraping only, no API), limited to BLURB_MAX_LEN chars
+        company_blurb = _truncate_blurb((exhibitor.get('company_blurb') or '').strip())
         
         # Domain extraction (empty for now, can be enriched later)
         domain = ''
         
-        results.append({
+        count += 1
+        yield {
             'company_name': company_name,
             'domain': domain,
             'company_blurb': company_blurb,
             'source_url': source_url
-        })
+        }
+    
+    logger.info(f"Scraped {count} companies")
+
+
+def run(source_url: str, limit: int = DEFAULT_MAX_EXHIBITORS) -> List[Dict[str, str]]:
+    """
+    Run the scraper and return results in pipeline format.
     
-    logger.info(f"Scraped {len(results)} companies")
-    return results
+    Args:
+        source_url: Source URL to scrape
+        limit: Maximum number of companies to scrape
+        
+    Returns:
+        List of dicts with keys: company_name, domain, company_blurb, source_url
+    """
+    return list(stream(source_url, limit=limit))
 
 
 def generate_filename(url: str, event_name: Optional[str] = None) -> str:
@@ -977,9 +1749,7 @@ def generate_filename(url: str, event_name: Optional[str] = None) -> str:
     """
     if event_name:
         # Clean event name for filename
-        slug = re.sub(r'[^a-zA-Z0-9]+', '-', event_name.lower())
-        slug = slug.strip('-')
-        return slug
+        return SLUG_SEPARATOR_RE.sub('-', event_name.lower()).strip('-')
     
     # Fallback to URL-based slug
     parsed = urlparse(url)
@@ -991,15 +1761,22 @@ def generate_filename(url: str, event_name: Optional[str] = None) -> str:
     else:
         slug = hostname
     
-    # Clean slug
-    slug = re.sub(r'[^a-zA-Z0-9-]+', '-', slug.lower())
-    slug = re.sub(r'-+', '-', slug).strip('-')
+    # Clean slug (runs of '-' and other separators collapse to a single '-')
+    slug = SLUG_SEPARATOR_RE.sub('-', slug.lower()).strip('-')
     
     return slug[:50]  # Limit length
 
 
+def results_to_json(exhibitors: List[Dict[str, Any]]) -> str:
+    """Serialize exhibitor results as indented, non-ASCII-escaped JSON text."""
+    if orjson is not None:
+        return orjson.dumps(exhibitors, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(exhibitors, indent=2, ensure_ascii=False)
+
+
 def save_results(exhibitors: List[Dict[str, Any]], out_dir: str, out_file: Optional[str] = None, 
-                 url: Optional[str] = None, event_name: Optional[str] = None) -> str:
+                 url: Optional[str] = None, event_name: Optional[str] = None,
+                 output_json: Optional[str] = None) -> str:
     """
     Save exhibitor results to a JSON file.
     
@@ -1009,6 +1786,7 @@ def save_results(exhibitors: List[Dict[str, Any]], out_dir: str, out_file: Optio
         out_file: Optional specific filename (without path)
         url: Optional URL for filename generation
         event_name: Optional event name for filename generation
+        output_json: Optional exhibitors already serialized by results_to_json
         
     Returns:
         Full path to saved file
@@ -1030,8 +1808,10 @@ def save_results(exhibitors: List[Dict[str, Any]], out_dir: str, out_file: Optio
     file_path = os.path.join(out_dir, out_file)
     
     # Save JSON
+    if output_json is None:
+        output_json = results_to_json(exhibitors)
     with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(exhibitors, f, indent=2, ensure_ascii=False)
+        f.write(output_json)
     
     return file_path
 
@@ -1061,24 +1841,30 @@ Examples:
     
     try:
         # Scrape exhibitors
-        exhibitors = scrape_exhibitors(args.url, max_results=args.max_results)
+        exhibitors = [
+            _public_fields(e)
+            for e in scrape_exhibitors(args.url, max_results=args.max_results)
+        ]
         
         # Extract event name for filename generation
         event_name = None
         if exhibitors:
             event_name = exhibitors[0].get('event_name')
         
+        # Serialize once for both the file and stdout
+        output_json = results_to_json(exhibitors)
+        
         # Save to file
         file_path = save_results(
             exhibitors, 
             args.out_dir, 
             args.out_file, 
             args.url, 
-            event_name
+            event_name,
+            output_json
         )
         
         # Also print to stdout
-        output_json = json.dumps(exhibitors, indent=2, ensure_ascii=False)
         print(output_json)
         
         # Print success message
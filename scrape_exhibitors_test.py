@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Scrape Exhibitors Parser Parity Tests
+
+The static scraper parses directory pages with selectolax (Lexbor) when it
+is installed and BeautifulSoup otherwise; both backends must extract the
+same exhibitors from the same page.
+
+Usage:
+    python -m pytest scrape_exhibitors_test.py
+"""
+
+import pytest
+
+import scrape_exhibitors
+
+# A card whose own class matches STATIC_NAME_SELECTOR: the name must come from
+# the child element, not from the card itself
+CARD_HTML = (
+    '<html><body>'
+    '<div class="company-name"><span class="name">Acme Corp</span> booth 12 hall B</div>'
+    '</body></html>'
+)
+
+# Several listing styles on one page, for comparing the two backends
+DIRECTORY_HTML = (
+    '<html><head><title>Sign Expo 2026 - Exhibitors</title></head><body>'
+    + ''.join(
+        f'<div class="exhibitor-card"><h3>Widget Co {i}</h3>'
+        f'<p>Makes widgets number {i} for the sign industry.</p></div>'
+        for i in range(5)
+    )
+    + '<div class="company-name"><span class="name">Acme Corp</span> booth 12 hall B</div>'
+    + '<li class="exhibitor-item" title="Title Only Inc"></li>'
+    + '</body></html>'
+)
+
+
+@pytest.fixture(params=['lexbor', 'bs4'])
+def backend(request, monkeypatch):
+    """Run a test once per HTML parsing backend."""
+    if request.param == 'bs4':
+        monkeypatch.setattr(scrape_exhibitors, 'LexborHTMLParser', None)
+    elif scrape_exhibitors.LexborHTMLParser is None:
+        pytest.skip('selectolax not installed')
+    return request.param
+
+
+def _extract(html: str):
+    """Run the static extractor over one page with the active backend."""
+    exhibitors = []
+    soup = scrape_exhibitors._parse_html(html)
+    scrape_exhibitors._extract_static_exhibitors(soup, 'Sign Expo 2026', exhibitors, set(), 100)
+    return exhibitors
+
+
+def test_select_first_skips_the_node_itself(backend):
+    soup = scrape_exhibitors._parse_html(CARD_HTML)
+    card = scrape_exhibitors._select_first(soup, '.company-name')
+
+    name_elem = scrape_exhibitors._select_first(card, scrape_exhibitors.STATIC_NAME_SELECTOR)
+
+    assert scrape_exhibitors._node_text(name_elem) == 'Acme Corp'
+    assert scrape_exhibitors._select(card, scrape_exhibitors.STATIC_NAME_SELECTOR) == [name_elem]
+
+
+def test_card_matching_name_selector_extracts_child_name(backend):
+    assert [e['company_name'] for e in _extract(CARD_HTML)] == ['Acme Corp']
+
+
+def test_backends_extract_the_same_exhibitors(monkeypatch):
+    if scrape_exhibitors.LexborHTMLParser is None:
+        pytest.skip('selectolax not installed')
+
+    lexbor_results = _extract(DIRECTORY_HTML)
+    monkeypatch.setattr(scrape_exhibitors, 'LexborHTMLParser', None)
+    bs4_results = _extract(DIRECTORY_HTML)
+
+    assert lexbor_results
+    assert lexbor_results == bs4_results
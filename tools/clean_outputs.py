@@ -3,19 +3,21 @@
 Clean Outputs Script
 
 Safely deletes generated artifacts from the outputs/ directory.
-Only removes CSV, JSON, and TMP files - never deletes source code.
+Only removes CSV, JSON/JSONL, TMP and SQLite cache files - never deletes source code.
 
 Usage:
     python tools/clean_outputs.py --dry-run          # Preview what would be deleted
-    python tools/clean_outputs.py --keep-cache        # Clean but keep cache_serper.json
+    python tools/clean_outputs.py --keep-cache        # Clean but keep cache_serper.db and .scrape_cache/
     python tools/clean_outputs.py                    # Clean everything
 """
 
 import argparse
 import logging
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -28,24 +30,37 @@ logger = logging.getLogger(__name__)
 OUTPUT_DIR = Path('outputs')
 
 # File extensions to clean
-CLEAN_EXTENSIONS = {'.csv', '.json', '.tmp'}
+CLEAN_EXTENSIONS = {'.csv', '.json', '.jsonl', '.tmp', '.db', '.db-wal', '.db-shm'}
+
+# Deletions in flight at once (unlink releases the GIL; helps on network/FUSE mounts)
+DELETE_CONCURRENCY = 16
+
+# Scraper result cache, kept with --keep-cache (same default and override as scrape_exhibitors.py)
+SCRAPE_CACHE_DIR = Path(os.getenv('SCRAPE_CACHE_DIR', OUTPUT_DIR / '.scrape_cache'))
+
+# Files the scraper writes there: <sha1 of URL>.json, plus its in-flight .tmp files.
+# Only these are deleted, so an override pointing at a shared directory is safe
+SCRAPE_CACHE_FILE_RE = re.compile(r'[0-9a-f]{40}\.json(?:\.\d+\.\d+\.tmp)?')
 
 # Protected files (never delete)
 PROTECTED_FILES = {
-    'cache_serper.json'  # Can be kept with --keep-cache flag
+    'cache_serper.db',      # Can be kept with --keep-cache flag
+    'cache_serper.db-wal',  # SQLite WAL sidecars travel with the database
+    'cache_serper.db-shm',
+    'cache_serper.json'     # Legacy JSON cache (imported into the database)
 }
 
 
-def find_files_to_clean(output_dir: Path, keep_cache: bool = False) -> List[Path]:
+def find_files_to_clean(output_dir: Path, keep_cache: bool = False) -> List[Tuple[Path, int]]:
     """
     Find all files that should be cleaned.
     
     Args:
         output_dir: Path to outputs directory
-        keep_cache: If True, exclude cache_serper.json from deletion
+        keep_cache: If True, exclude the Serper cache database from deletion
         
     Returns:
-        List of file paths to delete
+        Sorted list of (file path, size in bytes) tuples to delete
     """
     files_to_clean = []
     
@@ -53,33 +68,74 @@ def find_files_to_clean(output_dir: Path, keep_cache: bool = False) -> List[Path
         logger.warning(f"Output directory does not exist: {output_dir}")
         return files_to_clean
     
-    for file_path in output_dir.iterdir():
-        # Only process files (not directories)
-        if not file_path.is_file():
-            continue
-        
-        # Check extension
-        if file_path.suffix.lower() not in CLEAN_EXTENSIONS:
-            continue
-        
-        # Check if protected
-        if file_path.name in PROTECTED_FILES:
-            if keep_cache and file_path.name == 'cache_serper.json':
-                logger.info(f"  KEEP (cache): {file_path.name}")
+    # scandir entries carry the file type from the directory read, and stat
+    # once here so the summary and deletion don't need to
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            # Only process files (not directories)
+            if not entry.is_file(follow_symlinks=False):
                 continue
-        
-        files_to_clean.append(file_path)
+            
+            # Check extension
+            if os.path.splitext(entry.name)[1].lower() not in CLEAN_EXTENSIONS:
+                continue
+            
+            # Check if protected
+            if entry.name in PROTECTED_FILES:
+                if keep_cache:
+                    logger.info(f"  KEEP (cache): {entry.name}")
+                    continue
+            
+            files_to_clean.append((Path(entry.path), entry.stat(follow_symlinks=False).st_size))
     
     return sorted(files_to_clean)
 
 
+def find_scrape_cache_files(cache_dir: Path) -> List[Tuple[Path, int]]:
+    """
+    Find the scraper's own cache files in cache_dir.
+    
+    Args:
+        cache_dir: Scrape cache directory
+        
+    Returns:
+        Sorted list of (file path, size in bytes) tuples to delete
+    """
+    files_to_clean = []
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if SCRAPE_CACHE_FILE_RE.fullmatch(entry.name) and entry.is_file(follow_symlinks=False):
+                files_to_clean.append((Path(entry.path), entry.stat(follow_symlinks=False).st_size))
+    return sorted(files_to_clean)
+
+
+def _safe_unlink(item: Tuple[Path, int]) -> Tuple[str, Optional[int], Optional[Exception]]:
+    """
+    Delete one file without raising.
+    
+    Args:
+        item: (file path, size in bytes) tuple from find_files_to_clean
+        
+    Returns:
+        Tuple of (file name, size freed or None if nothing was deleted, error or None)
+    """
+    file_path, size = item
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        return file_path.name, None, None
+    except Exception as e:
+        return file_path.name, None, e
+    return file_path.name, size, None
+
+
 def clean_outputs(dry_run: bool = False, keep_cache: bool = False):
     """
     Clean generated artifacts from outputs directory.
     
     Args:
         dry_run: If True, only print what would be deleted
-        keep_cache: If True, keep cache_serper.json
+        keep_cache: If True, keep the Serper cache database and scrape cache
     """
     logger.info("=" * 60)
     logger.info("CLEAN OUTPUTS")
@@ -91,13 +147,20 @@ def clean_outputs(dry_run: bool = False, keep_cache: bool = False):
         logger.info("LIVE MODE - Files will be deleted")
     
     if keep_cache:
-        logger.info("Cache protection: cache_serper.json will be kept")
+        logger.info(f"Cache protection: cache_serper.db and {SCRAPE_CACHE_DIR}/ will be kept")
     
     logger.info("")
     
     # Find files to clean
     files_to_clean = find_files_to_clean(OUTPUT_DIR, keep_cache=keep_cache)
     
+    # The scraper's result cache is the only directory that gets cleaned
+    if SCRAPE_CACHE_DIR.is_dir():
+        if keep_cache:
+            logger.info(f"  KEEP (cache): {SCRAPE_CACHE_DIR}/")
+        else:
+            files_to_clean = sorted(files_to_clean + find_scrape_cache_files(SCRAPE_CACHE_DIR))
+    
     if not files_to_clean:
         logger.info("No files to clean.")
         return
@@ -106,14 +169,13 @@ def clean_outputs(dry_run: bool = False, keep_cache: bool = False):
     by_extension = {}
     total_size = 0
     
-    for file_path in files_to_clean:
+    for file_path, size in files_to_clean:
         ext = file_path.suffix.lower()
         if ext not in by_extension:
             by_extension[ext] = []
         by_extension[ext].append(file_path)
         
-        if file_path.exists():
-            total_size += file_path.stat().st_size
+        total_size += size
     
     # Print summary
     logger.info(f"Found {len(files_to_clean)} file(s) to clean:")
@@ -125,11 +187,10 @@ def clean_outputs(dry_run: bool = False, keep_cache: bool = False):
         logger.info(f"Total size: {size_mb:.2f} MB")
     
     logger.info("")
-    logger.info("Files to be deleted:")
-    for file_path in files_to_clean:
-        size = file_path.stat().st_size if file_path.exists() else 0
-        size_kb = size / 1024
-        logger.info(f"  - {file_path.name} ({size_kb:.1f} KB)")
+    # One log record for the whole listing (skipped entirely below INFO)
+    if logger.isEnabledFor(logging.INFO):
+        lines = [f"  - {file_path.name} ({size / 1024:.1f} KB)" for file_path, size in files_to_clean]
+        logger.info("Files to be deleted:\n" + "\n".join(lines))
     
     logger.info("")
     
@@ -142,16 +203,16 @@ def clean_outputs(dry_run: bool = False, keep_cache: bool = False):
     deleted_count = 0
     deleted_size = 0
     
-    for file_path in files_to_clean:
-        try:
-            if file_path.exists():
-                size = file_path.stat().st_size
-                file_path.unlink()
-                deleted_count += 1
-                deleted_size += size
-                logger.debug(f"Deleted: {file_path.name}")
-        except Exception as e:
-            logger.error(f"Failed to delete {file_path.name}: {e}")
+    with ThreadPoolExecutor(max_workers=DELETE_CONCURRENCY) as executor:
+        results = list(executor.map(_safe_unlink, files_to_clean))
+    
+    for name, size, error in results:
+        if error is not None:
+            logger.error(f"Failed to delete {name}: {error}")
+        elif size is not None:
+            deleted_count += 1
+            deleted_size += size
+            logger.debug(f"Deleted: {name}")
     
     logger.info("=" * 60)
     logger.info("CLEANUP COMPLETE")
@@ -178,7 +239,7 @@ Examples:
     parser.add_argument('--dry-run', action='store_true',
                        help='Preview what would be deleted without deleting')
     parser.add_argument('--keep-cache', action='store_true',
-                       help='Keep cache_serper.json (API cache)')
+                       help=f'Keep cache_serper.db (API cache) and {SCRAPE_CACHE_DIR}/ (scrape cache)')
     
     args = parser.parse_args()
     